@@ -0,0 +1,767 @@
+"""
+Micro-benchmarks for Claude Screenshot MCP.
+
+Usage:
+    claude-screenshot-bench                              # Offline suite on synthetic frames, JSON report
+    claude-screenshot-bench suite --output base.json --iterations 5 --format png
+    claude-screenshot-bench suite --layout 2560x1440+0+0 --layout 1920x1080+2560+360 --content text
+    python -m screenshot_mcp.bench startup               # MCP server import time vs budget (python -X importtime)
+    python -m screenshot_mcp.bench startup --runs 10 --budget-ms 800
+    python -m screenshot_mcp.bench clipboard             # Cached native clipboard backend vs a process per copy
+    python -m screenshot_mcp.bench grab                  # Per-grab latency, fresh mss vs shared grabber
+    python -m screenshot_mcp.bench grab --iterations 200 --width 800 --height 600
+    python -m screenshot_mcp.bench encode                # Encode time + size per format/preset
+    python -m screenshot_mcp.bench encode --image a.png --image b.png
+    xvfb-run python -m screenshot_mcp.bench drag         # Overlay drag handling under synthetic motion events
+    python -m screenshot_mcp.bench drag --events 2000 --rate 500
+    python -m screenshot_mcp.bench overlay-memory        # Single bounding-box window vs one window per monitor
+    python -m screenshot_mcp.bench overlay-memory --layout 2560x1440+0+0 --layout 1920x1080+2560+360
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def _summarize(samples: list) -> dict:
+    """Summarize a list of durations (seconds) as milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _print_table(title: str, rows: dict):
+    """Print one summary row per benchmark case to stderr."""
+    print(f"\n  {title}", file=sys.stderr)
+    print(f"  {'case':<24}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}", file=sys.stderr)
+    for name, s in rows.items():
+        print(
+            f"  {name:<24}{s['mean_ms']:>10.3f}{s['p50_ms']:>10.3f}"
+            f"{s['p95_ms']:>10.3f}{s['max_ms']:>10.3f}",
+            file=sys.stderr,
+        )
+    print("", file=sys.stderr)
+
+
+def bench_grab(iterations: int, width: int, height: int) -> dict:
+    """Per-grab latency: a fresh mss context per grab vs the shared ScreenGrabber."""
+    import mss
+    from .capture import get_grabber
+
+    monitor = get_grabber().monitors[1]
+    region = {
+        "left": monitor["left"],
+        "top": monitor["top"],
+        "width": min(width, monitor["width"]),
+        "height": min(height, monitor["height"]),
+    }
+
+    fresh = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        with mss.mss() as sct:
+            sct.grab(region)
+        fresh.append(time.perf_counter() - start)
+
+    grabber = get_grabber()
+    grabber.grab(region)  # Warm up the per-thread instance
+    shared = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        grabber.grab(region)
+        shared.append(time.perf_counter() - start)
+
+    return {"fresh_mss_per_grab": _summarize(fresh), "shared_grabber": _summarize(shared)}
+
+
+def bench_encode(images: list, iterations: int) -> list:
+    """Encode time and output size for every format x encoder preset.
+
+    Args:
+        images: List of (name, PIL Image) pairs to encode
+        iterations: Encodes per case (the timing is the median)
+    """
+    from .capture import encoder_options
+    from .config import ENCODER_PRESETS
+
+    rows = []
+    for name, image in images:
+        for fmt in ("png", "jpg", "webp"):
+            for preset in ENCODER_PRESETS:
+                pillow_format, kwargs = encoder_options(fmt, {"preset": preset})
+                samples = []
+                size = 0
+                for _ in range(iterations):
+                    buffer = io.BytesIO()
+                    start = time.perf_counter()
+                    image.save(buffer, pillow_format, **kwargs)
+                    samples.append(time.perf_counter() - start)
+                    size = buffer.tell()
+                rows.append({
+                    "image": name,
+                    "format": fmt,
+                    "preset": preset,
+                    "encode": _summarize(samples),
+                    "bytes": size,
+                })
+    return rows
+
+
+def bench_drag(events: int, rate_hz: int) -> dict:
+    """Selection overlay drag handling under synthetic pointer motion.
+
+    Opens a real RegionSelector over a grab of the screen (needs a display;
+    Xvfb is fine) and drives a drag with `events` generated B1-Motion events
+    at `rate_hz`, from the first monitor to the last. Measures the time spent
+    handling each motion event, the time per redraw, and dropped frames:
+    frame intervals (FRAME_MS) that passed during the drag without a redraw.
+    """
+    from .capture import RegionSelector, get_grabber
+
+    grabber = get_grabber()
+    monitors = list(grabber.monitors[1:])
+    shots = [grabber.grab(mon) for mon in monitors]
+
+    selector = RegionSelector()
+
+    handling = []
+    redraw_times = []
+    redraw_ends = []
+    redraw = selector._redraw
+
+    def timed_redraw():
+        start = time.perf_counter()
+        redraw()
+        end = time.perf_counter()
+        redraw_times.append(end - start)
+        redraw_ends.append(end)
+
+    # Motion handlers schedule self._redraw by attribute lookup, so the
+    # instance attribute replaces it for every frame
+    selector._redraw = timed_redraw
+
+    interval_ms = max(1, round(1000 / rate_hz))
+    first, last = monitors[0], monitors[-1]
+    x0 = first["left"] + first["width"] // 4
+    y0 = first["top"] + first["height"] // 4
+    span_x = last["left"] + last["width"] * 3 // 4 - x0
+    span_y = last["top"] + last["height"] * 3 // 4 - y0
+    drag = {"step": 0, "begin": 0.0, "end": 0.0}
+
+    def post(sequence, x, y):
+        # Events go to the first monitor's window, which holds the grab
+        target = selector._windows[0]
+        ox, oy = target.origin
+        target.window.event_generate(sequence, x=x - ox, y=y - oy, rootx=x, rooty=y)
+
+    def step():
+        i = drag["step"]
+        if i == 0:
+            post("<ButtonPress-1>", x0, y0)
+            drag["begin"] = time.perf_counter()
+        elif i <= events:
+            x = x0 + span_x * i // events
+            y = y0 + span_y * i // events
+            start = time.perf_counter()
+            post("<B1-Motion>", x, y)
+            handling.append(time.perf_counter() - start)
+        else:
+            drag["end"] = time.perf_counter()
+            post("<ButtonRelease-1>", x0 + span_x, y0 + span_y)
+            return
+        drag["step"] += 1
+        selector.root.after(interval_ms, step)
+
+    # Give the windows time to map before the drag starts
+    selector.root.after(200, step)
+    try:
+        selector.select(shots, monitors)
+    finally:
+        selector.close()
+
+    frame = RegionSelector.FRAME_MS / 1000
+    dropped = 0
+    previous = drag["begin"]
+    for end in redraw_ends + [drag["end"]]:
+        dropped += max(0, int((end - previous) / frame) - 1)
+        previous = end
+
+    return {
+        "motion_event": _summarize(handling),
+        "redraw": _summarize(redraw_times),
+        "events": len(handling),
+        "redraws": len(redraw_ends),
+        "frames": int((drag["end"] - drag["begin"]) / frame),
+        "dropped_frames": dropped,
+    }
+
+
+def _status_bytes(field: str) -> int:
+    """A memory field (e.g. VmRSS, VmHWM) of /proc/self/status, in bytes."""
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise OSError(f"{field} not found in /proc/self/status")
+
+
+def _reset_peak_rss():
+    """Reset the process's peak RSS and return its current RSS in bytes.
+
+    Returns None where the peak cannot be reset (anything but Linux): the
+    ru_maxrss high-water mark only ever grows, so it cannot be scoped to
+    one stage of a running process.
+    """
+    import gc
+
+    gc.collect()
+    try:
+        # "5" resets VmHWM (peak RSS) to the current RSS (Linux 4.0+)
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return _status_bytes("VmRSS")
+    except OSError:
+        return None
+
+
+def _peak_rss_since(baseline):
+    """Growth of the peak RSS over `baseline` (from _reset_peak_rss), or None."""
+    if baseline is None:
+        return None
+    try:
+        return max(0, _status_bytes("VmHWM") - baseline)
+    except OSError:
+        return None
+
+
+# Bytes per pixel held while the overlay is open: raw BGRA grab, RGB frame,
+# dimmed copy, and the two Tk photo images (stored as 32-bit pixels)
+OVERLAY_BYTES_PER_PIXEL = {"grab": 4, "frame": 3, "dimmed": 3, "tk_photos": 8}
+
+
+def _parse_layout(spec: str) -> dict:
+    """Parse a WIDTHxHEIGHT+LEFT+TOP monitor spec into an mss monitor dict."""
+    match = re.fullmatch(r"(\d+)x(\d+)([+-]\d+)([+-]\d+)", spec.strip().lower())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid monitor spec '{spec}', expected WIDTHxHEIGHT+LEFT+TOP")
+    width, height, left, top = (int(v) for v in match.groups())
+    return {"left": left, "top": top, "width": width, "height": height}
+
+
+def bench_overlay_memory(layout: list) -> dict:
+    """Overlay memory: one window over the bounding box vs one window per monitor.
+
+    Args:
+        layout: Monitor dicts to model; if empty, the real monitors are used
+            and the grabs and Tk photo preparation are also measured
+            (peak RSS growth while grabbing and with the photos built,
+            Linux only; time to build the photos)
+    """
+    measure = not layout
+    if measure:
+        from .capture import get_grabber
+        layout = list(get_grabber().monitors[1:])
+
+    left = min(m["left"] for m in layout)
+    top = min(m["top"] for m in layout)
+    right = max(m["left"] + m["width"] for m in layout)
+    bottom = max(m["top"] + m["height"] for m in layout)
+    bounding_box = {"left": left, "top": top, "width": right - left, "height": bottom - top}
+
+    per_pixel = sum(OVERLAY_BYTES_PER_PIXEL.values())
+    cases = {"single_window": [bounding_box], "per_monitor": layout}
+    rows = {}
+    for name, windows in cases.items():
+        pixels = sum(m["width"] * m["height"] for m in windows)
+        rows[name] = {
+            "windows": len(windows),
+            "pixels": pixels,
+            "bytes": pixels * per_pixel,
+            "by_stage": {stage: pixels * size for stage, size in OVERLAY_BYTES_PER_PIXEL.items()},
+        }
+
+    if measure:
+        import tkinter as tk
+        from .capture import _overlay_photos, get_grabber
+
+        grabber = get_grabber()
+        root = tk.Tk()
+        root.withdraw()
+        try:
+            for name, windows in cases.items():
+                baseline = _reset_peak_rss()
+                shots = [grabber.grab(mon) for mon in windows]
+                rows[name]["grab_peak_rss_bytes"] = _peak_rss_since(baseline)
+
+                start = time.perf_counter()
+                photos = [_overlay_photos(shot, 0.3) for shot in shots]
+                rows[name]["prepare_ms"] = round((time.perf_counter() - start) * 1000, 3)
+                # Taken while the photos are still referenced, as they are
+                # for as long as the overlay is open
+                rows[name]["overlay_peak_rss_bytes"] = _peak_rss_since(baseline)
+                del photos, shots
+        finally:
+            root.destroy()
+
+    return rows
+
+
+# Monitor layouts the suite runs by default
+SUITE_LAYOUTS = {
+    "1080p": ["1920x1080+0+0"],
+    "4k": ["3840x2160+0+0"],
+    "mixed": ["2560x1440+0+0", "1920x1080+2560+360"],
+}
+
+# Bumped whenever the report's keys or units change
+SUITE_SCHEMA = 2
+
+
+def _measure(func, iterations: int, pixels: int) -> dict:
+    """Time `iterations` calls of func and measure their peak memory.
+
+    The peak is the growth of the process's peak RSS over its RSS before
+    the stage, so it includes Pillow's pixel buffers and anything else
+    allocated natively. It is None where the peak cannot be reset (see
+    _reset_peak_rss).
+    """
+    baseline = _reset_peak_rss()
+    samples = []
+    result = None
+    for _ in range(iterations):
+        # Drop the previous result first, so only one is alive at a time
+        result = None
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    peak = _peak_rss_since(baseline)
+
+    summary = _summarize(samples)
+    return {
+        "latency": summary,
+        "pixels": pixels,
+        "mpx_per_s": round(pixels / 1e6 / max(summary["p50_ms"] / 1000, 1e-9), 2),
+        "peak_rss_bytes": peak,
+        "_result": result,
+    }
+
+
+@contextmanager
+def _scratch_config_dir(path: str):
+    """Point the config, screenshot catalog and default save dirs at `path` for the duration."""
+    from . import catalog, config
+
+    saved = (config._config_dir, catalog._local, catalog._schema_ready)
+    config._config_dir = Path(path)
+    catalog._local = threading.local()
+    catalog._schema_ready = False
+    config._invalidate_config_cache()
+    try:
+        yield
+    finally:
+        conn = getattr(catalog._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        config._config_dir, catalog._local, catalog._schema_ready = saved
+        config._invalidate_config_cache()
+
+
+def bench_suite(layouts: dict, contents: list, formats: list, iterations: int, preset: str) -> dict:
+    """Offline grab/crop/encode/save benchmark on synthetic frames.
+
+    Installs a SyntheticBackend for each layout x content and runs the real
+    capture stages against it, so results are comparable across machines
+    and runs without a display or any particular screen content.
+
+    Stages per layout and content:
+        grab          Full virtual screen from the backend
+        convert       BGRA -> RGB of the full frame
+        crop          BGRA -> RGB of the central quarter of the primary monitor
+        encode.<fmt>  In-memory encode of the full frame with `preset`
+        save.<fmt>    save_screenshot() of the full frame
+
+    Everything runs against a throwaway config directory (config, catalog
+    and saved files), so the user's own config and catalog are not touched.
+
+    Args:
+        layouts: {name: [monitor dict, ...]}
+        contents: Synthetic content kinds (see synthetic.CONTENT_KINDS)
+        formats: Image formats to encode and save
+        iterations: Timed runs per stage
+        preset: Encoder preset for encode and save
+
+    Returns:
+        The report: {"schema", "created", "environment", "settings", "results"}
+        where results maps "layout/content/stage" to that stage's latency
+        summary, pixels, mpx_per_s and peak_rss_bytes (plus bytes for encode).
+    """
+    import tempfile
+
+    import PIL
+    from .capture import _shot_to_image, encoder_options, save_screenshot, set_backend
+    from .synthetic import SyntheticBackend
+
+    results = {}
+    scratch = tempfile.TemporaryDirectory(prefix="screenshot-bench-")
+    save_dir = os.path.join(scratch.name, "screenshots")
+    original = set_backend(None)
+    try:
+        with _scratch_config_dir(scratch.name):
+            for layout_name, layout in layouts.items():
+                for content in contents:
+                    backend = SyntheticBackend(layout, content=content)
+                    set_backend(backend)
+                    virtual, primary = backend.monitors[0], backend.monitors[1]
+                    pixels = virtual["width"] * virtual["height"]
+                    prefix = f"{layout_name}/{content}"
+
+                    def stage(name, func, stage_pixels=pixels):
+                        row = _measure(func, iterations, stage_pixels)
+                        results[f"{prefix}/{name}"] = row
+                        return row.pop("_result")
+
+                    shot = stage("grab", lambda: backend.grab(virtual))
+                    image = stage("convert", lambda: _shot_to_image(shot))
+
+                    x = primary["left"] - virtual["left"] + primary["width"] // 4
+                    y = primary["top"] - virtual["top"] + primary["height"] // 4
+                    box = (x, y, x + primary["width"] // 2, y + primary["height"] // 2)
+                    stage("crop", lambda: _shot_to_image(shot, box), (box[2] - box[0]) * (box[3] - box[1]))
+
+                    for fmt in formats:
+                        pillow_format, kwargs = encoder_options(fmt, {"preset": preset})
+
+                        def encode():
+                            buffer = io.BytesIO()
+                            image.save(buffer, pillow_format, **kwargs)
+                            return buffer.tell()
+
+                        size = stage(f"encode.{fmt}", encode)
+                        results[f"{prefix}/encode.{fmt}"]["bytes"] = size
+
+                        def save():
+                            path = save_screenshot(image, save_dir=save_dir, fmt=fmt, encoder={"preset": preset})
+                            os.remove(path)
+
+                        stage(f"save.{fmt}", save)
+                    backend.close()
+    finally:
+        set_backend(original)
+        scratch.cleanup()
+
+    return {
+        "schema": SUITE_SCHEMA,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "pillow": PIL.__version__,
+        },
+        "settings": {
+            "layouts": layouts,
+            "contents": list(contents),
+            "formats": list(formats),
+            "iterations": iterations,
+            "preset": preset,
+        },
+        "results": results,
+    }
+
+
+# Import budget for the MCP server module (median over runs, milliseconds)
+STARTUP_BUDGET_MS = 1500
+
+# Packages the MCP server must not import before its first capture
+STARTUP_DEFERRED = ("mss", "PIL", "tkinter", "pynput")
+
+
+def _parse_importtime(output: str) -> list:
+    """Parse `python -X importtime` stderr into (module, depth, self_us, cumulative_us) rows."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        # One space after the bar, then two more per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def bench_startup(module: str, runs: int) -> dict:
+    """Import time of a module in fresh interpreters (python -X importtime).
+
+    Every run is a new process, so no module is cached in sys.modules.
+    Interpreter startup outside of imports is not counted.
+
+    Returns:
+        {"import": summary of the total import time per run,
+         "top": [(module, cumulative_ms)] of the slowest top-level imports
+         (last run), "deferred_loaded": STARTUP_DEFERRED packages that were
+         imported anyway}
+    """
+    env = os.environ.copy()
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    totals = []
+    rows = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, env=env,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{proc.stderr.strip()[-2000:]}")
+        rows = _parse_importtime(proc.stderr)
+        totals.append(sum(self_us for _, _, self_us, _ in rows) / 1e6)
+
+    top = sorted((r for r in rows if r[1] == 0), key=lambda r: r[3], reverse=True)[:10]
+    loaded = {name for name, _, _, _ in rows}
+    return {
+        "import": _summarize(totals),
+        "top": [(name, round(cumulative / 1000, 1)) for name, _, _, cumulative in top],
+        "deferred_loaded": [
+            pkg for pkg in STARTUP_DEFERRED
+            if any(name == pkg or name.startswith(pkg + ".") for name in loaded)
+        ],
+    }
+
+
+def _spawn_per_copy(text: str) -> bool:
+    """The previous copy_to_clipboard(): a new process per copy, probing xclip then xsel on Linux."""
+    try:
+        if sys.platform == "win32":
+            process = subprocess.Popen(["clip"], stdin=subprocess.PIPE, shell=True)
+            process.communicate(text.encode("utf-16le"))
+            return process.returncode == 0
+        elif sys.platform == "darwin":
+            process = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
+            process.communicate(text.encode("utf-8"))
+            return process.returncode == 0
+        else:
+            for cmd in [["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]]:
+                try:
+                    process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                    process.communicate(text.encode("utf-8"))
+                    if process.returncode == 0:
+                        return True
+                except FileNotFoundError:
+                    continue
+        return False
+    except Exception:
+        return False
+
+
+def bench_clipboard(iterations: int) -> dict:
+    """Copy latency: the cached clipboard backend vs spawning a process per copy.
+
+    Overwrites the clipboard. The first copy through the cached backend is
+    reported separately: it includes starting the X11 helper, if used.
+    """
+    import tempfile
+    from . import clipboard
+
+    text = os.path.join(tempfile.gettempdir(), "claude_screenshot_20250101_120000_000.png")
+
+    start = time.perf_counter()
+    name = clipboard.backend_name()
+    detect = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first_ok = clipboard.copy(text)
+    first = time.perf_counter() - start
+
+    rows = {"detect": _summarize([detect]), "first_copy": _summarize([first])}
+    failures = {"cached_backend": 0 if first_ok else 1, "spawn_per_copy": 0}
+    for case, copy in (("cached_backend", clipboard.copy), ("spawn_per_copy", _spawn_per_copy)):
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            if not copy(f"{text}.{i}"):
+                failures[case] += 1
+            samples.append(time.perf_counter() - start)
+        rows[case] = _summarize(samples)
+    return {"backend": name, "rows": rows, "failures": failures}
+
+
+def _load_bench_images(paths: list) -> list:
+    """Load images given on the command line, or grab the primary monitor."""
+    from PIL import Image
+
+    if paths:
+        return [(path, Image.open(path).convert("RGB")) for path in paths]
+
+    from .capture import capture_region, get_grabber
+    monitor = get_grabber().monitors[1]
+    return [("monitor-1", capture_region(monitor["left"], monitor["top"], monitor["width"], monitor["height"]))]
+
+
+def main():
+    """CLI entry point for the benchmarks."""
+    from .config import ENCODER_PRESETS
+
+    parser = argparse.ArgumentParser(description="Claude Screenshot micro-benchmarks")
+    sub = parser.add_subparsers(dest="bench")
+
+    suite = sub.add_parser("suite", help="Offline grab/crop/encode/save suite on synthetic frames (default)")
+    suite.add_argument(
+        "--layout", action="append", default=[], type=_parse_layout, metavar="WxH+X+Y",
+        help="Monitor of a custom layout (repeatable; default: the 1080p, 4k and mixed layouts)",
+    )
+    suite.add_argument(
+        "--content", action="append", default=[], choices=["text", "photo", "ui"],
+        help="Synthetic content kind (repeatable; default: all)",
+    )
+    suite.add_argument(
+        "--format", action="append", default=[], choices=["png", "jpg", "webp"],
+        help="Image format (repeatable; default: all)",
+    )
+    suite.add_argument("--iterations", type=int, default=3)
+    suite.add_argument("--preset", default="balanced", choices=list(ENCODER_PRESETS))
+    suite.add_argument("--output", default="screenshot-bench.json", help="Where to write the JSON report")
+
+    startup = sub.add_parser("startup", help="MCP server import time and deferred imaging imports")
+    startup.add_argument("--module", default="screenshot_mcp.server", help="Module to import")
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument(
+        "--budget-ms", type=float, default=STARTUP_BUDGET_MS,
+        help=f"Fail (exit status 1) if the median import time exceeds this (default: {STARTUP_BUDGET_MS})",
+    )
+
+    clip = sub.add_parser("clipboard", help="Copy latency, cached clipboard backend vs a process per copy (overwrites the clipboard)")
+    clip.add_argument("--iterations", type=int, default=50)
+
+    grab = sub.add_parser("grab", help="Per-grab latency, fresh mss context vs shared grabber")
+    grab.add_argument("--iterations", type=int, default=100)
+    grab.add_argument("--width", type=int, default=1280)
+    grab.add_argument("--height", type=int, default=720)
+
+    encode = sub.add_parser("encode", help="Encode time and file size per format and encoder preset")
+    encode.add_argument("--image", action="append", default=[], help="Image to encode (default: grab the primary monitor)")
+    encode.add_argument("--iterations", type=int, default=5)
+
+    drag = sub.add_parser("drag", help="Overlay drag handling time and dropped frames (needs a display, e.g. Xvfb)")
+    drag.add_argument("--events", type=int, default=1000, help="Synthetic motion events per drag")
+    drag.add_argument("--rate", type=int, default=250, help="Motion events per second")
+
+    memory = sub.add_parser("overlay-memory", help="Overlay memory, single bounding-box window vs one window per monitor")
+    memory.add_argument(
+        "--layout", action="append", default=[], type=_parse_layout, metavar="WxH+X+Y",
+        help="Monitor to model (repeatable; default: measure the real monitors)",
+    )
+
+    args = parser.parse_args()
+    if args.bench is None:
+        args = parser.parse_args(["suite"])
+
+    if args.bench == "suite":
+        if args.layout:
+            layouts = {"custom": args.layout}
+        else:
+            layouts = {name: [_parse_layout(spec) for spec in specs] for name, specs in SUITE_LAYOUTS.items()}
+        report = bench_suite(
+            layouts,
+            args.content or ["text", "photo", "ui"],
+            args.format or ["png", "jpg", "webp"],
+            args.iterations,
+            args.preset,
+        )
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\n  {'case':<32}{'p50 ms':>10}{'p95 ms':>10}{'Mpx/s':>10}{'peak MiB':>10}{'KiB':>10}", file=sys.stderr)
+        for name, row in report["results"].items():
+            size = row.get("bytes")
+            peak = row["peak_rss_bytes"]
+            print(
+                f"  {name:<32}{row['latency']['p50_ms']:>10.2f}{row['latency']['p95_ms']:>10.2f}"
+                f"{row['mpx_per_s']:>10.1f}{'-' if peak is None else f'{peak / 2**20:.1f}':>10}"
+                f"{'-' if size is None else f'{size / 1024:.1f}':>10}",
+                file=sys.stderr,
+            )
+        print(f"\n  Report written to {os.path.abspath(args.output)}\n", file=sys.stderr)
+    elif args.bench == "startup":
+        result = bench_startup(args.module, args.runs)
+        _print_table(f"Import {args.module} ({args.runs} fresh interpreters)", {"import": result["import"]})
+        print(f"  {'slowest top-level imports':<40}{'ms':>10}", file=sys.stderr)
+        for name, ms in result["top"]:
+            print(f"  {name:<40}{ms:>10.1f}", file=sys.stderr)
+        failures = []
+        if result["import"]["p50_ms"] > args.budget_ms:
+            failures.append(f"median import time {result['import']['p50_ms']:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        if result["deferred_loaded"]:
+            failures.append(f"imported at startup: {', '.join(result['deferred_loaded'])}")
+        for failure in failures:
+            print(f"\n  FAIL: {failure}", file=sys.stderr)
+        print("" if failures else "\n  OK: within budget, no imaging imports\n", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+    elif args.bench == "clipboard":
+        result = bench_clipboard(args.iterations)
+        _print_table(f"Clipboard copy, backend: {result['backend']} ({args.iterations} copies)", result["rows"])
+        print(
+            f"  Failed copies: {result['failures']['cached_backend']} cached, "
+            f"{result['failures']['spawn_per_copy']} spawn-per-copy\n",
+            file=sys.stderr,
+        )
+    elif args.bench == "grab":
+        rows = bench_grab(args.iterations, args.width, args.height)
+        _print_table(f"Grab latency ({args.width}x{args.height}, {args.iterations} iterations)", rows)
+    elif args.bench == "encode":
+        rows = bench_encode(_load_bench_images(args.image), args.iterations)
+        print(f"\n  {'image':<20}{'format':<8}{'preset':<10}{'p50 ms':>10}{'KiB':>10}", file=sys.stderr)
+        for row in rows:
+            print(
+                f"  {row['image'][:19]:<20}{row['format']:<8}{row['preset']:<10}"
+                f"{row['encode']['p50_ms']:>10.1f}{row['bytes'] / 1024:>10.1f}",
+                file=sys.stderr,
+            )
+        print("", file=sys.stderr)
+    elif args.bench == "drag":
+        result = bench_drag(args.events, args.rate)
+        _print_table(
+            f"Overlay drag ({args.events} motion events at {args.rate}/s)",
+            {"motion_event": result["motion_event"], "redraw": result["redraw"]},
+        )
+        print(
+            f"  {result['redraws']} redraws for {result['events']} events over "
+            f"{result['frames']} frames, {result['dropped_frames']} dropped\n",
+            file=sys.stderr,
+        )
+    elif args.bench == "overlay-memory":
+        rows = bench_overlay_memory(args.layout)
+        print(f"\n  {'case':<16}{'windows':>9}{'Mpx':>9}{'MiB':>10}{'grab MiB':>10}{'open MiB':>10}{'prep ms':>10}", file=sys.stderr)
+        for name, row in rows.items():
+            grab = row.get("grab_peak_rss_bytes")
+            opened = row.get("overlay_peak_rss_bytes")
+            prepare = row.get("prepare_ms")
+            print(
+                f"  {name:<16}{row['windows']:>9}{row['pixels'] / 1e6:>9.2f}{row['bytes'] / 2**20:>10.1f}"
+                f"{'-' if grab is None else f'{grab / 2**20:.1f}':>10}"
+                f"{'-' if opened is None else f'{opened / 2**20:.1f}':>10}"
+                f"{'-' if prepare is None else f'{prepare:.1f}':>10}",
+                file=sys.stderr,
+            )
+        print("", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,87 @@
 """
 Screen capture module with region selection overlay.
 
-Provides a transparent overlay spanning ALL monitors where the user can click
-and drag to select a rectangular region. The selected region is then captured
-as a screenshot and saved to disk.
+Provides a region selection overlay (one window per monitor, showing a frozen
+frame of the screen) where the user can click and drag to select a
+rectangular region. The selected region is then cropped from the frozen frame
+and saved to disk.
 """
 
+import atexit
 import datetime
+import hashlib
+import io
 import os
 import sys
-import subprocess
 import tempfile
+import threading
 from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
+
+from . import clipboard
+from .catalog import record_screenshot
+from .config import RESAMPLE_FILTERS, resolve_encoder
+from .stats import span
 
 
 # Result returned by select_region_and_capture
 # path: str - file path of saved screenshot (or None if cancelled)
 # region: dict - {"x": int, "y": int, "width": int, "height": int} (or None)
-CaptureResult = namedtuple("CaptureResult", ["path", "region"])
-
-# We use mss for fast multi-monitor screen capture
-# and Pillow for image processing/cropping
-try:
-    import mss
-    import mss.tools
-except ImportError:
-    mss = None
-
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
+# saved: Future - resolves to path once the file is fully written (or None)
+# scale: float - factor the saved image was downscaled by (1.0 = full size)
+# original_size: dict - {"width": int, "height": int} before downscaling
+CaptureResult = namedtuple(
+    "CaptureResult",
+    ["path", "region", "saved", "scale", "original_size"],
+    defaults=(None, None, None),
+)
+
+# Result returned by recapture_region
+# path: str - file path of the screenshot (the previous file if unchanged)
+# unchanged: bool - True if the pixels matched the previous capture (nothing written)
+# digest: str - content hash of the captured pixels
+# saved: Future - resolves to path once the file is fully written
+# tiles: list - per-tile content hashes (see tile_digests)
+# changed_region: dict - screen-absolute bounding box of changed tiles (or None)
+# changed_path: str - file with just the changed area, if requested (or None)
+# scale: float - factor the saved image was downscaled by (1.0 = full size)
+# original_size: dict - {"width": int, "height": int} before downscaling
+# settings: dict - capture_settings() the file at path was saved with
+RecaptureResult = namedtuple(
+    "RecaptureResult",
+    ["path", "unchanged", "digest", "saved", "tiles", "changed_region", "changed_path",
+     "scale", "original_size", "settings"],
+    defaults=(None, None, None, 1.0, None, None),
+)
+
+# Result returned by encode_screenshot
+# data: bytes - the encoded image file contents
+# fmt: str - image format (png, jpg, webp)
+# width / height: int - size of the encoded image (after downscaling)
+# scale: float - factor the image was downscaled by (1.0 = full size)
+EncodedScreenshot = namedtuple("EncodedScreenshot", ["data", "fmt", "width", "height", "scale"])
+
+# Edge length (pixels) of the tiles used for change detection between captures
+TILE_SIZE = 64
+
+# Result returned by RegionWatcher.sample
+# changed: bool - True if the change ratio exceeded the threshold (or first sample)
+# change_ratio: float - fraction of thumbnail pixels that changed (1.0 for the first sample)
+# image: PIL Image - full-resolution RGB image of the sample
+WatchSample = namedtuple("WatchSample", ["changed", "change_ratio", "image"])
+
+# We use mss for fast multi-monitor screen capture and Pillow for image
+# processing/cropping. Both are imported on first use (_load_imaging), so
+# importing this module -- and starting the MCP server, whose config and
+# catalog tools never touch an image -- stays cheap.
+mss = None
+Image = None
+ImageChops = None
+
+_imaging_loaded = False
+_imaging_lock = threading.Lock()
 
 
 def _enable_dpi_awareness():
@@ -56,14 +105,37 @@ def _enable_dpi_awareness():
             pass
 
 
-# Call at module level, before any tkinter or mss usage
-_enable_dpi_awareness()
+def _load_imaging() -> None:
+    """Import mss and Pillow and enable DPI awareness, once per process.
+
+    Called by every path that grabs, converts or shows pixels, always
+    before the first tkinter or mss use. Missing packages leave their
+    names as None; _ensure_dependencies() reports them.
+    """
+    global mss, Image, ImageChops, _imaging_loaded
+    if _imaging_loaded:
+        return
+    with _imaging_lock:
+        if _imaging_loaded:
+            return
+        _enable_dpi_awareness()
+        try:
+            import mss
+            import mss.tools
+        except ImportError:
+            pass
+        try:
+            from PIL import Image, ImageChops
+        except ImportError:
+            pass
+        _imaging_loaded = True
 
 
 def _ensure_dependencies():
     """Check that required dependencies are available."""
+    _load_imaging()
     missing = []
-    if mss is None:
+    if mss is None and get_grabber().needs_mss:
         missing.append("mss")
     if Image is None:
         missing.append("Pillow")
@@ -74,14 +146,235 @@ def _ensure_dependencies():
         )
 
 
+class RawFrame(namedtuple("RawFrame", ["raw", "width", "height"])):
+    """A grabbed frame shaped like an mss ScreenShot.
+
+    raw is the BGRA pixel buffer with rows packed at width * 4 bytes.
+    """
+
+    __slots__ = ()
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+
+class CaptureBackend:
+    """Source of raw screen frames for every capture path.
+
+    grab() returns an mss ScreenShot or anything with the same shape (see
+    RawFrame): .raw (BGRA), .width, .height and .size. Subclasses provide
+    monitors and _grab(); ScreenGrabber (mss) is the default backend, and
+    synthetic.SyntheticBackend generates deterministic frames without a
+    display. Select one process-wide with set_backend().
+    """
+
+    # Whether this backend needs the mss package
+    needs_mss = False
+
+    @property
+    def monitors(self) -> list:
+        """Monitor geometry: index 0 is the virtual screen, 1+ are monitors."""
+        raise NotImplementedError
+
+    def grab(self, monitor: dict):
+        """Grab a monitor dict / region ({left, top, width, height}).
+
+        Returns the raw frame (BGRA buffer, not yet converted).
+        """
+        with span("grab"):
+            return self._grab(monitor)
+
+    def _grab(self, monitor: dict):
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class ScreenGrabber(CaptureBackend):
+    """Long-lived, thread-aware screen grabber shared by all capture paths.
+
+    Creating an ``mss.mss()`` context is far more expensive than a single
+    grab (it opens a display connection / device context and enumerates
+    monitors), so we keep one instance alive and reuse it. mss handles are
+    not safe to share across threads, so each thread lazily gets its own.
+    """
+
+    needs_mss = True
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._instances = []
+        # Bumped by close() so threads drop handles that were closed under them
+        self._generation = 0
+
+    def _sct(self):
+        """Return this thread's mss instance, creating it on first use."""
+        sct = getattr(self._local, "sct", None)
+        if sct is None or self._local.generation != self._generation:
+            _ensure_dependencies()
+            sct = mss.mss()
+            with self._lock:
+                self._instances.append(sct)
+                self._local.generation = self._generation
+            self._local.sct = sct
+        return sct
+
+    @property
+    def monitors(self) -> list:
+        """Monitor geometry: index 0 is the virtual screen, 1+ are monitors."""
+        return self._sct().monitors
+
+    def _grab(self, monitor: dict):
+        return self._sct().grab(monitor)
+
+    def close(self) -> None:
+        """Close every mss instance created by this grabber."""
+        with self._lock:
+            instances, self._instances = self._instances, []
+            self._generation += 1
+        for sct in instances:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+
+_grabber: Optional[CaptureBackend] = None
+_grabber_lock = threading.Lock()
+
+
+def get_grabber() -> CaptureBackend:
+    """Get the process-wide capture backend (mss unless set_backend() was called)."""
+    global _grabber
+    if _grabber is None:
+        with _grabber_lock:
+            if _grabber is None:
+                _load_imaging()
+                _grabber = ScreenGrabber()
+                atexit.register(_grabber.close)
+    return _grabber
+
+
+def set_backend(backend: Optional[CaptureBackend]) -> Optional[CaptureBackend]:
+    """Replace the process-wide capture backend.
+
+    Args:
+        backend: Backend for all subsequent captures, or None to go back to
+            the default mss grabber on next use
+
+    Returns:
+        The previous backend (not closed), so callers can restore it
+    """
+    global _grabber
+    _load_imaging()
+    with _grabber_lock:
+        previous, _grabber = _grabber, backend
+    return previous
+
+
+def _shot_to_image(screenshot, box: Optional[Tuple[int, int, int, int]] = None) -> "Image.Image":
+    """Convert a raw mss ScreenShot (BGRA) to an RGB PIL Image.
+
+    Args:
+        screenshot: mss ScreenShot to convert
+        box: Optional (left, top, right, bottom) in screenshot pixel
+            coordinates. Only that rectangle is converted, decoding rows
+            straight out of the BGRA buffer (stride-aware, no intermediate
+            full-size image).
+
+    Returns:
+        RGB PIL Image of the screenshot or of the requested box
+    """
+    width, height = screenshot.size
+    if box is None:
+        left, top, right, bottom = 0, 0, width, height
+    else:
+        left, top = max(0, box[0]), max(0, box[1])
+        right, bottom = min(width, box[2]), min(height, box[3])
+
+    stride = width * 4
+    with span("convert" if box is None else "crop"):
+        # Read from .raw (the grab's own bytearray) rather than .bgra, which is a copy
+        buffer = memoryview(screenshot.raw)[top * stride + left * 4:]
+        return Image.frombuffer("RGB", (right - left, bottom - top), buffer, "raw", "BGRX", stride, 1)
+
+
+def tile_digests(screenshot, tile_size: int = TILE_SIZE) -> list:
+    """Hash every tile_size x tile_size tile of a raw mss ScreenShot.
+
+    The BGRA buffer is wrapped in a 4-byte image without a copy, and each
+    tile is cut out of it in C and hashed with a single call, rather than
+    fed to its hasher one pixel row at a time.
+
+    Returns:
+        Row-major list of hex digests, one per tile (edge tiles may be smaller)
+    """
+    _load_imaging()
+    width, height = screenshot.size
+    # Channel order is irrelevant to hashing; "RGBA" just means 4 bytes per pixel
+    frame = Image.frombuffer("RGBA", (width, height), screenshot.raw, "raw", "RGBA", 0, 1)
+
+    digests = []
+    for top in range(0, height, tile_size):
+        bottom = min(top + tile_size, height)
+        for left in range(0, width, tile_size):
+            tile = frame.crop((left, top, min(left + tile_size, width), bottom))
+            digests.append(hashlib.blake2b(tile.tobytes(), digest_size=8).hexdigest())
+    return digests
+
+
+def frame_digest(screenshot) -> str:
+    """Fast content hash of a raw mss ScreenShot, computed before any encoding.
+
+    One hash over the whole buffer; tile digests are only needed once this
+    shows the frame has changed.
+    """
+    digest = hashlib.blake2b(f"{screenshot.width}x{screenshot.height}".encode(), digest_size=16)
+    digest.update(screenshot.raw)
+    return digest.hexdigest()
+
+
+def changed_tiles_bbox(
+    previous_tiles: Optional[list],
+    tiles: list,
+    width: int,
+    height: int,
+    tile_size: int = TILE_SIZE,
+) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box of the tiles that differ between two captures.
+
+    Returns:
+        (left, top, right, bottom) relative to the frame, the whole frame if
+        there is nothing comparable, or None if no tile changed
+    """
+    if not previous_tiles or len(previous_tiles) != len(tiles):
+        return (0, 0, width, height)
+
+    columns = (width + tile_size - 1) // tile_size
+    changed = [i for i, (a, b) in enumerate(zip(previous_tiles, tiles)) if a != b]
+    if not changed:
+        return None
+
+    rows = [i // columns for i in changed]
+    cols = [i % columns for i in changed]
+    return (
+        min(cols) * tile_size,
+        min(rows) * tile_size,
+        min(width, (max(cols) + 1) * tile_size),
+        min(height, (max(rows) + 1) * tile_size),
+    )
+
+
 def capture_full_screen() -> "Image.Image":
     """Capture the entire virtual screen (all monitors)."""
     _ensure_dependencies()
-    with mss.mss() as sct:
-        # Grab the full virtual screen (all monitors combined)
-        monitor = sct.monitors[0]  # 0 = entire virtual screen
-        screenshot = sct.grab(monitor)
-        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+    grabber = get_grabber()
+    # Grab the full virtual screen (all monitors combined)
+    monitor = grabber.monitors[0]  # 0 = entire virtual screen
+    return _shot_to_image(grabber.grab(monitor))
 
 
 def capture_region(x: int, y: int, width: int, height: int) -> "Image.Image":
@@ -97,10 +390,204 @@ def capture_region(x: int, y: int, width: int, height: int) -> "Image.Image":
         PIL Image of the captured region
     """
     _ensure_dependencies()
-    with mss.mss() as sct:
-        region = {"left": x, "top": y, "width": width, "height": height}
-        screenshot = sct.grab(region)
-        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+    region = {"left": x, "top": y, "width": width, "height": height}
+    return _shot_to_image(get_grabber().grab(region))
+
+
+def budget_scale(width: int, height: int, downscale: Optional[dict] = None) -> float:
+    """Scale factor that fits a width x height image into a downscale budget.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        downscale: The 'downscale' config section (max_dimension,
+            max_megapixels; 0 or None means no limit)
+
+    Returns:
+        Factor in (0, 1]; 1.0 means the image already fits
+    """
+    downscale = downscale or {}
+    scale = 1.0
+    max_dimension = downscale.get("max_dimension") or 0
+    max_megapixels = downscale.get("max_megapixels") or 0
+    if max_dimension > 0:
+        scale = min(scale, max_dimension / max(width, height))
+    if max_megapixels > 0:
+        scale = min(scale, (max_megapixels * 1_000_000 / (width * height)) ** 0.5)
+    return scale
+
+
+def fit_to_budget(image: "Image.Image", downscale: Optional[dict] = None) -> Tuple["Image.Image", float]:
+    """Resample an image down to fit a downscale budget.
+
+    Args:
+        image: PIL Image to fit
+        downscale: The 'downscale' config section (see budget_scale);
+            'resample' picks the Pillow filter (default bilinear)
+
+    Returns:
+        (image, scale): the resampled image (or the original if it fits)
+        and the factor applied
+    """
+    scale = budget_scale(image.width, image.height, downscale)
+    if scale >= 1.0:
+        return image, 1.0
+    _load_imaging()
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    name = str((downscale or {}).get("resample") or "bilinear")
+    try:
+        resample = Image.Resampling[name.upper()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resample filter: {name}. Valid filters: {list(RESAMPLE_FILTERS)}"
+        ) from None
+    # reducing_gap lets Pillow shrink by an integer factor first, which is much faster
+    return image.resize(size, resample=resample, reducing_gap=2.0), scale
+
+
+# Config format names that differ from Pillow's format names
+_PILLOW_FORMATS = {"jpg": "JPEG", "jpeg": "JPEG", "tif": "TIFF"}
+
+
+def encoder_options(fmt: str, encoder: Optional[dict] = None) -> Tuple[str, dict]:
+    """Map an image format and encoder config section to Pillow save() arguments.
+
+    Args:
+        fmt: Image format (png, jpg, webp, ...)
+        encoder: The 'encoder' config section (preset plus overrides)
+
+    Returns:
+        (pillow_format, save_kwargs)
+    """
+    pillow_format = _PILLOW_FORMATS.get(fmt.lower(), fmt.upper())
+    options = resolve_encoder(encoder)
+    if pillow_format == "PNG":
+        kwargs = {"compress_level": options["compress_level"], "optimize": options["optimize"]}
+    elif pillow_format == "JPEG":
+        kwargs = {"quality": options["quality"], "optimize": options["optimize"]}
+    elif pillow_format == "WEBP":
+        kwargs = {"quality": options["quality"], "method": options["method"], "lossless": options["lossless"]}
+    else:
+        kwargs = {}
+    return pillow_format, kwargs
+
+
+# Encoding and writing run here so callers can hand out the final path
+# (clipboard, notification) while large captures are still being encoded.
+_encode_executor = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="screenshot-encode",
+)
+
+# Paths handed out by reserve_screenshot_path() that are not on disk yet
+_reserved_paths = set()
+_reserve_lock = threading.Lock()
+
+
+def reserve_screenshot_path(
+    save_dir: Optional[str] = None,
+    filename: Optional[str] = None,
+    fmt: str = "png",
+) -> str:
+    """Reserve the final path for a screenshot that is about to be written.
+
+    Timestamp-based names get a numeric suffix if they collide with a file
+    on disk or with another reservation still being encoded.
+
+    Returns:
+        Absolute path the screenshot will be written to
+    """
+    if save_dir is None:
+        save_dir = tempfile.gettempdir()
+
+    Path(save_dir).mkdir(parents=True, exist_ok=True)
+
+    with _reserve_lock:
+        if filename is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+            stem = f"claude_screenshot_{timestamp}"
+            filepath = os.path.abspath(os.path.join(save_dir, f"{stem}.{fmt}"))
+            suffix = 1
+            while filepath in _reserved_paths or os.path.exists(filepath):
+                filepath = os.path.abspath(os.path.join(save_dir, f"{stem}_{suffix}.{fmt}"))
+                suffix += 1
+        else:
+            filepath = os.path.abspath(os.path.join(save_dir, filename))
+        _reserved_paths.add(filepath)
+    return filepath
+
+
+def encode_screenshot(
+    image: "Image.Image",
+    fmt: str = "png",
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
+) -> EncodedScreenshot:
+    """Downscale and encode a screenshot in memory.
+
+    Args:
+        image: PIL Image to encode
+        fmt: Image format (png, jpg, webp)
+        encoder: The 'encoder' config section (default: 'balanced' preset)
+        downscale: The 'downscale' config section (default: full size)
+
+    Returns:
+        EncodedScreenshot with the encoded bytes and the encoded size
+    """
+    with span("downscale"):
+        image, scale = fit_to_budget(image, downscale)
+    pillow_format, save_kwargs = encoder_options(fmt, encoder)
+    with span("encode"):
+        buffer = io.BytesIO()
+        image.save(buffer, pillow_format, **save_kwargs)
+    return EncodedScreenshot(buffer.getvalue(), fmt, image.width, image.height, scale)
+
+
+def _release_path(filepath: str) -> None:
+    with _reserve_lock:
+        _reserved_paths.discard(filepath)
+
+
+def _write_screenshot(
+    image: "Image.Image",
+    filepath: str,
+    fmt: str,
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
+) -> str:
+    """Downscale and encode in memory, then write atomically (see _write_encoded)."""
+    try:
+        encoded = encode_screenshot(image, fmt, encoder, downscale)
+    except BaseException:
+        _release_path(filepath)
+        raise
+    return _write_encoded(encoded, filepath)
+
+
+def _write_encoded(encoded: EncodedScreenshot, filepath: str) -> str:
+    """Write encoded bytes to a temporary file next to filepath, then atomically rename.
+
+    Readers never observe a partially written file at the final path.
+    """
+    directory, name = os.path.split(filepath)
+    # Hidden, non-image extension so directory scans never pick it up
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    try:
+        with span("write"):
+            with open(tmp_path, "wb") as f:
+                f.write(encoded.data)
+            os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        _release_path(filepath)
+
+    record_screenshot(filepath, width=encoded.width, height=encoded.height, fmt=encoded.fmt)
+    return filepath
 
 
 def save_screenshot(
@@ -108,6 +595,8 @@ def save_screenshot(
     save_dir: Optional[str] = None,
     filename: Optional[str] = None,
     fmt: str = "png",
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
 ) -> str:
     """Save a screenshot image to disk.
 
@@ -116,104 +605,124 @@ def save_screenshot(
         save_dir: Directory to save to (default: temp dir)
         filename: Custom filename (default: timestamp-based)
         fmt: Image format (png, jpg, webp)
+        encoder: The 'encoder' config section (default: 'balanced' preset)
+        downscale: The 'downscale' config section (default: full size)
 
     Returns:
         Absolute path to the saved file
     """
-    if save_dir is None:
-        save_dir = tempfile.gettempdir()
+    filepath = reserve_screenshot_path(save_dir=save_dir, filename=filename, fmt=fmt)
+    return _write_screenshot(image, filepath, fmt, encoder, downscale)
 
-    Path(save_dir).mkdir(parents=True, exist_ok=True)
 
-    if filename is None:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-        filename = f"claude_screenshot_{timestamp}.{fmt}"
+def save_screenshot_async(
+    image: "Image.Image",
+    save_dir: Optional[str] = None,
+    filename: Optional[str] = None,
+    fmt: str = "png",
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
+) -> Tuple[str, Future]:
+    """Reserve the final path now and encode/write the image in the background.
+
+    Same arguments as save_screenshot().
 
-    filepath = os.path.join(save_dir, filename)
-    image.save(filepath, fmt.upper())
-    return os.path.abspath(filepath)
+    Returns:
+        (path, future): the absolute path the file will appear at, and a
+        Future that resolves to that path once the file is fully written
+        (or raises if encoding/writing failed).
+    """
+    filepath = reserve_screenshot_path(save_dir=save_dir, filename=filename, fmt=fmt)
+    return filepath, _encode_executor.submit(_write_screenshot, image, filepath, fmt, encoder, downscale)
 
 
-def select_region_and_capture(
+def save_encoded_async(
+    encoded: EncodedScreenshot,
     save_dir: Optional[str] = None,
-    fmt: str = "png",
-    overlay_color: str = "#00aaff",
-    overlay_opacity: float = 0.3,
-    capture_hotkey: Optional[str] = None,
-    recapture_hotkey: Optional[str] = None,
-) -> CaptureResult:
-    """Launch interactive region selector overlay, capture the selected area.
+    filename: Optional[str] = None,
+) -> Tuple[str, Future]:
+    """Reserve the final path now and write already-encoded bytes in the background.
 
-    Opens a transparent overlay spanning all monitors. User clicks and drags
-    to select a region. On release, that region is captured and saved.
+    Used when the encoded image is handed to the caller first (e.g. inline
+    MCP image content) and the file only needs to appear afterwards.
 
-    Press Escape or right-click to cancel.
+    Returns:
+        (path, future): as save_screenshot_async()
+    """
+    filepath = reserve_screenshot_path(save_dir=save_dir, filename=filename, fmt=encoded.fmt)
+    return filepath, _encode_executor.submit(_write_encoded, encoded, filepath)
 
-    Args:
-        save_dir: Where to save the screenshot
-        fmt: Image format
-        overlay_color: Color of the selection rectangle
-        overlay_opacity: Opacity of the dimmed overlay
-        capture_hotkey: Current capture hotkey string (shown in overlay)
-        recapture_hotkey: Current recapture hotkey string (shown in overlay)
+
+def _overlay_photos(screenshot, overlay_opacity: float):
+    """Build the Tk images for the frozen-frame overlay.
+
+    Converts the whole monitor frame to RGB on every show; the save path
+    does not reuse it and converts only the selection from the raw grab.
 
     Returns:
-        CaptureResult with path and region, or CaptureResult(None, None) if cancelled
+        (frame_photo, dimmed_photo): the full frame, and a copy darkened by
+        overlay_opacity (0 = unchanged, 1 = black), both as ImageTk.PhotoImage
     """
-    _ensure_dependencies()
+    from PIL import ImageTk
+
+    frame = _shot_to_image(screenshot)
+    # Per-channel lookup table: darkening runs as a single C pass over the image
+    factor = max(0.0, min(1.0, 1.0 - overlay_opacity))
+    dimmed = frame.point([int(v * factor) for v in range(256)] * 3)
+    return ImageTk.PhotoImage(frame), ImageTk.PhotoImage(dimmed)
+
+
+class _OverlayWindow:
+    """Overlay window covering a single monitor, backed by that monitor's pixels."""
+
+    def __init__(self, master, monitor: dict, overlay_color: str, hotkey_line: str):
+        import tkinter as tk
+
+        self.monitor = monitor
+        self.origin = (monitor["left"], monitor["top"])
+        self.frame_photo = None
+        self.dimmed_photo = None
+
+        self.window = window = tk.Toplevel(master)
+        window.withdraw()
+        window.title("Claude Screenshot - Select Region")
+
+        # Use overrideredirect + explicit geometry to place the window on its
+        # monitor. -fullscreen only covers the primary monitor on Windows.
+        window.overrideredirect(True)
+        window.geometry(f"{monitor['width']}x{monitor['height']}+{monitor['left']}+{monitor['top']}")
+        window.attributes("-topmost", True)
+        window.configure(bg="black")
+        window.config(cursor="crosshair")
+
+        self.canvas = canvas = tk.Canvas(window, highlightthickness=0, bg="black")
+        canvas.pack(fill=tk.BOTH, expand=True)
+
+        # Show the frozen frame instead of a translucent window over the live
+        # desktop: a pre-dimmed copy as the background, and the bright original
+        # only inside the selection. Nothing depends on desktop compositing.
+        # The selection is a child canvas holding the full bright frame,
+        # offset so the selected pixels line up; Tk clips it to its size,
+        # so a redraw only moves and resizes items and never copies pixels.
+        self.background_item = canvas.create_image(0, 0, anchor="nw")
+        self.viewport = tk.Canvas(canvas, highlightthickness=0, bd=0, bg="black")
+        self.viewport_image = self.viewport.create_image(0, 0, anchor="nw")
+        self.selection_item = canvas.create_window(
+            0, 0, window=self.viewport, anchor="nw", state="hidden",
+        )
+        self.outline_item = canvas.create_rectangle(
+            0, 0, 0, 0, outline=overlay_color, width=2, state="hidden",
+        )
+        self._draw_instructions(hotkey_line)
 
-    # Import tkinter here to avoid issues when running as MCP server
-    import tkinter as tk
-
-    result = {"path": None, "region": None}
-
-    # First, take a screenshot of the entire screen BEFORE showing the overlay
-    # This way the overlay itself won't appear in the final capture
-    full_screenshot = capture_full_screen()
-
-    # Get virtual screen geometry (all monitors combined) and individual monitors
-    with mss.mss() as sct:
-        vs = sct.monitors[0]  # 0 = entire virtual screen
-        individual_monitors = list(sct.monitors[1:])  # 1+ = individual monitors
-    vs_left, vs_top = vs["left"], vs["top"]
-    vs_width, vs_height = vs["width"], vs["height"]
-
-    root = tk.Tk()
-    root.title("Claude Screenshot - Select Region")
-
-    # Use overrideredirect + explicit geometry to span ALL monitors.
-    # -fullscreen only covers the primary monitor on Windows.
-    root.overrideredirect(True)
-    root.geometry(f"{vs_width}x{vs_height}+{vs_left}+{vs_top}")
-    root.attributes("-topmost", True)
-    root.attributes("-alpha", overlay_opacity)
-    root.configure(bg="black")
-    root.config(cursor="crosshair")
-
-    # Force the window to grab focus so ESC works immediately.
-    # Re-grab after 100ms as some Windows versions drop focus from
-    # overrideredirect windows.
-    root.focus_force()
-    root.grab_set()
-    root.after(100, lambda: (root.focus_force(), root.grab_set()))
-
-    canvas = tk.Canvas(root, highlightthickness=0, bg="black")
-    canvas.pack(fill=tk.BOTH, expand=True)
-
-    # Build instruction lines, including current hotkeys if provided
-    hotkey_line = ""
-    if capture_hotkey or recapture_hotkey:
-        parts = []
-        if capture_hotkey:
-            parts.append(f"Capture: {capture_hotkey.upper()}")
-        if recapture_hotkey:
-            parts.append(f"Recapture: {recapture_hotkey.upper()}")
-        hotkey_line = "  |  ".join(parts)
+        window.bind("<Map>", self._on_geometry)
+        window.bind("<Configure>", self._on_geometry)
 
-    # Draw instruction text centered on each individual monitor
-    for mon in individual_monitors:
-        cx = (mon["left"] - vs_left) + mon["width"] // 2
-        cy = (mon["top"] - vs_top) + mon["height"] // 2
+    def _draw_instructions(self, hotkey_line: str) -> None:
+        """Draw instruction text centered on the monitor."""
+        canvas = self.canvas
+        cx = self.monitor["width"] // 2
+        cy = self.monitor["height"] // 2
         y_offset = -28 if hotkey_line else -16
         canvas.create_text(
             cx, cy + y_offset,
@@ -235,83 +744,401 @@ def select_region_and_capture(
                 font=("Arial", 12),
             )
 
-    # State for drag selection
-    state = {"start_x": 0, "start_y": 0, "rect_id": None, "selecting": False}
+    def _on_geometry(self, event):
+        # Cache the window origin: querying it is a round trip to the
+        # window system, far too slow to repeat on every motion event
+        self.origin = (self.window.winfo_rootx(), self.window.winfo_rooty())
+
+    def show(self, screenshot, overlay_opacity: float) -> None:
+        """Display a new frozen frame of this monitor."""
+        self.frame_photo, self.dimmed_photo = _overlay_photos(screenshot, overlay_opacity)
+        self.canvas.itemconfigure(self.background_item, image=self.dimmed_photo)
+        self.viewport.itemconfigure(self.viewport_image, image=self.frame_photo)
+        self.canvas.itemconfigure(self.selection_item, state="hidden")
+        self.canvas.itemconfigure(self.outline_item, state="hidden")
+        self.window.deiconify()
+        self.window.lift()
+
+    def hide(self) -> None:
+        """Withdraw the window and drop its frame images."""
+        self.window.withdraw()
+        self.canvas.itemconfigure(self.background_item, image="")
+        self.viewport.itemconfigure(self.viewport_image, image="")
+        self.frame_photo = self.dimmed_photo = None
+
+    def draw_selection(self, left: int, top: int, right: int, bottom: int) -> None:
+        """Draw a screen-absolute selection, clipped to this monitor."""
+        canvas = self.canvas
+        ox, oy = self.origin
+        # Just outside the selection: embedded windows draw above canvas items
+        canvas.coords(self.outline_item, left - ox - 1, top - oy - 1, right - ox + 1, bottom - oy + 1)
+        canvas.itemconfigure(self.outline_item, state="normal")
+
+        x1, y1 = max(0, left - ox), max(0, top - oy)
+        x2 = min(self.monitor["width"], right - ox)
+        y2 = min(self.monitor["height"], bottom - oy)
+        if x2 > x1 and y2 > y1:
+            # Show the undimmed frame through a viewport over the selection
+            self.viewport.coords(self.viewport_image, -x1, -y1)
+            canvas.coords(self.selection_item, x1, y1)
+            canvas.itemconfigure(self.selection_item, width=x2 - x1, height=y2 - y1, state="normal")
+        else:
+            canvas.itemconfigure(self.selection_item, state="hidden")
+
+
+class RegionSelector:
+    """Interactive region selection overlay over a frozen frame.
+
+    Each monitor gets its own overlay window, backed only by that monitor's
+    pixels, so mixed-resolution layouts don't pay for the dead space in
+    their bounding box. Selections are tracked in screen-absolute
+    coordinates and may cross monitor boundaries; every window draws its
+    part of the selection.
+
+    Windows and canvas items are built once (and rebuilt only when the
+    monitor layout or overlay appearance changes); select() only swaps in
+    new frames, so a long-lived selector (as kept by the daemon) shows the
+    overlay without creating any widgets. Drag
+    handling does no per-event allocation: the outline rectangle and the
+    bright selection viewport are moved with canvas.coords, window origins are
+    cached when the windows are mapped, and motion events are coalesced so
+    the selection is redrawn at most once per display frame (FRAME_MS).
+    """
 
-    def on_press(event):
-        state["start_x"] = event.x_root
-        state["start_y"] = event.y_root
-        state["selecting"] = True
+    # Redraw interval while dragging (~60 Hz display refresh)
+    FRAME_MS = 16
+
+    def __init__(
+        self,
+        overlay_color: str = "#00aaff",
+        overlay_opacity: float = 0.3,
+        capture_hotkey: Optional[str] = None,
+        recapture_hotkey: Optional[str] = None,
+    ):
+        # Import tkinter here to avoid issues when running as MCP server
+        import tkinter as tk
+
+        # DPI awareness must be set before the first Tk window exists
+        _load_imaging()
+
+        # The root is never shown; it owns one overlay window per monitor
+        self.root = tk.Tk()
+        self.root.withdraw()
+
+        self._windows = []
+        self._layout = None
+        self.configure(overlay_color, overlay_opacity, capture_hotkey, recapture_hotkey)
+
+        # Selection state (screen-absolute coordinates)
+        self._start = None
+        self._pointer = None
+        self._redraw_pending = None
+        self._region = None
+        self._on_shown = None
+        self._done = tk.BooleanVar(master=self.root, value=False)
+
+    def configure(
+        self,
+        overlay_color: str = "#00aaff",
+        overlay_opacity: float = 0.3,
+        capture_hotkey: Optional[str] = None,
+        recapture_hotkey: Optional[str] = None,
+    ) -> None:
+        """Update the overlay appearance, effective from the next select()."""
+        # Build instruction lines, including current hotkeys if provided
+        parts = []
+        if capture_hotkey:
+            parts.append(f"Capture: {capture_hotkey.upper()}")
+        if recapture_hotkey:
+            parts.append(f"Recapture: {recapture_hotkey.upper()}")
+        hotkey_line = "  |  ".join(parts)
 
-    def on_drag(event):
-        if not state["selecting"]:
+        if self._layout is not None and (overlay_color, hotkey_line) != (self.overlay_color, self._hotkey_line):
+            # Outline color and instruction text are baked into the windows
+            self._layout = None
+        self.overlay_color = overlay_color
+        self.overlay_opacity = overlay_opacity
+        self._hotkey_line = hotkey_line
+
+    def prepare(self, monitors: list) -> None:
+        """Build the (hidden) overlay windows ahead of the first select()."""
+        self._ensure_windows(monitors)
+
+    def select(self, screenshots: list, monitors: list, on_shown: Optional[Callable[[], None]] = None) -> Optional[dict]:
+        """Show the overlay over frozen frames and wait for a selection.
+
+        Args:
+            screenshots: One raw mss grab per monitor, in the order of `monitors`
+            monitors: Individual mss monitor dicts (monitors[1:])
+            on_shown: Called once the overlay has been mapped and drawn
+
+        Returns:
+            Screen-absolute region {x, y, width, height}, or None if cancelled
+        """
+        self._ensure_windows(monitors)
+        self._on_shown = on_shown
+        for window, screenshot in zip(self._windows, screenshots):
+            window.show(screenshot, self.overlay_opacity)
+
+        self._start = None
+        self._region = None
+        self._done.set(False)
+
+        # Force the first window to grab focus so ESC works immediately.
+        # Re-grab after 100ms as some Windows versions drop focus from
+        # overrideredirect windows. While the grab is held, pointer events
+        # over the other overlay windows are reported to this one.
+        primary = self._windows[0].window
+        primary.focus_force()
+        primary.grab_set()
+        regrab = primary.after(100, lambda: (primary.focus_force(), primary.grab_set()))
+
+        self.root.wait_variable(self._done)
+
+        primary.after_cancel(regrab)
+        self._cancel_redraw()
+        primary.grab_release()
+        for window in self._windows:
+            window.hide()
+        return self._region
+
+    def close(self) -> None:
+        """Destroy the overlay windows."""
+        try:
+            self.root.destroy()
+        except Exception:
+            pass
+
+    def cancel(self) -> None:
+        """End the current select() as if Escape was pressed (Tk thread only)."""
+        self._on_cancel(None)
+
+    def _ensure_windows(self, monitors: list) -> None:
+        """Build one overlay window per monitor, unless the layout is unchanged."""
+        layout = [(m["left"], m["top"], m["width"], m["height"]) for m in monitors]
+        if layout == self._layout:
             return
-        if state["rect_id"]:
-            canvas.delete(state["rect_id"])
-
-        # Convert root coords to canvas coords
-        cx1 = state["start_x"] - root.winfo_rootx()
-        cy1 = state["start_y"] - root.winfo_rooty()
-        cx2 = event.x_root - root.winfo_rootx()
-        cy2 = event.y_root - root.winfo_rooty()
-
-        state["rect_id"] = canvas.create_rectangle(
-            cx1, cy1, cx2, cy2,
-            outline=overlay_color,
-            width=2,
-            fill=overlay_color,
-            stipple="gray25",
-        )
 
-    def on_release(event):
-        if not state["selecting"]:
+        for window in self._windows:
+            window.window.destroy()
+        self._windows = [
+            _OverlayWindow(self.root, mon, self.overlay_color, self._hotkey_line)
+            for mon in monitors
+        ]
+        for window in self._windows:
+            window.window.bind("<Map>", self._on_map, add="+")
+            window.window.bind("<ButtonPress-1>", self._on_press)
+            window.window.bind("<B1-Motion>", self._on_drag)
+            window.window.bind("<ButtonRelease-1>", self._on_release)
+            window.window.bind("<Escape>", self._on_cancel)
+            # Also handle right-click as cancel
+            window.window.bind("<ButtonPress-3>", self._on_cancel)
+        self._layout = layout
+
+    def _on_map(self, event):
+        if self._on_shown is not None:
+            # Report after the pending idle redraw has painted the canvas
+            callback, self._on_shown = self._on_shown, None
+            self.root.after_idle(callback)
+
+    def _on_press(self, event):
+        self._start = self._pointer = (event.x_root, event.y_root)
+
+    def _on_drag(self, event):
+        if self._start is None:
+            return
+        # Only record the pointer; the redraw happens once per frame no
+        # matter how many motion events arrive in between
+        self._pointer = (event.x_root, event.y_root)
+        if self._redraw_pending is None:
+            self._redraw_pending = self.root.after(self.FRAME_MS, self._redraw)
+
+    def _redraw(self):
+        """Draw the current selection on every overlay window."""
+        self._redraw_pending = None
+        if self._start is None:
             return
-        state["selecting"] = False
+        (x1, y1), (x2, y2) = self._start, self._pointer
+        left, top = min(x1, x2), min(y1, y2)
+        right, bottom = max(x1, x2), max(y1, y2)
+        for window in self._windows:
+            window.draw_selection(left, top, right, bottom)
+
+    def _cancel_redraw(self):
+        if self._redraw_pending is not None:
+            self.root.after_cancel(self._redraw_pending)
+            self._redraw_pending = None
+
+    def _on_release(self, event):
+        if self._start is None:
+            return
+        start_x, start_y = self._start
+        self._start = None
 
-        x1 = min(state["start_x"], event.x_root)
-        y1 = min(state["start_y"], event.y_root)
-        x2 = max(state["start_x"], event.x_root)
-        y2 = max(state["start_y"], event.y_root)
+        x1, y1 = min(start_x, event.x_root), min(start_y, event.y_root)
+        x2, y2 = max(start_x, event.x_root), max(start_y, event.y_root)
 
-        width = x2 - x1
-        height = y2 - y1
+        # Too small counts as a cancelled selection
+        if x2 - x1 >= 5 and y2 - y1 >= 5:
+            self._region = {"x": x1, "y": y1, "width": x2 - x1, "height": y2 - y1}
+        self._done.set(True)
 
-        root.grab_release()
-        root.destroy()
+    def _on_cancel(self, event):
+        self._start = None
+        self._region = None
+        self._done.set(True)
 
-        if width < 5 or height < 5:
-            # Too small, treat as a cancelled selection
-            return
 
-        # Crop the pre-captured full screenshot.
-        # The full screenshot starts at pixel (0,0) but corresponds to
-        # screen coordinate (vs_left, vs_top). Convert screen-absolute
-        # coords to image coords for cropping.
-        cropped = full_screenshot.crop((
-            x1 - vs_left, y1 - vs_top,
-            x2 - vs_left, y2 - vs_top,
-        ))
-        result["path"] = save_screenshot(cropped, save_dir=save_dir, fmt=fmt)
-        # Store screen-absolute coordinates (needed by mss.grab() in recapture)
-        result["region"] = {"x": x1, "y": y1, "width": width, "height": height}
+def select_region_and_capture(
+    save_dir: Optional[str] = None,
+    fmt: str = "png",
+    overlay_color: str = "#00aaff",
+    overlay_opacity: float = 0.3,
+    capture_hotkey: Optional[str] = None,
+    recapture_hotkey: Optional[str] = None,
+    background_save: bool = False,
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
+    selector: Optional[RegionSelector] = None,
+    on_shown: Optional[Callable[[], None]] = None,
+) -> CaptureResult:
+    """Launch interactive region selector overlay, capture the selected area.
+
+    Opens an overlay window on every monitor that shows a dimmed, frozen
+    copy of that monitor. User clicks and drags to select a region (shown
+    at full brightness), which may span monitors. On release, that region
+    is cropped from the frozen frames and saved.
+
+    Press Escape or right-click to cancel.
+
+    Args:
+        save_dir: Where to save the screenshot
+        fmt: Image format
+        overlay_color: Color of the selection rectangle
+        overlay_opacity: How much the frozen frame is dimmed (0 - 1)
+        capture_hotkey: Current capture hotkey string (shown in overlay)
+        recapture_hotkey: Current recapture hotkey string (shown in overlay)
+        background_save: Return as soon as the selection is made, while the
+            image is still being encoded. The path is reserved up front and
+            result.saved resolves once the file is fully written.
+        encoder: The 'encoder' config section (default: 'balanced' preset)
+        downscale: The 'downscale' config section (default: full size)
+        selector: Long-lived RegionSelector to reuse (it is reconfigured
+            and kept open). By default a selector is created for this call
+            and destroyed afterwards. Must be used from its Tk thread.
+        on_shown: Called once the overlay is visible (latency reporting)
+
+    Returns:
+        CaptureResult with path, region, saved future and downscale info,
+        or CaptureResult(None, None) if cancelled
+    """
+    _ensure_dependencies()
+
+    grabber = get_grabber()
+    monitors = list(grabber.monitors[1:])  # 1+ = individual monitors
+
+    # First, take a screenshot of every monitor BEFORE showing the overlay
+    # This way the overlay itself won't appear in the final capture. One
+    # grab per monitor never captures the dead space between monitors, and
+    # the raw BGRA grabs are kept: only the selection is converted later.
+    screenshots = [grabber.grab(mon) for mon in monitors]
+
+    if selector is not None:
+        selector.configure(overlay_color, overlay_opacity, capture_hotkey, recapture_hotkey)
+        region = selector.select(screenshots, monitors, on_shown=on_shown)
+    else:
+        selector = RegionSelector(overlay_color, overlay_opacity, capture_hotkey, recapture_hotkey)
+        try:
+            region = selector.select(screenshots, monitors, on_shown=on_shown)
+        finally:
+            selector.close()
 
-    def on_escape(event):
-        root.grab_release()
-        root.destroy()
+    return _save_selection(screenshots, monitors, region, save_dir, fmt, encoder, downscale, background_save)
 
-    # Also handle right-click as cancel
-    def on_right_click(event):
-        root.grab_release()
-        root.destroy()
 
-    root.bind("<ButtonPress-1>", on_press)
-    root.bind("<B1-Motion>", on_drag)
-    root.bind("<ButtonRelease-1>", on_release)
-    root.bind("<Escape>", on_escape)
-    root.bind("<ButtonPress-3>", on_right_click)
+def _crop_selection(screenshots: list, monitors: list, region: dict) -> "Image.Image":
+    """Cut a screen-absolute region out of per-monitor grabs.
 
-    root.mainloop()
-    return CaptureResult(path=result["path"], region=result["region"])
+    A region inside one monitor is converted straight from that grab;
+    one spanning monitors is stitched together, with any dead space
+    between monitors left black.
+    """
+    x1, y1 = region["x"], region["y"]
+    x2, y2 = x1 + region["width"], y1 + region["height"]
+
+    parts = []
+    for shot, mon in zip(screenshots, monitors):
+        left, top = max(x1, mon["left"]), max(y1, mon["top"])
+        right = min(x2, mon["left"] + mon["width"])
+        bottom = min(y2, mon["top"] + mon["height"])
+        if right > left and bottom > top:
+            box = (left - mon["left"], top - mon["top"], right - mon["left"], bottom - mon["top"])
+            parts.append((shot, box, (left - x1, top - y1)))
+
+    if len(parts) == 1:
+        shot, box, offset = parts[0]
+        if offset == (0, 0) and (box[2] - box[0], box[3] - box[1]) == (x2 - x1, y2 - y1):
+            return _shot_to_image(shot, box=box)
+
+    image = Image.new("RGB", (x2 - x1, y2 - y1))
+    for shot, box, offset in parts:
+        image.paste(_shot_to_image(shot, box=box), offset)
+    return image
+
+
+def _save_selection(
+    screenshots: list,
+    monitors: list,
+    region: Optional[dict],
+    save_dir: Optional[str],
+    fmt: str,
+    encoder: Optional[dict],
+    downscale: Optional[dict],
+    background_save: bool,
+) -> CaptureResult:
+    """Crop a selected region out of the frozen frames and save it."""
+    if region is None:
+        return CaptureResult(None, None)
+
+    cropped = _crop_selection(screenshots, monitors, region)
+    path, saved = save_screenshot_async(
+        cropped, save_dir=save_dir, fmt=fmt, encoder=encoder, downscale=downscale,
+    )
+    if not background_save:
+        # Surface encode/write errors to the caller, as save_screenshot() would
+        saved.result()
+    # region is screen-absolute (needed by mss.grab() in recapture)
+    return CaptureResult(
+        path,
+        region,
+        saved,
+        budget_scale(cropped.width, cropped.height, downscale),
+        {"width": cropped.width, "height": cropped.height},
+    )
+
+
+def capture_settings(
+    save_dir: Optional[str],
+    fmt: str,
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
+) -> dict:
+    """Everything besides the pixels that determines a saved screenshot file.
+
+    JSON-serializable and normalized (resolved encoder options, absolute
+    directory), so records of earlier captures can be compared with it.
+    """
+    downscale = downscale or {}
+    return {
+        "save_dir": os.path.normcase(os.path.abspath(save_dir or tempfile.gettempdir())),
+        "fmt": fmt.lower(),
+        "encoder": resolve_encoder(encoder),
+        "downscale": {
+            "max_dimension": downscale.get("max_dimension") or 0,
+            "max_megapixels": downscale.get("max_megapixels") or 0,
+            "resample": str(downscale.get("resample") or "bilinear").lower(),
+        },
+    }
 
 
 def recapture_region(
@@ -321,10 +1148,26 @@ def recapture_region(
     height: int,
     save_dir: Optional[str] = None,
     fmt: str = "png",
-) -> str:
+    encoder: Optional[dict] = None,
+    previous_digest: Optional[str] = None,
+    previous_path: Optional[str] = None,
+    background_save: bool = False,
+    previous_tiles: Optional[list] = None,
+    save_changed_crop: bool = False,
+    downscale: Optional[dict] = None,
+    previous_settings: Optional[dict] = None,
+    previous_scale: Optional[float] = None,
+    previous_original_size: Optional[dict] = None,
+) -> RecaptureResult:
     """Capture a specific screen region without any overlay.
 
-    Convenience wrapper around capture_region() + save_screenshot().
+    The raw pixels are hashed before encoding. If they match
+    previous_digest, the previous file was saved with the same settings
+    (format, encoder, downscale, directory) and it still exists, nothing
+    is encoded or written and the previous path is returned with
+    unchanged=True.
+    Otherwise the frame is hashed per tile and compared with
+    previous_tiles to report the bounding box of what changed.
 
     Args:
         x: Left coordinate
@@ -333,43 +1176,211 @@ def recapture_region(
         height: Height of the region
         save_dir: Directory to save to (default: temp dir)
         fmt: Image format
+        encoder: The 'encoder' config section (default: 'balanced' preset)
+        previous_digest: Digest of the last capture of this region
+        previous_path: File of the last capture of this region
+        background_save: Return right after the path is reserved; the
+            returned saved future resolves once the file is written
+        previous_tiles: Tile digests of the last capture of this region
+        save_changed_crop: Also save an image of just the changed area
+        downscale: The 'downscale' config section (default: full size)
+        previous_settings: capture_settings() of the last capture's file
+        previous_scale: Downscale factor of the last capture's file
+        previous_original_size: Size of the last capture before downscaling
 
     Returns:
-        Absolute path to the saved screenshot file
+        RecaptureResult with path, unchanged flag, digests, saved future,
+        the changed region (plus its crop, if requested) and downscale info
     """
-    image = capture_region(x, y, width, height)
-    return save_screenshot(image, save_dir=save_dir, fmt=fmt)
+    _ensure_dependencies()
+    region = {"left": x, "top": y, "width": width, "height": height}
+    shot = get_grabber().grab(region)
+    digest = frame_digest(shot)
+    scale = budget_scale(shot.width, shot.height, downscale)
+    original_size = {"width": shot.width, "height": shot.height}
+    settings = capture_settings(save_dir, fmt, encoder, downscale)
+
+    if (
+        previous_digest == digest
+        and previous_settings == settings
+        and previous_path
+        and os.path.isfile(previous_path)
+    ):
+        tiles = previous_tiles if previous_tiles is not None else tile_digests(shot)
+        saved = Future()
+        saved.set_result(previous_path)
+        # Report the file actually returned, as it was saved
+        return RecaptureResult(
+            path=previous_path, unchanged=True, digest=digest, saved=saved, tiles=tiles,
+            scale=previous_scale if previous_scale is not None else scale,
+            original_size=previous_original_size or original_size,
+            settings=settings,
+        )
+
+    # Same pixels saved with other settings: the tiles have not changed either
+    if previous_digest == digest and previous_tiles is not None:
+        tiles = previous_tiles
+    else:
+        tiles = tile_digests(shot)
+    path, saved = save_screenshot_async(
+        _shot_to_image(shot), save_dir=save_dir, fmt=fmt, encoder=encoder, downscale=downscale,
+    )
+
+    changed_region = None
+    changed_path = None
+    box = changed_tiles_bbox(previous_tiles, tiles, shot.width, shot.height)
+    if box is not None:
+        left, top, right, bottom = box
+        changed_region = {"x": x + left, "y": y + top, "width": right - left, "height": bottom - top}
+        if save_changed_crop:
+            if box == (0, 0, shot.width, shot.height):
+                changed_path = path
+            else:
+                changed_path = save_screenshot(
+                    _shot_to_image(shot, box=box), save_dir=save_dir, fmt=fmt,
+                    encoder=encoder, downscale=downscale,
+                )
+
+    if not background_save:
+        saved.result()
+    return RecaptureResult(
+        path=path,
+        unchanged=False,
+        digest=digest,
+        saved=saved,
+        tiles=tiles,
+        changed_region=changed_region,
+        changed_path=changed_path,
+        scale=scale,
+        original_size=original_size,
+        settings=settings,
+    )
+
+
+def capture_batch(
+    regions: list,
+    save_dir: Optional[str] = None,
+    fmt: str = "png",
+    encoder: Optional[dict] = None,
+    downscale: Optional[dict] = None,
+) -> list:
+    """Capture several screen regions from a single grab.
+
+    Grabs the union of all regions once, so every region comes from the same
+    instant, crops each one straight from the raw buffer and encodes them
+    concurrently on the encode pool.
+
+    Args:
+        regions: List of {"x", "y", "width", "height"} dicts (screen coordinates)
+        save_dir: Directory to save to (default: temp dir)
+        fmt: Image format
+        encoder: The 'encoder' config section (default: 'balanced' preset)
+        downscale: The 'downscale' config section (default: full size)
+
+    Returns:
+        List of {"path", "region", "scale", "original_size"} dicts, in the
+        order the regions were given
+    """
+    _ensure_dependencies()
+    if not regions:
+        return []
+
+    left = min(r["x"] for r in regions)
+    top = min(r["y"] for r in regions)
+    right = max(r["x"] + r["width"] for r in regions)
+    bottom = max(r["y"] + r["height"] for r in regions)
+    shot = get_grabber().grab({"left": left, "top": top, "width": right - left, "height": bottom - top})
+
+    pending = []
+    for r in regions:
+        image = _shot_to_image(shot, box=(
+            r["x"] - left, r["y"] - top,
+            r["x"] - left + r["width"], r["y"] - top + r["height"],
+        ))
+        path, saved = save_screenshot_async(image, save_dir=save_dir, fmt=fmt, encoder=encoder, downscale=downscale)
+        pending.append((r, image, saved))
+
+    return [
+        {
+            "path": saved.result(),
+            "region": r,
+            "scale": budget_scale(image.width, image.height, downscale),
+            "original_size": {"width": image.width, "height": image.height},
+        }
+        for r, image, saved in pending
+    ]
+
+
+class RegionWatcher:
+    """Cheap change detection for repeated samples of one screen region.
+
+    Each sample is compared with a baseline on a small grayscale thumbnail
+    (at most `sample_size` pixels per side), so waiting for a change costs
+    a grab plus a few thousand pixel comparisons instead of an encode and a
+    file per poll. The baseline is the last sample reported as changed
+    (the first sample counts as changed), not simply the previous sample,
+    so slow gradual changes add up until they cross the threshold.
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        threshold: float = 0.01,
+        sample_size: int = 128,
+        pixel_tolerance: int = 8,
+    ):
+        """
+        Args:
+            x, y, width, height: Screen region to watch
+            threshold: Fraction of thumbnail pixels (0-1) that must change
+                for a sample to count as changed
+            sample_size: Longest side of the comparison thumbnail
+            pixel_tolerance: Gray-level difference (0-255) below which a
+                pixel counts as unchanged (absorbs dithering/cursor blink noise)
+        """
+        _ensure_dependencies()
+        self.region = {"left": x, "top": y, "width": width, "height": height}
+        self.threshold = threshold
+        self.pixel_tolerance = pixel_tolerance
+        self._reduce_factor = max(1, -(-max(width, height) // sample_size))
+        self._previous = None
+
+    def _thumbnail(self, image: "Image.Image") -> "Image.Image":
+        """Downsample (box filter, integer factor) and drop color for comparison."""
+        return image.reduce(self._reduce_factor).convert("L")
+
+    def reset(self, image: Optional["Image.Image"] = None) -> None:
+        """Set the comparison baseline (or clear it so the next sample is 'changed')."""
+        self._previous = self._thumbnail(image) if image is not None else None
+
+    def sample(self) -> WatchSample:
+        """Grab the region and compare it with the baseline.
+
+        A sample reported as changed becomes the new baseline.
+        """
+        image = _shot_to_image(get_grabber().grab(self.region))
+        thumbnail = self._thumbnail(image)
+        if self._previous is None:
+            self._previous = thumbnail
+            return WatchSample(changed=True, change_ratio=1.0, image=image)
+
+        # Histogram of absolute differences: count pixels above the tolerance
+        histogram = ImageChops.difference(self._previous, thumbnail).histogram()
+        changed_pixels = sum(histogram[self.pixel_tolerance + 1:])
+        ratio = changed_pixels / (thumbnail.width * thumbnail.height)
+        changed = ratio > self.threshold
+        if changed:
+            self._previous = thumbnail
+        return WatchSample(changed=changed, change_ratio=ratio, image=image)
 
 
 def copy_to_clipboard(text: str) -> bool:
-    """Copy text to system clipboard.
+    """Copy text to system clipboard (see clipboard.py for the backends).
 
     Returns True if successful.
     """
-    try:
-        if sys.platform == "win32":
-            # Use clip.exe on Windows
-            process = subprocess.Popen(
-                ["clip"],
-                stdin=subprocess.PIPE,
-                shell=True,
-            )
-            process.communicate(text.encode("utf-16le"))
-            return process.returncode == 0
-        elif sys.platform == "darwin":
-            process = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
-            process.communicate(text.encode("utf-8"))
-            return process.returncode == 0
-        else:
-            # Try xclip or xsel on Linux
-            for cmd in [["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]]:
-                try:
-                    process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
-                    process.communicate(text.encode("utf-8"))
-                    if process.returncode == 0:
-                        return True
-                except FileNotFoundError:
-                    continue
-        return False
-    except Exception:
-        return False
+    with span("clipboard"):
+        return clipboard.copy(text)
@@ -0,0 +1,250 @@
+"""
+Persistent catalog of captured screenshots.
+
+Every screenshot written by save_screenshot() is recorded in a small SQLite
+database in the config directory, so "latest N" is an indexed query instead
+of a listdir + stat of the whole save directory (which defaults to the
+system temp folder and can hold tens of thousands of unrelated files).
+
+Files deleted out of band are reconciled lazily: rows whose file no longer
+exists are dropped when a query runs into them, and reconcile() prunes the
+whole catalog in one pass.
+
+The catalog is also what the retention policy works from: only files
+recorded here (i.e. written by this tool) are ever evicted, oldest first.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+
+from .config import get_config_dir
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS screenshots (
+    path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    created REAL NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    width INTEGER,
+    height INTEGER,
+    format TEXT
+);
+CREATE INDEX IF NOT EXISTS screenshots_by_directory
+    ON screenshots (directory, created DESC);
+"""
+
+# Extensions considered screenshots when falling back to a directory scan
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+
+# One connection per thread (sqlite3 connections are not shareable by default)
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+
+def get_catalog_path() -> Path:
+    """Get the path to the screenshot catalog database."""
+    return get_config_dir() / "catalog.sqlite3"
+
+
+def _normalize_dir(directory: str) -> str:
+    """Normalize a directory so equivalent spellings share catalog rows."""
+    return os.path.normcase(os.path.abspath(directory))
+
+
+def _connect() -> sqlite3.Connection:
+    """Get this thread's catalog connection, creating the schema on first use."""
+    global _schema_ready
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(str(get_catalog_path()), timeout=5)
+        _local.conn = conn
+    if not _schema_ready:
+        with _schema_lock:
+            if not _schema_ready:
+                # WAL lets the daemon and the MCP server read/write concurrently
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                _schema_ready = True
+    return conn
+
+
+def record_screenshot(path: str, width: Optional[int] = None, height: Optional[int] = None, fmt: Optional[str] = None) -> None:
+    """Record a newly saved screenshot. Never raises: the catalog is best-effort."""
+    try:
+        size = os.path.getsize(path)
+        conn = _connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO screenshots (path, directory, created, size, width, height, format) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (path, _normalize_dir(os.path.dirname(path)), time.time(), size, width, height, fmt),
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not record {path} in screenshot catalog: {e}", file=sys.stderr)
+
+
+def _forget(conn: sqlite3.Connection, paths: list) -> None:
+    """Drop catalog rows for files that no longer exist."""
+    with conn:
+        conn.executemany("DELETE FROM screenshots WHERE path = ?", [(p,) for p in paths])
+
+
+def _scan_directory(directory: str, count: int) -> list:
+    """List the newest image files in a directory, sorted by modification time."""
+    files = []
+    for f in Path(directory).iterdir():
+        if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS:
+            files.append((f, f.stat().st_mtime))
+
+    files.sort(key=lambda x: x[1], reverse=True)
+    return [str(f.resolve()) for f, _ in files[:count]]
+
+
+def latest_screenshots(directory: str, count: int) -> list:
+    """Get the paths of the `count` most recent screenshots saved to a directory.
+
+    Uses the catalog index; rows whose files were deleted out of band are
+    pruned as they are encountered. If the catalog has never seen this
+    directory (e.g. screenshots taken before the catalog existed), falls
+    back to scanning the directory.
+    """
+    try:
+        conn = _connect()
+        key = _normalize_dir(directory)
+        latest = []
+        offset = 0
+        while len(latest) < count:
+            rows = conn.execute(
+                "SELECT path FROM screenshots WHERE directory = ? "
+                "ORDER BY created DESC LIMIT ? OFFSET ?",
+                (key, count, offset),
+            ).fetchall()
+            if not rows:
+                break
+            missing = []
+            for (path,) in rows:
+                if os.path.isfile(path):
+                    if len(latest) < count:
+                        latest.append(path)
+                else:
+                    missing.append(path)
+            if missing:
+                _forget(conn, missing)
+            # Deleted rows shift the window, so only advance past kept rows
+            offset += len(rows) - len(missing)
+
+        if latest or offset:
+            return latest
+    except sqlite3.Error as e:
+        print(f"Warning: Screenshot catalog query failed, scanning directory: {e}", file=sys.stderr)
+
+    return _scan_directory(directory, count)
+
+
+def reconcile() -> int:
+    """Remove catalog rows whose files no longer exist. Returns rows removed."""
+    try:
+        conn = _connect()
+        paths = [p for (p,) in conn.execute("SELECT path FROM screenshots")]
+        missing = [p for p in paths if not os.path.isfile(p)]
+        if missing:
+            _forget(conn, missing)
+        return len(missing)
+    except sqlite3.Error as e:
+        print(f"Warning: Could not reconcile screenshot catalog: {e}", file=sys.stderr)
+        return 0
+
+
+def enforce_retention(max_count: int = 0, max_bytes: int = 0, max_age_days: float = 0) -> Tuple[int, int]:
+    """Delete the oldest cataloged screenshots beyond the retention limits.
+
+    Limits apply to all screenshots in the catalog together; 0 disables a
+    limit. Only cataloged files are considered, so screenshots of other
+    tools in the same directory are never touched.
+
+    Returns:
+        (files removed, bytes freed)
+    """
+    if not (max_count or max_bytes or max_age_days):
+        return 0, 0
+
+    cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+    try:
+        conn = _connect()
+        rows = conn.execute("SELECT path, size, created FROM screenshots ORDER BY created DESC").fetchall()
+    except sqlite3.Error as e:
+        print(f"Warning: Could not enforce screenshot retention: {e}", file=sys.stderr)
+        return 0, 0
+
+    # Newest first: keep files while every limit still holds, evict the rest
+    kept = kept_bytes = 0
+    evict = []
+    for path, size, created in rows:
+        if (
+            (max_count and kept + 1 > max_count)
+            or (max_bytes and kept_bytes + size > max_bytes)
+            or (cutoff is not None and created < cutoff)
+        ):
+            evict.append((path, size))
+        else:
+            kept += 1
+            kept_bytes += size
+
+    forgotten = []
+    freed = 0
+    for path, size in evict:
+        try:
+            os.remove(path)
+            freed += size
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Could not delete old screenshot {path}: {e}", file=sys.stderr)
+            continue
+        forgotten.append(path)
+
+    if forgotten:
+        try:
+            _forget(conn, forgotten)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not update screenshot catalog: {e}", file=sys.stderr)
+    return len(forgotten), freed
+
+
+# Throttle for maybe_enforce_retention()
+_retention_lock = threading.Lock()
+_last_retention = float("-inf")
+
+
+def maybe_enforce_retention(retention: Optional[Mapping], min_interval: float = 60.0) -> Optional[Tuple[int, int]]:
+    """Enforce the 'retention' config section, at most once per min_interval seconds.
+
+    Cheap to call after every save. Returns enforce_retention()'s result,
+    or None if skipped (throttled, already running, or no limits set).
+    """
+    global _last_retention
+    retention = retention or {}
+    limits = {
+        "max_count": retention.get("max_count") or 0,
+        "max_bytes": retention.get("max_bytes") or 0,
+        "max_age_days": retention.get("max_age_days") or 0,
+    }
+    if not any(limits.values()):
+        return None
+    if not _retention_lock.acquire(blocking=False):
+        return None
+    try:
+        now = time.monotonic()
+        if now - _last_retention < min_interval:
+            return None
+        _last_retention = now
+        return enforce_retention(**limits)
+    finally:
+        _retention_lock.release()
@@ -0,0 +1,388 @@
+"""
+System clipboard access.
+
+The backend is detected once per process and cached:
+
+    Windows  Win32 clipboard API via ctypes (CF_UNICODETEXT), in process
+    macOS    pbcopy
+    Wayland  wl-copy
+    X11      A persistent helper process that owns the CLIPBOARD selection
+             with a hidden Tk window; each copy is one line on its stdin
+             (xclip / xsel per copy if tkinter is unavailable)
+
+An X11 selection is served by the process that owns it, so the helper
+stays alive between copies. When its parent exits, the helper hands the
+last copied text to xclip / xsel (if installed and nobody copied anything
+since), so the path stays on the clipboard.
+
+Helper protocol (one line each way per copy):
+    Helper -> client on startup:  ready
+    Client -> helper:             {"text": "..."}
+    Helper -> client:             ok | error
+"""
+
+import atexit
+import importlib.util
+import json
+import os
+import select
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Optional
+
+
+# Seconds to wait for the X11 helper to start, and to acknowledge a copy
+_HELPER_START_TIMEOUT = 5.0
+_HELPER_COPY_TIMEOUT = 2.0
+
+# Per-copy commands for X11, in order of preference
+_X11_COMMANDS = (["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"])
+
+
+class _CommandClipboard:
+    """Copy by running a command with the text on its stdin."""
+
+    def __init__(self, command: list, encoding: str = "utf-8"):
+        self.command = command
+        self.encoding = encoding
+        self.name = os.path.basename(command[0])
+
+    def copy(self, text: str) -> bool:
+        try:
+            # xclip / xsel / wl-copy fork a child that keeps serving the
+            # selection; it must not inherit pipes we would wait on
+            process = subprocess.run(
+                self.command,
+                input=text.encode(self.encoding),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False
+        return process.returncode == 0
+
+    def close(self) -> None:
+        pass
+
+
+class _WindowsClipboard:
+    """Set CF_UNICODETEXT through the Win32 clipboard API, without a child process."""
+
+    name = "win32"
+
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        # Explicit signatures: handles are pointer-sized on 64-bit Windows
+        user32.OpenClipboard.argtypes = [wintypes.HWND]
+        user32.OpenClipboard.restype = wintypes.BOOL
+        user32.EmptyClipboard.restype = wintypes.BOOL
+        user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+        user32.SetClipboardData.restype = wintypes.HANDLE
+        user32.CloseClipboard.restype = wintypes.BOOL
+        kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+        kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+        kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalLock.restype = ctypes.c_void_p
+        kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalUnlock.restype = wintypes.BOOL
+        kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+        self._memmove = ctypes.memmove
+        self._user32 = user32
+        self._kernel32 = kernel32
+
+    def copy(self, text: str) -> bool:
+        data = text.encode("utf-16le") + b"\0\0"
+        kernel32 = self._kernel32
+        handle = kernel32.GlobalAlloc(self.GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            kernel32.GlobalFree(handle)
+            return False
+        self._memmove(pointer, data, len(data))
+        kernel32.GlobalUnlock(handle)
+
+        # Another application may be holding the clipboard open briefly
+        for _ in range(10):
+            if self._user32.OpenClipboard(None):
+                break
+            time.sleep(0.01)
+        else:
+            kernel32.GlobalFree(handle)
+            return False
+        try:
+            self._user32.EmptyClipboard()
+            if not self._user32.SetClipboardData(self.CF_UNICODETEXT, handle):
+                kernel32.GlobalFree(handle)
+                return False
+            # The clipboard owns the memory now
+            return True
+        finally:
+            self._user32.CloseClipboard()
+
+    def close(self) -> None:
+        pass
+
+
+class _HelperUnavailable(RuntimeError):
+    """The X11 helper process could not be started or stopped responding."""
+
+
+class _X11Helper:
+    """Client for the persistent X11 clipboard helper process.
+
+    The helper is started on the first copy (or by warm_up()) and
+    restarted once if it has died. If that fails too, this and all later
+    copies go through the per-copy fallback command.
+    """
+
+    name = "x11-helper"
+
+    def __init__(self, fallback: Optional[_CommandClipboard] = None):
+        self._fallback = fallback
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._disabled = False
+
+    def start(self) -> None:
+        """Start the helper now so the first copy does not pay for it."""
+        with self._lock:
+            try:
+                self._ensure_started()
+            except _HelperUnavailable:
+                self._kill()
+
+    def copy(self, text: str) -> bool:
+        line = json.dumps({"text": text}) + "\n"
+        with self._lock:
+            if not self._disabled:
+                for _ in range(2):
+                    try:
+                        self._ensure_started()
+                        self._proc.stdin.write(line)
+                        self._proc.stdin.flush()
+                        return self._read_line(_HELPER_COPY_TIMEOUT) == "ok"
+                    except (OSError, ValueError, _HelperUnavailable):
+                        self._kill()
+                self._disabled = True
+        return self._fallback.copy(text) if self._fallback else False
+
+    def close(self) -> None:
+        """Close the helper's stdin; it hands off the clipboard and exits."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+            if proc is not None:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+    def _ensure_started(self) -> None:
+        """Spawn the helper if it is not running. Caller holds the lock."""
+        if self._proc is not None and self._proc.poll() is None:
+            return
+
+        # Make sure the child can import this package even when it is not installed
+        env = os.environ.copy()
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "screenshot_mcp.clipboard"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+            # Not killed with our process group on Ctrl+C, so it can hand off
+            start_new_session=True,
+        )
+        if self._read_line(_HELPER_START_TIMEOUT) != "ready":
+            raise _HelperUnavailable("Clipboard helper failed to start.")
+
+    def _read_line(self, timeout: float) -> str:
+        """Read one line from the helper, or raise if none arrives in time."""
+        stdout = self._proc.stdout
+        ready, _, _ = select.select([stdout], [], [], timeout)
+        if not ready:
+            raise _HelperUnavailable("Clipboard helper did not respond.")
+        line = stdout.readline()
+        if not line:
+            raise _HelperUnavailable("Clipboard helper exited.")
+        return line.strip()
+
+    def _kill(self) -> None:
+        """Kill the helper process. Caller holds the lock."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except Exception:
+            pass
+
+
+def _find_command(candidates) -> Optional[list]:
+    """First candidate command whose executable is on PATH."""
+    for command in candidates:
+        path = shutil.which(command[0])
+        if path:
+            return [path] + command[1:]
+    return None
+
+
+def _detect():
+    """Pick the clipboard backend for this platform and session (None if there is none)."""
+    if sys.platform == "win32":
+        try:
+            return _WindowsClipboard()
+        except (OSError, AttributeError):
+            clip = shutil.which("clip")
+            return _CommandClipboard([clip], encoding="utf-16le") if clip else None
+
+    if sys.platform == "darwin":
+        pbcopy = shutil.which("pbcopy")
+        return _CommandClipboard([pbcopy]) if pbcopy else None
+
+    if os.environ.get("WAYLAND_DISPLAY"):
+        wl_copy = shutil.which("wl-copy")
+        if wl_copy:
+            return _CommandClipboard([wl_copy])
+
+    x11_command = _find_command(_X11_COMMANDS)
+    fallback = _CommandClipboard(x11_command) if x11_command else None
+    if os.environ.get("DISPLAY") and importlib.util.find_spec("tkinter") is not None:
+        return _X11Helper(fallback)
+    return fallback
+
+
+_backend = None
+_detected = False
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Get the process-wide clipboard backend, detecting it on first use (None if unavailable)."""
+    global _backend, _detected
+    if not _detected:
+        with _backend_lock:
+            if not _detected:
+                _backend = _detect()
+                _detected = True
+                if _backend is not None:
+                    atexit.register(_backend.close)
+    return _backend
+
+
+def backend_name() -> Optional[str]:
+    """Name of the detected backend (e.g. 'win32', 'pbcopy', 'x11-helper'), or None."""
+    backend = get_backend()
+    return backend.name if backend is not None else None
+
+
+def copy(text: str) -> bool:
+    """Copy text to the system clipboard. Returns True if successful."""
+    backend = get_backend()
+    if backend is None:
+        return False
+    try:
+        return backend.copy(text)
+    except Exception:
+        return False
+
+
+def warm_up() -> None:
+    """Detect the backend and start the X11 helper in the background."""
+    def start():
+        backend = get_backend()
+        if isinstance(backend, _X11Helper):
+            backend.start()
+
+    threading.Thread(target=start, name="clipboard-warm-up", daemon=True).start()
+
+
+# ──────────────────────────────────────────────
+# X11 helper (runs in the child process)
+# ──────────────────────────────────────────────
+
+def _hand_off(root, text: Optional[str]) -> None:
+    """Pass the last copied text to xclip / xsel so it outlives the helper.
+
+    Skipped if another application has taken the clipboard since.
+    """
+    import tkinter as tk
+
+    if text is None:
+        return
+    try:
+        if root.clipboard_get() != text:
+            return
+    except tk.TclError:
+        return
+    command = _find_command(_X11_COMMANDS)
+    if command:
+        _CommandClipboard(command).copy(text)
+
+
+def serve_x11() -> None:
+    """Helper main loop: own the CLIPBOARD selection until stdin closes."""
+    import tkinter as tk
+
+    # The pipe to the client carries only protocol lines
+    channel = sys.stdout
+    sys.stdout = sys.stderr
+
+    def send(line: str):
+        channel.write(line + "\n")
+        channel.flush()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Warning: Clipboard helper could not open the display: {e}", file=sys.stderr)
+        return
+    root.withdraw()
+    state = {"text": None}
+
+    def on_input(fileobj, mask):
+        # The client waits for each acknowledgement, so at most one line
+        # is ever pending and nothing is left behind in stdin's buffer
+        line = sys.stdin.readline()
+        if not line:
+            root.tk.deletefilehandler(sys.stdin)
+            _hand_off(root, state["text"])
+            root.destroy()
+            return
+        try:
+            text = json.loads(line)["text"]
+            root.clipboard_clear()
+            root.clipboard_append(text)
+            state["text"] = text
+        except Exception as e:
+            print(f"Warning: Clipboard helper could not copy: {e}", file=sys.stderr)
+            send("error")
+            return
+        send("ok")
+
+    root.tk.createfilehandler(sys.stdin, tk.READABLE, on_input)
+    send("ready")
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    serve_x11()
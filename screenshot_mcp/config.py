@@ -8,8 +8,10 @@ from a JSON config file in the user's home directory.
 import json
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 # Default configuration values
@@ -23,11 +25,78 @@ DEFAULTS = {
     "auto_paste_path": False,
     "overlay_color": "#00aaff",
     "overlay_opacity": 0.3,
+    "collect_timings": True,  # Per-stage capture timings (screenshot_stats / --stats)
+    # Image encoder settings. Values left as None come from the preset.
+    "encoder": {
+        "preset": "balanced",
+        "compress_level": None,  # PNG zlib level 0-9
+        "optimize": None,        # PNG/JPEG extra optimization pass
+        "quality": None,         # JPEG/WebP quality 1-100
+        "method": None,          # WebP effort 0 (fast) - 6 (small)
+        "lossless": None,        # WebP lossless mode
+    },
+    # Downscale captures before encoding to save tokens/bandwidth (0 = no limit)
+    "downscale": {
+        "max_dimension": 0,      # Longest side in pixels
+        "max_megapixels": 0,     # Total pixel budget in megapixels
+        "resample": "bilinear",  # nearest, box, bilinear, hamming, bicubic, lanczos
+    },
+    # Watch mode: sample a region periodically, save only when it changes
+    "watch": {
+        "interval_ms": 1000,     # Time between samples
+        "threshold": 0.01,       # Fraction of (downsampled) pixels that must change
+    },
+    # Delete the oldest screenshots saved by this tool beyond these limits (0 = no limit)
+    "retention": {
+        "max_count": 0,          # Number of screenshots to keep
+        "max_bytes": 0,          # Total size of screenshots to keep
+        "max_age_days": 0,       # Delete screenshots older than this
+    },
 }
 
+# Named encoder presets, selectable via encoder.preset
+ENCODER_PRESETS = {
+    # Fast-write mode: minimal compression effort, larger files
+    "fastest": {"compress_level": 1, "optimize": False, "quality": 85, "method": 0, "lossless": False},
+    # Pillow's default PNG level and WebP method; quality 85 for JPEG and WebP (Pillow: 75 and 80)
+    "balanced": {"compress_level": 6, "optimize": False, "quality": 85, "method": 4, "lossless": False},
+    # Maximum compression effort, slowest encode
+    "smallest": {"compress_level": 9, "optimize": True, "quality": 80, "method": 6, "lossless": False},
+}
+
+
+# Pillow resampling filters accepted by downscale.resample (Image.Resampling names)
+RESAMPLE_FILTERS = ("nearest", "box", "bilinear", "hamming", "bicubic", "lanczos")
+
+# Inclusive (min, max) bounds of numeric settings; None = unbounded
+_NUMERIC_BOUNDS = {
+    "overlay_opacity": (0, 1),
+    "encoder.compress_level": (0, 9),
+    "encoder.quality": (1, 100),
+    "encoder.method": (0, 6),
+    "downscale.max_dimension": (0, None),
+    "downscale.max_megapixels": (0, None),
+    "watch.interval_ms": (1, None),
+    "watch.threshold": (0, 1),
+    "retention.max_count": (0, None),
+    "retention.max_bytes": (0, None),
+    "retention.max_age_days": (0, None),
+}
+
+
+_config_dir: Optional[Path] = None
+
+# Parsed config.json, reused while the file's (mtime, size) is unchanged
+_config_cache = {"key": None, "snapshot": None}
+_config_lock = threading.Lock()
+
 
 def get_config_dir() -> Path:
-    """Get the configuration directory path."""
+    """Get the configuration directory path (created on first call)."""
+    global _config_dir
+    if _config_dir is not None:
+        return _config_dir
+
     if sys.platform == "win32":
         base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
     elif sys.platform == "darwin":
@@ -37,6 +106,7 @@ def get_config_dir() -> Path:
 
     config_dir = base / "claude-screenshot-mcp"
     config_dir.mkdir(parents=True, exist_ok=True)
+    _config_dir = config_dir
     return config_dir
 
 
@@ -52,16 +122,64 @@ def get_screenshots_dir() -> Path:
     return screenshots_dir
 
 
-def load_config() -> dict:
-    """Load configuration from disk, merging with defaults."""
-    config = DEFAULTS.copy()
+def _config_file_key(config_path: Path) -> Optional[tuple]:
+    """Identify the current version of the config file by (mtime, size)."""
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _invalidate_config_cache() -> None:
+    with _config_lock:
+        _config_cache["key"] = _config_cache["snapshot"] = None
+
+
+def load_config() -> Mapping:
+    """Load configuration, merged with defaults, as a read-only snapshot.
+
+    The parsed file is cached and reused until config.json's modification
+    time or size changes (or it is saved through this module), so repeated
+    calls cost a single stat(). Sections are read-only mappings too; use
+    config_to_dict() for a mutable or JSON-serializable copy.
+    """
     config_path = get_config_path()
+    key = _config_file_key(config_path)
+    with _config_lock:
+        if _config_cache["snapshot"] is not None and _config_cache["key"] == key:
+            return _config_cache["snapshot"]
+
+    config = _read_config(config_path)
+    snapshot = MappingProxyType({
+        k: MappingProxyType(v) if isinstance(v, dict) else v for k, v in config.items()
+    })
+    with _config_lock:
+        _config_cache["key"] = key
+        _config_cache["snapshot"] = snapshot
+    return snapshot
+
+
+def config_to_dict(config: Mapping) -> dict:
+    """Mutable, JSON-serializable copy of a config snapshot."""
+    return {k: dict(v) if isinstance(v, Mapping) else v for k, v in config.items()}
+
+
+def _read_config(config_path: Path) -> dict:
+    """Read config.json from disk, merging with defaults."""
+    # Copy nested sections so callers never mutate DEFAULTS
+    config = {k: dict(v) if isinstance(v, dict) else v for k, v in DEFAULTS.items()}
 
     if config_path.exists():
         try:
             with open(config_path, "r") as f:
                 user_config = json.load(f)
-            config.update(user_config)
+            for key, value in user_config.items():
+                # Merge sections so a partial section keeps the remaining defaults
+                if isinstance(config.get(key), dict) and isinstance(value, dict):
+                    config[key].update(value)
+                else:
+                    config[key] = value
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load config from {config_path}: {e}", file=sys.stderr)
 
@@ -73,25 +191,88 @@ def load_config() -> dict:
     return config
 
 
-def save_config(config: dict) -> None:
+def save_config(config: Mapping) -> None:
     """Save configuration to disk."""
     config_path = get_config_path()
     try:
         with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
+            json.dump(config_to_dict(config), f, indent=2)
     except IOError as e:
         print(f"Warning: Could not save config to {config_path}: {e}", file=sys.stderr)
+    finally:
+        # Don't rely on the mtime alone: coarse timestamps can miss a rewrite
+        _invalidate_config_cache()
+
+
+def valid_config_keys() -> list:
+    """All keys accepted by update_config(), with sections as 'section.key'."""
+    keys = []
+    for key, default in DEFAULTS.items():
+        if isinstance(default, dict):
+            keys.extend(f"{key}.{sub}" for sub in default)
+        else:
+            keys.append(key)
+    return keys
+
 
+def update_config(key: str, value) -> Mapping:
+    """Update a single configuration value and save.
 
-def update_config(key: str, value) -> dict:
-    """Update a single configuration value and save."""
-    config = load_config()
-    if key in DEFAULTS:
+    Keys inside a section are addressed with a dot, e.g. 'encoder.preset'.
+
+    Returns:
+        The new configuration snapshot
+    """
+    config = config_to_dict(load_config())
+    section, _, sub = key.partition(".")
+    if sub and isinstance(DEFAULTS.get(section), dict) and sub in DEFAULTS[section]:
+        _validate(key, value, DEFAULTS[section][sub])
+        config[section][sub] = value
+        save_config(config)
+    elif not sub and key in DEFAULTS and not isinstance(DEFAULTS[key], dict):
+        _validate(key, value, DEFAULTS[key])
         config[key] = value
         save_config(config)
     else:
-        raise ValueError(f"Unknown config key: {key}. Valid keys: {list(DEFAULTS.keys())}")
-    return config
+        raise ValueError(f"Unknown config key: {key}. Valid keys: {valid_config_keys()}")
+    return load_config()
+
+
+def _validate(key: str, value, default) -> None:
+    """Reject values that would make every later capture fail."""
+    if key == "encoder.preset" and value not in ENCODER_PRESETS:
+        raise ValueError(f"Unknown encoder preset: {value}. Valid presets: {list(ENCODER_PRESETS.keys())}")
+    if key == "downscale.resample" and str(value).lower() not in RESAMPLE_FILTERS:
+        raise ValueError(f"Unknown resample filter: {value}. Valid filters: {list(RESAMPLE_FILTERS)}")
+    bounds = _NUMERIC_BOUNDS.get(key)
+    if bounds is None or (value is None and default is None):
+        # Encoder overrides may be cleared (None = use the preset)
+        return
+    low, high = bounds
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or value < low
+        or (high is not None and value > high)
+    ):
+        expected = f"from {low} to {high}" if high is not None else f"of at least {low}"
+        raise ValueError(f"Invalid value for {key}: {value!r}. Expected a number {expected}.")
+
+
+def resolve_encoder(encoder: Optional[Mapping] = None) -> dict:
+    """Resolve an encoder config section into concrete encoder options.
+
+    Starts from the named preset (default 'balanced') and applies any
+    explicitly set (non-None) option on top of it.
+    """
+    encoder = encoder or {}
+    preset = encoder.get("preset") or DEFAULTS["encoder"]["preset"]
+    if preset not in ENCODER_PRESETS:
+        print(f"Warning: Unknown encoder preset '{preset}', using 'balanced'", file=sys.stderr)
+        preset = "balanced"
+    options = dict(ENCODER_PRESETS[preset])
+    options.update({k: v for k, v in encoder.items() if k in options and v is not None})
+    return options
 
 
 def _get_last_region_path() -> Path:
@@ -136,3 +317,61 @@ def load_last_region() -> Optional[dict]:
         return data
     except (json.JSONDecodeError, IOError, ValueError):
         return None
+
+
+def _get_last_capture_path() -> Path:
+    """Get the path to the last_capture.json file."""
+    return get_config_dir() / "last_capture.json"
+
+
+def save_last_capture(
+    region: dict,
+    digest: str,
+    path: str,
+    tiles: Optional[list] = None,
+    settings: Optional[dict] = None,
+    scale: Optional[float] = None,
+    original_size: Optional[dict] = None,
+) -> None:
+    """Save the content hashes and file of the last recapture of a region.
+
+    Used to skip re-encoding when the region has not changed since (and the
+    file was saved with the same settings), and to report which tiles
+    changed between recaptures. scale and original_size describe the saved
+    file, so they can be reported again when it is reused.
+    """
+    capture_path = _get_last_capture_path()
+    record = {
+        "region": region, "digest": digest, "path": path, "tiles": tiles,
+        "settings": settings, "scale": scale, "original_size": original_size,
+    }
+    try:
+        with open(capture_path, "w") as f:
+            json.dump(record, f)
+    except IOError as e:
+        print(f"Warning: Could not save last capture to {capture_path}: {e}", file=sys.stderr)
+
+
+def load_last_capture(region: dict) -> Optional[dict]:
+    """Load the last recapture record, if it was taken of the given region.
+
+    Returns:
+        Dict with region, digest, path, tiles, settings, scale and
+        original_size keys, or None if not
+        available or if the last recapture was of a different region.
+    """
+    capture_path = _get_last_capture_path()
+    if not capture_path.exists():
+        return None
+
+    try:
+        with open(capture_path, "r") as f:
+            data = json.load(f)
+        if not {"region", "digest", "path"}.issubset(data.keys()):
+            return None
+        keys = ("x", "y", "width", "height")
+        if any(data["region"].get(k) != region.get(k) for k in keys):
+            return None
+        return data
+    except (json.JSONDecodeError, IOError, ValueError, AttributeError):
+        return None
@@ -14,21 +14,35 @@ Usage:
     claude-screenshot-daemon --hotkey f9              # Single key hotkey
     claude-screenshot-daemon --debug                  # Show all key presses (for troubleshooting)
     claude-screenshot-daemon --set-hotkey ctrl+alt+s  # Save new hotkey to config and start
+    claude-screenshot-daemon --stats                  # Per-stage capture timings of the running daemon
 """
 
 import argparse
 import atexit
 import json
 import os
+import queue
 import sys
 import signal
 import tempfile
+import threading
 import time
 import subprocess
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from pathlib import Path
 
-from .config import load_config, update_config, get_config_path, get_config_dir, save_last_region, load_last_region
-from .capture import select_region_and_capture, recapture_region, copy_to_clipboard
+from .config import (
+    load_config, update_config, get_config_path, get_config_dir, save_last_region, load_last_region,
+    save_last_capture, load_last_capture,
+)
+from .capture import (
+    select_region_and_capture, recapture_region, save_screenshot, copy_to_clipboard, RegionWatcher,
+    RegionSelector, get_grabber, capture_batch,
+)
+from . import clipboard
+from .catalog import reconcile as reconcile_catalog, maybe_enforce_retention
+from .ipc import DaemonServer, DaemonUnavailable, request as ipc_request
+from .stats import span, set_enabled as set_stats_enabled, snapshot as stats_snapshot, format_table
 
 
 # ──────────────────────────────────────────────
@@ -88,7 +102,7 @@ def _is_pid_our_daemon(pid: int) -> bool:
     return ("claude-screenshot" in name or "python" in name)
 
 
-def _is_daemon_running() -> bool:
+def is_daemon_running() -> bool:
     """Check if another daemon instance is already running.
 
     Returns True if a verified daemon is running, False otherwise.
@@ -179,7 +193,7 @@ def _acquire_lock() -> bool:
 
     Returns True if lock acquired, False if another instance is running.
     """
-    if _is_daemon_running():
+    if is_daemon_running():
         return False
 
     pid_file = _get_pid_file()
@@ -285,6 +299,11 @@ def _parse_hotkey_string(hotkey_str: str) -> set:
 
 def _show_notification(title: str, message: str):
     """Show a system notification (best-effort, platform-dependent)."""
+    with span("notification"):
+        _spawn_notification(title, message)
+
+
+def _spawn_notification(title: str, message: str):
     try:
         if sys.platform == "win32":
             ps_script = f"""
@@ -337,8 +356,32 @@ def _show_tray_info(hotkey: str, recapture_hotkey: str, debug: bool = False):
     print("", file=sys.stderr)
 
 
-def _on_hotkey_triggered(config: dict):
-    """Called when the capture hotkey is pressed."""
+def _notify_when_saved(saved, config: dict, message: str):
+    """Report the outcome of a background save once the file is on disk.
+
+    The path is already on the clipboard by the time this is called; the
+    notification (or error) is deferred until encoding has finished.
+    """
+    def on_done(future):
+        try:
+            path = future.result()
+        except Exception as e:
+            print(f"  >> Saving screenshot failed: {e}", file=sys.stderr)
+            return
+        if config.get("show_notification", True):
+            _show_notification("Claude Screenshot", f"{message}\n{os.path.basename(path)}")
+
+    saved.add_done_callback(on_done)
+
+
+def _on_hotkey_triggered(config: dict, selector: RegionSelector = None, on_shown=None):
+    """Called when the capture hotkey is pressed.
+
+    Args:
+        config: Current configuration
+        selector: The daemon's resident overlay (created per call if None)
+        on_shown: Called once the overlay is visible
+    """
     print("  >> Hotkey triggered! Opening region selector...", file=sys.stderr)
 
     save_dir = config["save_directory"]
@@ -353,6 +396,11 @@ def _on_hotkey_triggered(config: dict):
         overlay_opacity=overlay_opacity,
         capture_hotkey=config.get("hotkey", "ctrl+shift+q"),
         recapture_hotkey=config.get("recapture_hotkey", "ctrl+alt+q"),
+        background_save=True,
+        encoder=config.get("encoder"),
+        downscale=config.get("downscale"),
+        selector=selector,
+        on_shown=on_shown,
     )
 
     if capture_result.path:
@@ -368,21 +416,17 @@ def _on_hotkey_triggered(config: dict):
         else:
             print(f"  >> Captured: {capture_result.path}", file=sys.stderr)
 
-        if config.get("show_notification", True):
-            _show_notification(
-                "Claude Screenshot",
-                f"Saved! Path copied to clipboard.\n{os.path.basename(capture_result.path)}",
-            )
+        _notify_when_saved(capture_result.saved, config, "Saved! Path copied to clipboard.")
     else:
         print("  >> Capture cancelled (ESC / right-click / region too small).", file=sys.stderr)
 
 
-def _on_recapture_triggered(config: dict):
+def _on_recapture_triggered(config: dict, selector: RegionSelector = None, on_shown=None):
     """Called when the recapture hotkey is pressed."""
     region = load_last_region()
     if region is None:
         print("  >> No previous region saved. Falling back to interactive selector...", file=sys.stderr)
-        _on_hotkey_triggered(config)
+        _on_hotkey_triggered(config, selector, on_shown)
         return
 
     print(f"  >> Recapturing region: x={region['x']}, y={region['y']}, "
@@ -392,31 +436,145 @@ def _on_recapture_triggered(config: dict):
     fmt = config.get("image_format", "png")
 
     try:
-        path = recapture_region(
+        # The path is reserved immediately; encoding finishes in the background.
+        # Unchanged pixels skip encoding and reuse the previous file.
+        last = load_last_capture(region) or {}
+        result = recapture_region(
             x=region["x"],
             y=region["y"],
             width=region["width"],
             height=region["height"],
             save_dir=save_dir,
             fmt=fmt,
+            encoder=config.get("encoder"),
+            previous_digest=last.get("digest"),
+            previous_path=last.get("path"),
+            previous_tiles=last.get("tiles"),
+            previous_settings=last.get("settings"),
+            previous_scale=last.get("scale"),
+            previous_original_size=last.get("original_size"),
+            background_save=True,
+            downscale=config.get("downscale"),
         )
+        path = result.path
+        save_last_capture(
+            region, result.digest, path, result.tiles, result.settings, result.scale, result.original_size,
+        )
+        if result.changed_region:
+            c = result.changed_region
+            print(f"  >> Changed area: x={c['x']}, y={c['y']}, {c['width']}x{c['height']}", file=sys.stderr)
+        label = "Unchanged, reusing" if result.unchanged else "Recaptured"
 
         if config.get("copy_path_to_clipboard", True):
             copy_to_clipboard(path)
-            print(f"  >> Recaptured: {path}", file=sys.stderr)
+            print(f"  >> {label}: {path}", file=sys.stderr)
             print(f"  >> Path copied to clipboard! Paste into Claude Code with Ctrl+V", file=sys.stderr)
         else:
-            print(f"  >> Recaptured: {path}", file=sys.stderr)
+            print(f"  >> {label}: {path}", file=sys.stderr)
 
-        if config.get("show_notification", True):
-            _show_notification(
-                "Claude Screenshot",
-                f"Recaptured! Path copied to clipboard.\n{os.path.basename(path)}",
-            )
+        if result.unchanged:
+            _notify_when_saved(result.saved, config, "Unchanged since last capture. Path copied to clipboard.")
+        else:
+            _notify_when_saved(result.saved, config, "Recaptured! Path copied to clipboard.")
     except Exception as e:
         print(f"  >> Recapture failed: {e}", file=sys.stderr)
 
 
+# How long an MCP client waits for an interactive capture (seconds, as in ipc.request)
+_CAPTURE_TIMEOUT_S = 120
+
+
+def _start_ipc_server(pending: queue.Queue) -> DaemonServer:
+    """Serve capture requests from the MCP server over local IPC.
+
+    Interactive captures are queued for the main thread like hotkey
+    presses (the overlay lives there); recapture and batch requests run
+    directly on the IPC threads.
+    """
+    started = time.time()
+
+    def capture(args: dict) -> dict:
+        done = Future()
+        deadline = time.monotonic() + _CAPTURE_TIMEOUT_S
+
+        def run(config, selector, on_shown):
+            # The client gave up while this was queued behind another capture
+            if not done.set_running_or_notify_cancel():
+                return
+            # Close the overlay when the client gives up waiting for it
+            remaining_ms = max(1, int((deadline - time.monotonic()) * 1000))
+            expire = selector.root.after(remaining_ms, selector.cancel)
+            try:
+                done.set_result(select_region_and_capture(
+                    selector=selector, on_shown=on_shown, background_save=True, **args,
+                ))
+            except Exception as e:
+                done.set_exception(e)
+            finally:
+                selector.root.after_cancel(expire)
+
+        pending.put((run, time.perf_counter()))
+        try:
+            result = done.result(timeout=_CAPTURE_TIMEOUT_S)
+        except FutureTimeout:
+            done.cancel()
+            return {"status": "error", "message": f"Region selection timed out after {_CAPTURE_TIMEOUT_S} seconds."}
+        if not result.path:
+            return {"status": "cancelled"}
+        # Encoding finished off the Tk thread; answer once the file exists
+        result.saved.result()
+        print(f"  >> Captured for MCP client: {result.path}", file=sys.stderr)
+        return {
+            "status": "ok",
+            "path": result.path,
+            "region": result.region,
+            "scale": result.scale,
+            "original_size": result.original_size,
+        }
+
+    def recapture(args: dict) -> dict:
+        result = recapture_region(**args)
+        response = {k: v for k, v in result._asdict().items() if k != "saved"}
+        response["status"] = "ok"
+        return response
+
+    def batch(args: dict) -> dict:
+        return {"status": "ok", "captures": capture_batch(**args)}
+
+    def stats(args: dict) -> dict:
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - started, 1),
+            "requests": dict(server.requests),
+            "timings": stats_snapshot(),
+        }
+
+    server = DaemonServer({"capture": capture, "recapture": recapture, "batch": batch, "stats": stats})
+    server.start()
+    return server
+
+
+# How often the retention sweeper runs (seconds)
+_RETENTION_SWEEP_S = 600
+
+
+def _retention_sweeper():
+    """Background thread: reconcile the catalog, then enforce retention periodically."""
+    # Drop catalog entries for screenshots deleted while we were not running
+    reconcile_catalog()
+    while True:
+        result = maybe_enforce_retention(load_config().get("retention"), min_interval=0)
+        if result and result[0]:
+            removed, freed = result
+            print(f"  >> Retention: deleted {removed} old screenshot(s), freed {freed / 2**20:.1f} MiB", file=sys.stderr)
+        time.sleep(_RETENTION_SWEEP_S)
+
+
+# How often the main thread checks for queued hotkey presses (milliseconds)
+_HOTKEY_POLL_MS = 10
+
+
 def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = None, debug: bool = False, replace_existing: bool = False):
     """Main daemon entry point. Uses pynput for global hotkey listening."""
     # Instance lock — prevent multiple daemons
@@ -431,11 +589,15 @@ def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = Non
         sys.exit(0)
 
     config = load_config()
+    set_stats_enabled(config.get("collect_timings", True))
     hotkey = hotkey_override or config.get("hotkey", "ctrl+shift+q")
     recapture_hotkey = recapture_hotkey_override or config.get("recapture_hotkey", "ctrl+alt+q")
 
     _show_tray_info(hotkey, recapture_hotkey, debug=debug)
 
+    # Reconcile the catalog, then keep the screenshot directories within the retention limits
+    threading.Thread(target=_retention_sweeper, name="retention-sweeper", daemon=True).start()
+
     try:
         from pynput import keyboard as pynput_keyboard
     except ImportError:
@@ -453,9 +615,36 @@ def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = Non
     print(f"  Listening for recapture keys:  {recapture_hotkey_names}", file=sys.stderr)
     print("", file=sys.stderr)
 
+    # tkinter must run on the main thread, so the overlay lives here for the
+    # whole session: a withdrawn root with the per-monitor windows already
+    # built. A hotkey only refreshes the frozen frames and shows them.
+    selector = RegionSelector(
+        overlay_color=config.get("overlay_color", "#00aaff"),
+        overlay_opacity=config.get("overlay_opacity", 0.3),
+        capture_hotkey=hotkey,
+        recapture_hotkey=recapture_hotkey,
+    )
+    try:
+        selector.prepare(list(get_grabber().monitors[1:]))
+    except Exception as e:
+        print(f"Warning: Could not prepare the overlay ahead of time: {e}", file=sys.stderr)
+    if config.get("copy_path_to_clipboard", True):
+        clipboard.warm_up()
+
+    # The keyboard listener runs on its own thread and only queues hotkey
+    # presses; the main thread picks them up from the Tk event loop
+    pending = queue.Queue()
+    capturing = threading.Event()
+
+    # Let the MCP server delegate captures to this (warm) process
+    ipc_server = None
+    try:
+        ipc_server = _start_ipc_server(pending)
+    except Exception as e:
+        print(f"Warning: Could not start the IPC endpoint, MCP captures will not use the daemon: {e}", file=sys.stderr)
+
     # Track currently pressed normalized key names
     current_keys = set()
-    capturing = False
 
     # Sort hotkeys by length (longer first) to avoid subset collisions
     # e.g., ctrl+alt+q should be checked before ctrl+q
@@ -466,8 +655,7 @@ def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = Non
     hotkey_actions.sort(key=lambda pair: len(pair[0]), reverse=True)
 
     def on_press(key):
-        nonlocal capturing
-        if capturing:
+        if capturing.is_set():
             return
 
         normalized = _normalize_key(key)
@@ -479,12 +667,9 @@ def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = Non
         # Check hotkeys (longer combos first to avoid subset collisions)
         for keys, handler in hotkey_actions:
             if keys.issubset(current_keys):
-                capturing = True
+                capturing.set()
                 current_keys.clear()
-
-                current_config = load_config()
-                handler(current_config)
-                capturing = False
+                pending.put((handler, time.perf_counter()))
                 break
 
     def on_release(key):
@@ -494,6 +679,30 @@ def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = Non
         if debug:
             print(f"  [debug] released: {key} -> normalized: '{normalized}'", file=sys.stderr)
 
+    def run_pending_hotkey():
+        """Handle a queued hotkey press on the main (Tk) thread."""
+        if not listener.is_alive():
+            selector.root.quit()
+            return
+        try:
+            handler, pressed_at = pending.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            def report_shown():
+                latency = (time.perf_counter() - pressed_at) * 1000
+                print(f"  [debug] overlay visible {latency:.1f} ms after hotkey", file=sys.stderr)
+
+            try:
+                current_config = load_config()
+                set_stats_enabled(current_config.get("collect_timings", True))
+                handler(current_config, selector, report_shown if debug else None)
+            except Exception as e:
+                print(f"  >> Capture failed: {e}", file=sys.stderr)
+            finally:
+                capturing.clear()
+        selector.root.after(_HOTKEY_POLL_MS, run_pending_hotkey)
+
     # Start the listener
     listener = pynput_keyboard.Listener(on_press=on_press, on_release=on_release)
     listener.start()
@@ -508,16 +717,108 @@ def run_daemon(hotkey_override: str = None, recapture_hotkey_override: str = Non
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Keep the main thread alive
+    # Run the Tk event loop on the main thread until the listener stops.
+    # The periodic hotkey poll also gives Python a chance to run signal handlers.
+    selector.root.after(_HOTKEY_POLL_MS, run_pending_hotkey)
     try:
-        while listener.is_alive():
-            time.sleep(0.5)
+        selector.root.mainloop()
     except KeyboardInterrupt:
         print("\n  Daemon stopped.", file=sys.stderr)
+    finally:
         listener.stop()
+        if ipc_server is not None:
+            ipc_server.stop()
+        selector.close()
         _release_lock()
 
 
+def run_watch(region: dict = None, interval_ms: int = None, threshold: float = None):
+    """Watch mode: sample a region periodically and save it only when it changes.
+
+    Runs in the foreground until Ctrl+C. Each saved path is printed and
+    (if enabled) copied to the clipboard, so the latest state of the region
+    is always ready to paste.
+    """
+    config = load_config()
+    watch = config.get("watch") or {}
+    interval = (interval_ms or watch.get("interval_ms", 1000)) / 1000
+    threshold = threshold if threshold is not None else watch.get("threshold", 0.01)
+
+    region = region or load_last_region()
+    if region is None:
+        print("  [!] No region to watch. Capture a region first or pass --watch-region x,y,w,h.", file=sys.stderr)
+        sys.exit(1)
+
+    print("", file=sys.stderr)
+    print("  Claude Screenshot Watch", file=sys.stderr)
+    print("  =======================", file=sys.stderr)
+    print(f"  Region:    x={region['x']}, y={region['y']}, {region['width']}x{region['height']}", file=sys.stderr)
+    print(f"  Interval:  {interval * 1000:.0f} ms", file=sys.stderr)
+    print(f"  Threshold: {threshold:.2%} of pixels", file=sys.stderr)
+    print("  Press Ctrl+C to stop.", file=sys.stderr)
+    print("", file=sys.stderr)
+
+    watcher = RegionWatcher(region["x"], region["y"], region["width"], region["height"], threshold=threshold)
+    try:
+        while True:
+            tick = time.monotonic()
+            sample = watcher.sample()
+            if sample.changed:
+                path = save_screenshot(
+                    sample.image,
+                    save_dir=config["save_directory"],
+                    fmt=config.get("image_format", "png"),
+                    encoder=config.get("encoder"),
+                    downscale=config.get("downscale"),
+                )
+                print(f"  >> Changed ({sample.change_ratio:.2%}): {path}", file=sys.stderr)
+                if config.get("copy_path_to_clipboard", True):
+                    copy_to_clipboard(path)
+            time.sleep(max(0.0, interval - (time.monotonic() - tick)))
+    except KeyboardInterrupt:
+        print("\n  Watch stopped.", file=sys.stderr)
+
+
+def show_stats():
+    """Print the running daemon's per-stage capture timings (queried over IPC)."""
+    if not is_daemon_running():
+        print("  Daemon is not running.", file=sys.stderr)
+        sys.exit(1)
+    try:
+        response = ipc_request("stats", timeout=5)
+    except (DaemonUnavailable, subprocess.TimeoutExpired) as e:
+        print(f"  [!] Could not query the daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    if response.get("status") != "ok":
+        print(f"  [!] Daemon error: {response.get('message', '')}", file=sys.stderr)
+        sys.exit(1)
+
+    print("", file=sys.stderr)
+    print(f"  Daemon PID {response['pid']}, up {response['uptime_s']:.0f}s", file=sys.stderr)
+    requests = response.get("requests") or {}
+    if requests:
+        served = ", ".join(f"{cmd}: {n}" for cmd, n in sorted(requests.items()))
+        print(f"  IPC requests: {served}", file=sys.stderr)
+    timings = response.get("timings") or {}
+    if timings:
+        print("", file=sys.stderr)
+        print(format_table(timings), file=sys.stderr)
+    else:
+        print("  No timings recorded yet (or collect_timings is off).", file=sys.stderr)
+    print("", file=sys.stderr)
+
+
+def _parse_region_string(region_str: str) -> dict:
+    """Parse 'x,y,width,height' into a region dict."""
+    try:
+        x, y, width, height = (int(v.strip()) for v in region_str.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected x,y,width,height, got: {region_str}")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError("Region width and height must be positive")
+    return {"x": x, "y": y, "width": width, "height": height}
+
+
 def main():
     """CLI entry point for the daemon."""
     parser = argparse.ArgumentParser(
@@ -533,6 +834,9 @@ Examples:
   claude-screenshot-daemon --debug                          Show key presses for troubleshooting
   claude-screenshot-daemon --restart                        Safely stop existing daemon and start fresh
   claude-screenshot-daemon --stop                           Stop the running daemon
+  claude-screenshot-daemon --stats                          Show per-stage capture timings of the running daemon
+  claude-screenshot-daemon --watch                          Save the last region whenever it changes
+  claude-screenshot-daemon --watch --watch-region 0,0,800,600 --watch-interval 500
         """,
     )
     parser.add_argument(
@@ -584,12 +888,41 @@ Examples:
         action="store_true",
         help="Check if the daemon is running and exit",
     )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show per-stage capture timings (p50/p95/p99) of the running daemon and exit",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch mode: sample a region periodically and save it only when it changes",
+    )
+    parser.add_argument(
+        "--watch-region",
+        type=_parse_region_string,
+        default=None,
+        help="Region to watch as x,y,width,height (default: the last selected region)",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=int,
+        default=None,
+        help="Milliseconds between samples in watch mode (default: config watch.interval_ms)",
+    )
+    parser.add_argument(
+        "--watch-threshold",
+        type=float,
+        default=None,
+        help="Fraction of pixels (0-1) that must change to save in watch mode (default: config watch.threshold)",
+    )
 
     args = parser.parse_args()
 
     # --status: just check and report
     if args.status:
-        if _is_daemon_running():
+        if is_daemon_running():
             pid_file = _get_pid_file()
             with open(pid_file, "r") as f:
                 data = json.load(f)
@@ -599,6 +932,11 @@ Examples:
             print("  Daemon is not running.", file=sys.stderr)
             sys.exit(1)
 
+    # --stats: query the running daemon over IPC
+    if args.stats:
+        show_stats()
+        sys.exit(0)
+
     # --stop: safely stop the running daemon and exit
     if args.stop:
         if _stop_existing_daemon():
@@ -607,6 +945,11 @@ Examples:
             print("  No daemon was running.", file=sys.stderr)
         sys.exit(0)
 
+    # --watch: foreground change-triggered capture loop instead of hotkeys
+    if args.watch:
+        run_watch(region=args.watch_region, interval_ms=args.watch_interval, threshold=args.watch_threshold)
+        sys.exit(0)
+
     # If --set-hotkey, save it to config first
     if args.set_hotkey:
         update_config("hotkey", args.set_hotkey)
@@ -0,0 +1,187 @@
+"""
+Local IPC endpoint of the hotkey daemon.
+
+The daemon already has mss, Pillow and tkinter loaded and its overlay
+built, so when it is running the MCP server delegates captures to it
+instead of doing them itself. The endpoint is a Unix domain socket in the
+config directory (a named pipe on Windows), served with
+multiprocessing.connection, which also authenticates clients with a
+per-user key stored in the config directory.
+
+Protocol (each message is one JSON object on a single line):
+    Client -> daemon:  {"cmd": "recapture", "args": {...}}
+    Daemon -> client:  {"status": "ok", ...}
+                       {"status": "cancelled"}
+                       {"status": "error", "message": "..."}
+
+Commands:
+    capture    Interactive region selection (kwargs for select_region_and_capture)
+    recapture  recapture_region() kwargs; the response carries the RecaptureResult fields
+    batch      capture_batch() kwargs; the response carries "captures"
+    stats      Daemon status (pid, uptime, requests served)
+"""
+
+import getpass
+import json
+import os
+import subprocess
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, Optional
+
+from .config import get_config_dir
+
+
+class DaemonUnavailable(ConnectionError):
+    """Raised when no daemon is listening on the IPC endpoint."""
+
+
+def get_address() -> str:
+    """Get the daemon's IPC address (socket path, or pipe name on Windows)."""
+    if sys.platform == "win32":
+        return rf"\\.\pipe\claude-screenshot-mcp-{getpass.getuser()}"
+    return str(get_config_dir() / "daemon.sock")
+
+
+def _family() -> str:
+    return "AF_PIPE" if sys.platform == "win32" else "AF_UNIX"
+
+
+def _get_authkey() -> bytes:
+    """Get the shared secret clients authenticate with, creating it on first use."""
+    key_path = get_config_dir() / "daemon.key"
+    try:
+        return key_path.read_bytes()
+    except FileNotFoundError:
+        pass
+    try:
+        # Readable by the current user only
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another process created it first
+        return key_path.read_bytes()
+    key = os.urandom(32)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def _encode(message: dict) -> bytes:
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+# ──────────────────────────────────────────────
+# Daemon side
+# ──────────────────────────────────────────────
+
+class DaemonServer:
+    """Serve IPC requests with the daemon's command handlers.
+
+    Each handler takes the request's args dict and returns the response
+    dict. Connections are handled on a small fixed pool, so requests run
+    concurrently without creating a new thread (and a new per-thread mss
+    instance) per connection.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[[dict], dict]], max_workers: int = 4):
+        self.handlers = handlers
+        self.requests = Counter()
+        self._listener: Optional[Listener] = None
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="daemon-ipc")
+
+    def start(self) -> None:
+        """Bind the endpoint and start accepting connections in the background."""
+        address = get_address()
+        if _family() == "AF_UNIX":
+            # A socket file left behind by a daemon that did not exit cleanly.
+            # Only the daemon holding the PID lock gets here.
+            try:
+                os.unlink(address)
+            except FileNotFoundError:
+                pass
+        self._listener = Listener(address, family=_family(), authkey=_get_authkey())
+        if _family() == "AF_UNIX":
+            os.chmod(address, 0o600)
+        threading.Thread(target=self._accept_loop, name="daemon-ipc-accept", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop accepting connections and remove the socket."""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        try:
+            listener.close()
+        except OSError:
+            pass
+        self._pool.shutdown(wait=False)
+
+    def _accept_loop(self) -> None:
+        while self._listener is not None:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._listener is None:
+                    return
+                # Failed authentication or a client that gave up mid-handshake
+                continue
+            self._pool.submit(self._serve, conn)
+
+    def _serve(self, conn) -> None:
+        """Answer requests on one connection until the client disconnects."""
+        with conn:
+            while True:
+                try:
+                    request = json.loads(conn.recv_bytes())
+                except (EOFError, OSError):
+                    return
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    conn.send_bytes(_encode({"status": "error", "message": f"Invalid request: {e}"}))
+                    continue
+
+                cmd = request.get("cmd")
+                handler = self.handlers.get(cmd)
+                if handler is None:
+                    response = {"status": "error", "message": f"Unknown command: {cmd}"}
+                else:
+                    self.requests[cmd] += 1
+                    try:
+                        response = handler(request.get("args") or {})
+                    except Exception as e:
+                        response = {"status": "error", "message": str(e)}
+                try:
+                    conn.send_bytes(_encode(response))
+                except OSError:
+                    return
+
+
+# ──────────────────────────────────────────────
+# Client side
+# ──────────────────────────────────────────────
+
+def request(cmd: str, args: Optional[dict] = None, timeout: float = 120) -> dict:
+    """Send one command to the running daemon and wait for its response.
+
+    Raises:
+        DaemonUnavailable: Nothing is listening on the endpoint (or the
+            daemon rejected the connection).
+        subprocess.TimeoutExpired: No response within `timeout` seconds.
+    """
+    try:
+        conn = Client(get_address(), family=_family(), authkey=_get_authkey())
+    except (OSError, EOFError) as e:
+        raise DaemonUnavailable(f"Screenshot daemon is not reachable: {e}") from e
+    except Exception as e:
+        # multiprocessing.AuthenticationError
+        raise DaemonUnavailable(f"Screenshot daemon rejected the connection: {e}") from e
+
+    with conn:
+        try:
+            conn.send_bytes(_encode({"cmd": cmd, "args": args or {}}))
+            if not conn.poll(timeout):
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            return json.loads(conn.recv_bytes())
+        except (OSError, EOFError) as e:
+            raise DaemonUnavailable(f"Screenshot daemon closed the connection: {e}") from e
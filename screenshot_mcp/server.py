@@ -4,33 +4,65 @@ MCP Server for Claude Screenshot.
 
 Provides tools for Claude Code to capture screen regions interactively
 or capture the full screen. Screenshots are saved to disk and the file
-path is returned so Claude Code can reference the image.
+path is returned so Claude Code can reference the image; capture tools
+can also return the image itself as MCP image content (return_image).
 """
 
+import asyncio
+import functools
 import json
 import os
-import sys
 import subprocess
-import threading
-from typing import Optional
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Mapping, Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Image as MCPImage
 from pydantic import BaseModel, Field, ConfigDict
 
-from .config import load_config, update_config, get_screenshots_dir, save_last_region, load_last_region, DEFAULTS
+from .config import (
+    load_config, update_config, save_last_region, load_last_region,
+    save_last_capture, load_last_capture, valid_config_keys, config_to_dict,
+)
 from .capture import (
-    select_region_and_capture,
+    budget_scale,
+    capture_batch,
     capture_full_screen,
     capture_region,
+    encode_screenshot,
     recapture_region,
+    save_encoded_async,
     save_screenshot,
+    RecaptureResult,
+    RegionWatcher,
     copy_to_clipboard,
 )
+from .catalog import latest_screenshots, maybe_enforce_retention
+from .daemon import is_daemon_running
+from . import clipboard, ipc, stats
+from .worker import CaptureWorker, CaptureWorkerError
 
 # Initialize MCP server
 mcp = FastMCP("screenshot_mcp")
 
+# Blocking work (screen grabs, image encoding, clipboard, the interactive
+# selector and directory scans) runs on this pool so the event loop keeps
+# serving other tool calls, e.g. config reads while an overlay is open.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="screenshot")
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking callable on the worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+# The capture tools return a JSON string, or [JSON string, image] with
+# return_image, and have no return annotation: FastMCP derives an output
+# schema from the annotation, and image content cannot be expressed in one.
+
 
 # ──────────────────────────────────────────────
 # Input Models
@@ -55,6 +87,26 @@ class CaptureRegionInput(BaseModel):
             "If not specified, a timestamp-based name is generated."
         ),
     )
+    max_dimension: Optional[int] = Field(
+        default=None,
+        description=(
+            "Downscale so the longest side is at most this many pixels before saving "
+            "(saves tokens). Overrides the configured downscale.max_dimension; 0 = no limit."
+        ),
+        ge=0,
+    )
+    max_megapixels: Optional[float] = Field(
+        default=None,
+        description=(
+            "Downscale so the image has at most this many megapixels before saving. "
+            "Overrides the configured downscale.max_megapixels; 0 = no limit."
+        ),
+        ge=0,
+    )
+    return_image: bool = Field(
+        default=False,
+        description="Also return the screenshot itself as image content, so it does not have to be read from disk.",
+    )
 
 
 class CaptureFullScreenInput(BaseModel):
@@ -70,6 +122,36 @@ class CaptureFullScreenInput(BaseModel):
         default=None,
         description="Custom filename for the screenshot.",
     )
+    max_dimension: Optional[int] = Field(
+        default=None,
+        description=(
+            "Downscale so the longest side is at most this many pixels before saving "
+            "(saves tokens). Overrides the configured downscale.max_dimension; 0 = no limit."
+        ),
+        ge=0,
+    )
+    max_megapixels: Optional[float] = Field(
+        default=None,
+        description=(
+            "Downscale so the image has at most this many megapixels before saving. "
+            "Overrides the configured downscale.max_megapixels; 0 = no limit."
+        ),
+        ge=0,
+    )
+    return_image: bool = Field(
+        default=False,
+        description=(
+            "Return the screenshot itself as image content, encoded in memory (with the "
+            "downscale budget applied), instead of only a file path."
+        ),
+    )
+    save_file: bool = Field(
+        default=True,
+        description=(
+            "With return_image: also save the file, written in the background after the "
+            "image is returned. False skips the disk entirely."
+        ),
+    )
 
 
 class CaptureCoordinatesInput(BaseModel):
@@ -83,6 +165,38 @@ class CaptureCoordinatesInput(BaseModel):
     height: int = Field(..., description="Height of the region (pixels)", ge=1)
     save_directory: Optional[str] = Field(default=None, description="Directory to save the screenshot.")
     filename: Optional[str] = Field(default=None, description="Custom filename.")
+    max_dimension: Optional[int] = Field(default=None, description="Max longest side in pixels (0 = no limit).", ge=0)
+    max_megapixels: Optional[float] = Field(default=None, description="Max size in megapixels (0 = no limit).", ge=0)
+    return_image: bool = Field(default=False, description="Return the screenshot as image content (encoded in memory).")
+    save_file: bool = Field(default=True, description="With return_image: also save the file, in the background.")
+
+
+class RegionSpec(BaseModel):
+    """A rectangular screen region."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    x: int = Field(..., description="Left coordinate of the region (pixels, can be negative for multi-monitor)")
+    y: int = Field(..., description="Top coordinate of the region (pixels, can be negative for multi-monitor)")
+    width: int = Field(..., description="Width of the region (pixels)", ge=1)
+    height: int = Field(..., description="Height of the region (pixels)", ge=1)
+
+
+class CaptureBatchInput(BaseModel):
+    """Input for capturing several regions from the same instant."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    regions: List[RegionSpec] = Field(
+        ...,
+        description="Regions to capture. All are cropped from one grab, so they show the same instant.",
+        min_length=1,
+        max_length=50,
+    )
+    save_directory: Optional[str] = Field(default=None, description="Directory to save the screenshots.")
+    max_dimension: Optional[int] = Field(default=None, description="Max longest side in pixels (0 = no limit).", ge=0)
+    max_megapixels: Optional[float] = Field(default=None, description="Max size in megapixels (0 = no limit).", ge=0)
+    return_image: bool = Field(default=False, description="Also return the screenshots as image content, in order.")
 
 
 class UpdateConfigInput(BaseModel):
@@ -93,12 +207,16 @@ class UpdateConfigInput(BaseModel):
     key: str = Field(
         ...,
         description=(
-            f"Configuration key to update. Valid keys: {list(DEFAULTS.keys())}"
+            f"Configuration key to update (sections use dots, e.g. 'encoder.preset'). "
+            f"Valid keys: {valid_config_keys()}"
         ),
     )
     value: str = Field(
         ...,
-        description="New value for the configuration key (as a string; booleans as 'true'/'false').",
+        description=(
+            "New value for the configuration key (as a string; booleans as 'true'/'false', "
+            "'null' to clear an encoder override)."
+        ),
     )
 
 
@@ -128,6 +246,112 @@ class RecaptureRegionInput(BaseModel):
         default=None,
         description="Custom filename for the screenshot.",
     )
+    include_changed_crop: bool = Field(
+        default=False,
+        description=(
+            "Also save an image of just the area that changed since the previous recapture "
+            "(returned as 'changed_path'), so only the difference needs to be viewed."
+        ),
+    )
+    max_dimension: Optional[int] = Field(
+        default=None,
+        description=(
+            "Downscale so the longest side is at most this many pixels before saving "
+            "(saves tokens). Overrides the configured downscale.max_dimension; 0 = no limit."
+        ),
+        ge=0,
+    )
+    max_megapixels: Optional[float] = Field(
+        default=None,
+        description=(
+            "Downscale so the image has at most this many megapixels before saving. "
+            "Overrides the configured downscale.max_megapixels; 0 = no limit."
+        ),
+        ge=0,
+    )
+    return_image: bool = Field(
+        default=False,
+        description="Also return the screenshot as image content, so it does not have to be read from disk.",
+    )
+
+
+class WatchRegionInput(BaseModel):
+    """Input for watching a region and saving it whenever it changes."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    x: Optional[int] = Field(default=None, description="Left coordinate. Omit x/y/width/height to watch the last selected region.")
+    y: Optional[int] = Field(default=None, description="Top coordinate.")
+    width: Optional[int] = Field(default=None, description="Width of the region (pixels)", ge=1)
+    height: Optional[int] = Field(default=None, description="Height of the region (pixels)", ge=1)
+    interval_ms: Optional[int] = Field(
+        default=None,
+        description="Time between samples in milliseconds (default: configured watch.interval_ms).",
+        ge=50,
+        le=60000,
+    )
+    threshold: Optional[float] = Field(
+        default=None,
+        description=(
+            "Fraction of pixels (0-1, compared on a downsampled thumbnail) that must change "
+            "for a new screenshot to be saved (default: configured watch.threshold)."
+        ),
+        ge=0,
+        le=1,
+    )
+    duration_seconds: float = Field(default=60, description="How long to watch.", gt=0, le=600)
+    max_captures: int = Field(default=10, description="Stop after saving this many screenshots.", ge=1, le=100)
+    save_directory: Optional[str] = Field(default=None, description="Directory to save the screenshots.")
+    max_dimension: Optional[int] = Field(default=None, description="Max longest side in pixels (0 = no limit).", ge=0)
+    max_megapixels: Optional[float] = Field(default=None, description="Max size in megapixels (0 = no limit).", ge=0)
+    return_image: bool = Field(default=False, description="Also return the screenshots as image content, in order.")
+
+
+class WaitForChangeInput(BaseModel):
+    """Input for waiting until a region changes."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    x: Optional[int] = Field(default=None, description="Left coordinate. Omit x/y/width/height to use the last selected region.")
+    y: Optional[int] = Field(default=None, description="Top coordinate.")
+    width: Optional[int] = Field(default=None, description="Width of the region (pixels)", ge=1)
+    height: Optional[int] = Field(default=None, description="Height of the region (pixels)", ge=1)
+    timeout_seconds: float = Field(default=30, description="Give up after this many seconds.", gt=0, le=600)
+    interval_ms: int = Field(default=250, description="Time between samples in milliseconds.", ge=20, le=10000)
+    threshold: Optional[float] = Field(
+        default=None,
+        description="Fraction of pixels (0-1) that must differ from the baseline (default: configured watch.threshold).",
+        ge=0,
+        le=1,
+    )
+    save_directory: Optional[str] = Field(default=None, description="Directory to save the screenshot.")
+    max_dimension: Optional[int] = Field(default=None, description="Max longest side in pixels (0 = no limit).", ge=0)
+    max_megapixels: Optional[float] = Field(default=None, description="Max size in megapixels (0 = no limit).", ge=0)
+    return_image: bool = Field(default=False, description="Also return the screenshot as image content.")
+
+
+class WaitForStableInput(BaseModel):
+    """Input for waiting until a region stops changing."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="forbid")
+
+    x: Optional[int] = Field(default=None, description="Left coordinate. Omit x/y/width/height to use the last selected region.")
+    y: Optional[int] = Field(default=None, description="Top coordinate.")
+    width: Optional[int] = Field(default=None, description="Width of the region (pixels)", ge=1)
+    height: Optional[int] = Field(default=None, description="Height of the region (pixels)", ge=1)
+    stable_ms: int = Field(default=1000, description="How long the region must stay unchanged (milliseconds).", ge=50, le=120000)
+    timeout_seconds: float = Field(default=30, description="Give up after this many seconds.", gt=0, le=600)
+    interval_ms: int = Field(default=250, description="Time between samples in milliseconds.", ge=20, le=10000)
+    threshold: Optional[float] = Field(
+        default=None,
+        description="Fraction of pixels (0-1) that counts as a change (default: configured watch.threshold).",
+        ge=0,
+        le=1,
+    )
+    save_directory: Optional[str] = Field(default=None, description="Directory to save the screenshot.")
+    max_dimension: Optional[int] = Field(default=None, description="Max longest side in pixels (0 = no limit).", ge=0)
+    max_megapixels: Optional[float] = Field(default=None, description="Max size in megapixels (0 = no limit).", ge=0)
+    return_image: bool = Field(default=False, description="Also return the screenshot as image content.")
 
 
 # ──────────────────────────────────────────────
@@ -144,7 +368,7 @@ class RecaptureRegionInput(BaseModel):
         "openWorldHint": False,
     },
 )
-async def screenshot_capture_region(params: CaptureRegionInput) -> str:
+async def screenshot_capture_region(params: CaptureRegionInput):
     """Launch an interactive screen region selector and capture the selected area.
 
     Opens a fullscreen transparent overlay where the user can click and drag
@@ -155,11 +379,15 @@ async def screenshot_capture_region(params: CaptureRegionInput) -> str:
         params (CaptureRegionInput): Parameters containing:
             - save_directory (Optional[str]): Where to save the screenshot
             - filename (Optional[str]): Custom filename
+            - max_dimension / max_megapixels (Optional): Downscale budget
+            - return_image (bool): Also return the image as content
 
     Returns:
         str: JSON with the file path of the captured screenshot, or error message.
+        With return_image, a list of that JSON and the image.
 
-        Success: {"status": "ok", "path": "/path/to/screenshot.png", "message": "Screenshot saved!"}
+        Success: {"status": "ok", "path": "/path/to/screenshot.png", "scale": 1.0,
+                  "original_size": {"width": ..., "height": ...}, "message": "Screenshot saved!"}
         Cancelled: {"status": "cancelled", "message": "Selection was cancelled by user."}
         Error: {"status": "error", "message": "Error description"}
     """
@@ -167,62 +395,45 @@ async def screenshot_capture_region(params: CaptureRegionInput) -> str:
         config = load_config()
         save_dir = params.save_directory or config["save_directory"]
 
-        # Run the region selector (this blocks until user finishes selecting)
-        # We need to run it in a thread since tkinter needs the main thread on some platforms
-        result_holder = {"path": None, "error": None}
-
-        def run_capture():
-            try:
-                result_holder["path"] = select_region_and_capture(
-                    save_dir=save_dir,
-                    fmt=config.get("image_format", "png"),
-                    overlay_color=config.get("overlay_color", "#00aaff"),
-                    overlay_opacity=config.get("overlay_opacity", 0.3),
-                )
-            except Exception as e:
-                result_holder["error"] = str(e)
-
-        # Use subprocess to launch the capture in a separate process
-        # This avoids tkinter main thread issues
-        capture_script = _build_capture_command(save_dir, config)
-        proc = subprocess.run(
-            [sys.executable, "-c", capture_script],
-            capture_output=True,
-            text=True,
-            timeout=120,
+        # Run the region selector in the pre-warmed capture worker process
+        # (this blocks until the user finishes selecting)
+        response = await _run_blocking(
+            _run_interactive_capture, save_dir, config, _downscale_options(params, config),
         )
 
-        if proc.returncode != 0:
+        if response["status"] == "error":
             return json.dumps({
                 "status": "error",
-                "message": f"Capture process failed: {proc.stderr.strip()}",
+                "message": f"Capture process failed: {response.get('message', '')}",
             })
 
-        output_lines = proc.stdout.strip().split("\n")
-        path = output_lines[0].strip() if output_lines else ""
-        if not path or path == "None" or path == "CANCELLED":
+        if response["status"] == "cancelled":
             return json.dumps({
                 "status": "cancelled",
                 "message": "Selection was cancelled by the user.",
             })
 
-        # Parse and save region coordinates if available
-        if len(output_lines) > 1 and output_lines[1].strip():
-            try:
-                region = json.loads(output_lines[1].strip())
-                save_last_region(region["x"], region["y"], region["width"], region["height"])
-            except (json.JSONDecodeError, KeyError):
-                pass
+        path = response["path"]
+        region = response.get("region")
+        if region:
+            save_last_region(region["x"], region["y"], region["width"], region["height"])
 
         # Optionally copy path to clipboard
+        _schedule_retention(config)
         if config.get("copy_path_to_clipboard", True):
-            copy_to_clipboard(path)
+            await _run_blocking(copy_to_clipboard, path)
 
-        return json.dumps({
+        result = json.dumps({
             "status": "ok",
             "path": path,
+            "scale": response.get("scale"),
+            "original_size": response.get("original_size"),
             "message": f"Screenshot saved! You can reference it at: {path}",
         })
+        if params.return_image:
+            # The selector runs in another process and has already written the file
+            return [result, await _file_image(path)]
+        return result
 
     except subprocess.TimeoutExpired:
         return json.dumps({
@@ -243,34 +454,49 @@ async def screenshot_capture_region(params: CaptureRegionInput) -> str:
         "openWorldHint": False,
     },
 )
-async def screenshot_capture_fullscreen(params: CaptureFullScreenInput) -> str:
+async def screenshot_capture_fullscreen(params: CaptureFullScreenInput):
     """Capture the entire screen (all monitors) and save as an image.
 
     Args:
         params (CaptureFullScreenInput): Parameters containing:
             - save_directory (Optional[str]): Where to save
             - filename (Optional[str]): Custom filename
+            - max_dimension / max_megapixels (Optional): Downscale budget
+            - return_image (bool): Return the image as content, encoded in memory
+            - save_file (bool): With return_image, also save the file (in the background)
 
     Returns:
-        str: JSON with file path or error message.
+        str: JSON with file path, downscale factor ("scale") and
+        "original_size", or error message. Divide image pixel coordinates
+        by "scale" to map them back to the screen. With return_image, a
+        list of that JSON and the image ("path" is null without save_file).
     """
     try:
         config = load_config()
         save_dir = params.save_directory or config["save_directory"]
-        image = capture_full_screen()
-        path = save_screenshot(
+        downscale = _downscale_options(params, config)
+        image = await _run_blocking(capture_full_screen)
+        if params.return_image:
+            return await _inline_capture(image, params, config, save_dir, downscale, "Full screen captured!")
+        path = await _run_blocking(
+            save_screenshot,
             image,
             save_dir=save_dir,
             filename=params.filename,
             fmt=config.get("image_format", "png"),
+            encoder=config.get("encoder"),
+            downscale=downscale,
         )
 
+        _schedule_retention(config)
         if config.get("copy_path_to_clipboard", True):
-            copy_to_clipboard(path)
+            await _run_blocking(copy_to_clipboard, path)
 
         return json.dumps({
             "status": "ok",
             "path": path,
+            "scale": budget_scale(image.width, image.height, downscale),
+            "original_size": {"width": image.width, "height": image.height},
             "message": f"Full screen captured! Path: {path}",
         })
     except Exception as e:
@@ -287,7 +513,7 @@ async def screenshot_capture_fullscreen(params: CaptureFullScreenInput) -> str:
         "openWorldHint": False,
     },
 )
-async def screenshot_capture_coordinates(params: CaptureCoordinatesInput) -> str:
+async def screenshot_capture_coordinates(params: CaptureCoordinatesInput):
     """Capture a specific rectangular region of the screen by coordinates.
 
     Useful when you already know the exact coordinates of what you want to capture.
@@ -300,33 +526,108 @@ async def screenshot_capture_coordinates(params: CaptureCoordinatesInput) -> str
             - height (int): Height in pixels
             - save_directory (Optional[str]): Where to save
             - filename (Optional[str]): Custom filename
+            - max_dimension / max_megapixels (Optional): Downscale budget
+            - return_image (bool): Return the image as content, encoded in memory
+            - save_file (bool): With return_image, also save the file (in the background)
 
     Returns:
-        str: JSON with file path or error message.
+        str: JSON with file path, downscale factor ("scale") and
+        "original_size", or error message. Divide image pixel coordinates
+        by "scale" to map them back to the screen. With return_image, a
+        list of that JSON and the image ("path" is null without save_file).
     """
     try:
         config = load_config()
         save_dir = params.save_directory or config["save_directory"]
-        image = capture_region(params.x, params.y, params.width, params.height)
-        path = save_screenshot(
+        downscale = _downscale_options(params, config)
+        image = await _run_blocking(capture_region, params.x, params.y, params.width, params.height)
+        if params.return_image:
+            return await _inline_capture(image, params, config, save_dir, downscale, "Region captured!")
+        path = await _run_blocking(
+            save_screenshot,
             image,
             save_dir=save_dir,
             filename=params.filename,
             fmt=config.get("image_format", "png"),
+            encoder=config.get("encoder"),
+            downscale=downscale,
         )
 
+        _schedule_retention(config)
         if config.get("copy_path_to_clipboard", True):
-            copy_to_clipboard(path)
+            await _run_blocking(copy_to_clipboard, path)
 
         return json.dumps({
             "status": "ok",
             "path": path,
+            "scale": budget_scale(image.width, image.height, downscale),
+            "original_size": {"width": image.width, "height": image.height},
             "message": f"Region captured! Path: {path}",
         })
     except Exception as e:
         return json.dumps({"status": "error", "message": str(e)})
 
 
+@mcp.tool(
+    name="screenshot_capture_batch",
+    annotations={
+        "title": "Capture Multiple Regions",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def screenshot_capture_batch(params: CaptureBatchInput):
+    """Capture several rectangular screen regions at once.
+
+    Performs a single grab covering all regions, crops each region from it
+    (so all screenshots show the same instant) and encodes them in
+    parallel. Prefer this over several screenshot_capture_coordinates
+    calls, e.g. for the panels of a dashboard.
+
+    Args:
+        params (CaptureBatchInput): Parameters containing:
+            - regions (list): [{x, y, width, height}, ...]
+            - save_directory (Optional[str]): Where to save
+            - max_dimension / max_megapixels (Optional): Downscale budget per image
+            - return_image (bool): Also return the images as content
+
+    Returns:
+        str: JSON with one entry per region, in order:
+        {"status": "ok", "captures": [{"path": "...", "region": {...}, "scale": 1.0,
+         "original_size": {...}}, ...], "message": "..."}
+        With return_image, a list of that JSON and the images, in region order.
+    """
+    try:
+        config = load_config()
+        save_dir = params.save_directory or config["save_directory"]
+        captures = await _run_blocking(
+            _capture_batch,
+            [region.model_dump() for region in params.regions],
+            save_dir=save_dir,
+            fmt=config.get("image_format", "png"),
+            encoder=config.get("encoder"),
+            downscale=_downscale_options(params, config),
+        )
+
+        _schedule_retention(config)
+        if config.get("copy_path_to_clipboard", True):
+            await _run_blocking(copy_to_clipboard, "\n".join(c["path"] for c in captures))
+
+        result = json.dumps({
+            "status": "ok",
+            "captures": captures,
+            "message": f"Captured {len(captures)} region(s) from a single grab.",
+        })
+        if params.return_image:
+            # The batch may have run in the daemon; its files are fully written
+            return [result] + [await _file_image(c["path"]) for c in captures]
+        return result
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
+
 @mcp.tool(
     name="screenshot_recapture_region",
     annotations={
@@ -337,7 +638,7 @@ async def screenshot_capture_coordinates(params: CaptureCoordinatesInput) -> str
         "openWorldHint": False,
     },
 )
-async def screenshot_recapture_region(params: RecaptureRegionInput) -> str:
+async def screenshot_recapture_region(params: RecaptureRegionInput):
     """Re-capture the exact same screen region as the last interactive capture.
 
     No overlay or user interaction needed -- instantly captures the previously
@@ -348,15 +649,27 @@ async def screenshot_recapture_region(params: RecaptureRegionInput) -> str:
     region selector so the user can pick an area. That selected area is saved
     and subsequent calls will recapture it instantly.
 
+    If the region's pixels are identical to the previous recapture, nothing
+    is re-encoded: the previous file's path is returned with "unchanged": true.
+    Otherwise "changed_region" is the screen-absolute bounding box of the
+    64px tiles that changed since the previous recapture, and with
+    include_changed_crop an image of just that area is saved as "changed_path".
+
     Args:
         params (RecaptureRegionInput): Parameters containing:
             - save_directory (Optional[str]): Where to save the screenshot
             - filename (Optional[str]): Custom filename
+            - max_dimension / max_megapixels (Optional): Downscale budget
+            - include_changed_crop (bool): Also save just the changed area
+            - return_image (bool): Also return the image as content
 
     Returns:
         str: JSON with the file path of the captured screenshot, or error message.
+        With return_image, a list of that JSON and the image.
 
-        Success: {"status": "ok", "path": "...", "region": {...}, "message": "..."}
+        Success: {"status": "ok", "path": "...", "region": {...}, "unchanged": false,
+                  "changed_region": {...}, "changed_path": "..." or null, "message": "..."}
+        Unchanged: same as success with "unchanged": true and the previous file's path
         Fallback: Opens interactive selector, then returns the same success format
         Cancelled: {"status": "cancelled", "message": "..."}
         Error: {"status": "error", "message": "..."}
@@ -365,78 +678,105 @@ async def screenshot_recapture_region(params: RecaptureRegionInput) -> str:
         config = load_config()
         save_dir = params.save_directory or config["save_directory"]
         fmt = config.get("image_format", "png")
+        downscale = _downscale_options(params, config)
 
         region = load_last_region()
 
         if region is None:
             # No previous region -- fall back to interactive selector
-            capture_script = _build_capture_command(save_dir, config)
-            proc = subprocess.run(
-                [sys.executable, "-c", capture_script],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-
-            if proc.returncode != 0:
+            response = await _run_blocking(_run_interactive_capture, save_dir, config, downscale)
+
+            if response["status"] == "error":
                 return json.dumps({
                     "status": "error",
-                    "message": f"Capture process failed: {proc.stderr.strip()}",
+                    "message": f"Capture process failed: {response.get('message', '')}",
                 })
 
-            output_lines = proc.stdout.strip().split("\n")
-            path = output_lines[0].strip() if output_lines else ""
-            if not path or path == "None" or path == "CANCELLED":
+            if response["status"] == "cancelled":
                 return json.dumps({
                     "status": "cancelled",
                     "message": "Selection was cancelled by the user.",
                 })
 
-            # Parse and save region for next recapture
-            fallback_region = None
-            if len(output_lines) > 1 and output_lines[1].strip():
-                try:
-                    fallback_region = json.loads(output_lines[1].strip())
-                    save_last_region(
-                        fallback_region["x"], fallback_region["y"],
-                        fallback_region["width"], fallback_region["height"],
-                    )
-                except (json.JSONDecodeError, KeyError):
-                    pass
+            # Save region for next recapture
+            path = response["path"]
+            fallback_region = response.get("region")
+            if fallback_region:
+                save_last_region(
+                    fallback_region["x"], fallback_region["y"],
+                    fallback_region["width"], fallback_region["height"],
+                )
 
+            _schedule_retention(config)
             if config.get("copy_path_to_clipboard", True):
-                copy_to_clipboard(path)
+                await _run_blocking(copy_to_clipboard, path)
 
-            return json.dumps({
+            result = json.dumps({
                 "status": "ok",
                 "path": path,
                 "region": fallback_region,
                 "fallback": True,
+                "scale": response.get("scale"),
+                "original_size": response.get("original_size"),
                 "message": (
                     f"No previous region found — opened interactive selector. "
                     f"Region saved for future recaptures. Path: {path}"
                 ),
             })
-
-        # Happy path: recapture the saved region instantly
-        path = recapture_region(
+            if params.return_image:
+                return [result, await _file_image(path)]
+            return result
+
+        # Happy path: recapture the saved region instantly. Unchanged pixels
+        # skip encoding and return the previous file.
+        last = load_last_capture(region) or {}
+        result = await _run_blocking(
+            _recapture_region,
             x=region["x"],
             y=region["y"],
             width=region["width"],
             height=region["height"],
             save_dir=save_dir,
             fmt=fmt,
+            encoder=config.get("encoder"),
+            previous_digest=last.get("digest"),
+            previous_path=last.get("path"),
+            previous_tiles=last.get("tiles"),
+            previous_settings=last.get("settings"),
+            previous_scale=last.get("scale"),
+            previous_original_size=last.get("original_size"),
+            save_changed_crop=params.include_changed_crop,
+            downscale=downscale,
+        )
+        path = result.path
+        save_last_capture(
+            region, result.digest, path, result.tiles, result.settings, result.scale, result.original_size,
         )
 
+        _schedule_retention(config)
         if config.get("copy_path_to_clipboard", True):
-            copy_to_clipboard(path)
+            await _run_blocking(copy_to_clipboard, path)
 
-        return json.dumps({
+        if result.unchanged:
+            message = f"Region unchanged since the last capture. Path: {path}"
+        else:
+            message = f"Region recaptured! Path: {path}"
+
+        response = json.dumps({
             "status": "ok",
             "path": path,
             "region": region,
-            "message": f"Region recaptured! Path: {path}",
+            "unchanged": result.unchanged,
+            "changed_region": result.changed_region,
+            "changed_path": result.changed_path,
+            "scale": result.scale,
+            "original_size": result.original_size,
+            "message": message,
         })
+        if params.return_image:
+            # Written before the recapture returned, here or in the daemon
+            return [response, await _file_image(path)]
+        return response
     except subprocess.TimeoutExpired:
         return json.dumps({
             "status": "error",
@@ -446,6 +786,212 @@ async def screenshot_recapture_region(params: RecaptureRegionInput) -> str:
         return json.dumps({"status": "error", "message": str(e)})
 
 
+@mcp.tool(
+    name="screenshot_watch_region",
+    annotations={
+        "title": "Watch Screen Region",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def screenshot_watch_region(params: WatchRegionInput):
+    """Watch a screen region and save a screenshot each time it changes.
+
+    Samples the region every interval_ms and compares each sample with the
+    last saved one on a small downsampled thumbnail; a file is only written
+    when the changed fraction exceeds the threshold. The first sample is
+    always saved as the starting state. Much cheaper than repeatedly calling
+    screenshot_recapture_region while waiting on a long build or test run.
+
+    Args:
+        params (WatchRegionInput): Parameters containing:
+            - x, y, width, height (Optional[int]): Region (default: last selected region)
+            - interval_ms (Optional[int]): Time between samples
+            - threshold (Optional[float]): Changed-pixel fraction that triggers a save
+            - duration_seconds (float): How long to watch
+            - max_captures (int): Stop after this many saved screenshots
+            - save_directory (Optional[str]): Where to save
+            - max_dimension / max_megapixels (Optional): Downscale budget per image
+            - return_image (bool): Also return the saved images as content
+
+    Returns:
+        str: JSON with the saved screenshots in order, e.g.
+        {"status": "ok", "region": {...}, "samples": 60,
+         "captures": [{"path": "...", "elapsed_ms": 0, "change_ratio": 1.0,
+         "scale": 1.0, "original_size": {...}}, ...]}
+        With return_image, a list of that JSON and the images, in capture order.
+    """
+    try:
+        config = load_config()
+        save_dir = params.save_directory or config["save_directory"]
+        downscale = _downscale_options(params, config)
+        watch = config.get("watch") or {}
+        interval = (params.interval_ms or watch.get("interval_ms", 1000)) / 1000
+        threshold = params.threshold if params.threshold is not None else watch.get("threshold", 0.01)
+
+        region = _resolve_region(params)
+        if region is None:
+            return json.dumps({
+                "status": "error",
+                "message": "No region given and no previous region saved. Pass x, y, width and height.",
+            })
+
+        watcher = await _run_blocking(
+            RegionWatcher, region["x"], region["y"], region["width"], region["height"], threshold=threshold,
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        captures = []
+        images = []
+        samples = 0
+
+        while loop.time() - start < params.duration_seconds and len(captures) < params.max_captures:
+            tick = loop.time()
+            sample = await _run_blocking(watcher.sample)
+            samples += 1
+            if sample.changed:
+                path, content = await _save_sample(sample.image, config, save_dir, downscale, params.return_image)
+                if content is not None:
+                    images.append(content)
+                image = sample.image
+                captures.append({
+                    "path": path,
+                    "elapsed_ms": round((tick - start) * 1000),
+                    "change_ratio": round(sample.change_ratio, 4),
+                    "scale": budget_scale(image.width, image.height, downscale),
+                    "original_size": {"width": image.width, "height": image.height},
+                })
+            await asyncio.sleep(max(0.0, interval - (loop.time() - tick)))
+
+        if captures:
+            _schedule_retention(config)
+        result = json.dumps({
+            "status": "ok",
+            "region": region,
+            "samples": samples,
+            "captures": captures,
+            "message": f"Watched for {loop.time() - start:.1f}s, saved {len(captures)} screenshot(s).",
+        })
+        return [result] + images if params.return_image else result
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
+
+@mcp.tool(
+    name="screenshot_wait_for_change",
+    annotations={
+        "title": "Wait For Region Change",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def screenshot_wait_for_change(params: WaitForChangeInput):
+    """Wait until a screen region changes, then capture it once.
+
+    The first sample is the baseline; the region is then sampled every
+    interval_ms and compared with the baseline on a small downsampled
+    thumbnail (no encoding or files while waiting). Use this instead of
+    repeatedly capturing and comparing screenshots.
+
+    Args:
+        params (WaitForChangeInput): Parameters containing:
+            - x, y, width, height (Optional[int]): Region (default: last selected region)
+            - timeout_seconds (float): Give up after this long
+            - interval_ms (int): Time between samples
+            - threshold (Optional[float]): Changed-pixel fraction that counts as a change
+            - save_directory (Optional[str]): Where to save
+            - max_dimension / max_megapixels (Optional): Downscale budget
+            - return_image (bool): Also return the image as content
+
+    Returns:
+        str: JSON with the captured path, scale and original_size once the region changed
+        (with return_image, a list of that JSON and the image):
+        {"status": "ok", "path": "...", "waited_ms": 1250, "change_ratio": 0.12, ...}
+        or {"status": "timeout", "path": "...", ...} with the final state if it never changed.
+    """
+    try:
+        region, watcher, config = await _prepare_wait(params)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        interval = params.interval_ms / 1000
+
+        sample = await _run_blocking(watcher.sample)
+        changed = False
+        while loop.time() - start < params.timeout_seconds:
+            await asyncio.sleep(interval)
+            sample = await _run_blocking(watcher.sample)
+            if sample.changed:
+                changed = True
+                break
+
+        return await _finish_wait(params, config, region, sample, start, changed, "Region changed")
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
+
+@mcp.tool(
+    name="screenshot_wait_for_stable",
+    annotations={
+        "title": "Wait For Region To Settle",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def screenshot_wait_for_stable(params: WaitForStableInput):
+    """Wait until a screen region stops changing for stable_ms, then capture it once.
+
+    Useful after triggering an action (page load, build, animation) to
+    capture the settled result. Samples are compared on a small downsampled
+    thumbnail, so waiting costs no encoding or disk writes.
+
+    Args:
+        params (WaitForStableInput): Parameters containing:
+            - x, y, width, height (Optional[int]): Region (default: last selected region)
+            - stable_ms (int): How long the region must stay unchanged
+            - timeout_seconds (float): Give up after this long
+            - interval_ms (int): Time between samples
+            - threshold (Optional[float]): Changed-pixel fraction that counts as a change
+            - save_directory (Optional[str]): Where to save
+            - max_dimension / max_megapixels (Optional): Downscale budget
+            - return_image (bool): Also return the image as content
+
+    Returns:
+        str: JSON with the captured path, scale and original_size once the region settled
+        (with return_image, a list of that JSON and the image):
+        {"status": "ok", "path": "...", "waited_ms": 2300, ...}
+        or {"status": "timeout", "path": "...", ...} with the last state if it never settled.
+    """
+    try:
+        region, watcher, config = await _prepare_wait(params)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        interval = params.interval_ms / 1000
+        stable_for = params.stable_ms / 1000
+
+        sample = await _run_blocking(watcher.sample)
+        last_change = loop.time()
+        stable = False
+        while loop.time() - start < params.timeout_seconds:
+            await asyncio.sleep(interval)
+            sample = await _run_blocking(watcher.sample)
+            now = loop.time()
+            if sample.changed:
+                last_change = now
+            elif now - last_change >= stable_for:
+                stable = True
+                break
+
+        return await _finish_wait(params, config, region, sample, start, stable, "Region settled")
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
+
 @mcp.tool(
     name="screenshot_get_latest",
     annotations={
@@ -459,8 +1005,9 @@ async def screenshot_recapture_region(params: RecaptureRegionInput) -> str:
 async def screenshot_get_latest(params: GetLatestInput) -> str:
     """Get the file path(s) of the most recently captured screenshot(s).
 
-    Scans the screenshots directory and returns the most recent files,
-    sorted by modification time.
+    Looks up the most recent files in the screenshot catalog (an index
+    maintained on every capture), so the cost does not grow with the size
+    of the screenshots directory.
 
     Args:
         params (GetLatestInput): Parameters containing:
@@ -479,15 +1026,9 @@ async def screenshot_get_latest(params: GetLatestInput) -> str:
             "message": "No screenshots directory found.",
         })
 
-    # List image files sorted by modification time (newest first)
-    image_extensions = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
-    files = []
-    for f in Path(save_dir).iterdir():
-        if f.is_file() and f.suffix.lower() in image_extensions:
-            files.append((f, f.stat().st_mtime))
-
-    files.sort(key=lambda x: x[1], reverse=True)
-    latest = [str(f.resolve()) for f, _ in files[: params.count]]
+    # Apply the retention policy first so evicted files are never listed
+    await _run_blocking(maybe_enforce_retention, config.get("retention"))
+    latest = await _run_blocking(latest_screenshots, save_dir, params.count)
 
     if not latest:
         return json.dumps({
@@ -503,6 +1044,44 @@ async def screenshot_get_latest(params: GetLatestInput) -> str:
     })
 
 
+@mcp.tool(
+    name="screenshot_stats",
+    annotations={
+        "title": "Capture Timing Stats",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def screenshot_stats() -> str:
+    """Get per-stage capture timings (p50/p95/p99 over the recent captures).
+
+    Stages: grab, convert, crop, downscale, encode, write, clipboard and
+    notification. Timings are reported for this server process and, if the
+    hotkey daemon is running, for the daemon (which also performs the
+    captures delegated to it).
+
+    Returns:
+        str: JSON with {"status": "ok", "timings_enabled": bool,
+        "server": {stage: {"count", "window", "p50_ms", "p95_ms", "p99_ms", "max_ms"}},
+        "daemon": {...same...} or null}
+    """
+    daemon = None
+    try:
+        response = await _run_blocking(_daemon_request, "stats", {}, 5)
+        if response and response.get("status") == "ok":
+            daemon = response.get("timings")
+    except Exception:
+        pass
+    return json.dumps({
+        "status": "ok",
+        "timings_enabled": stats.is_enabled(),
+        "server": stats.snapshot(),
+        "daemon": daemon,
+    }, indent=2)
+
+
 @mcp.tool(
     name="screenshot_get_config",
     annotations={
@@ -523,7 +1102,7 @@ async def screenshot_get_config() -> str:
         str: JSON with current configuration values.
     """
     config = load_config()
-    return json.dumps({"status": "ok", "config": config}, indent=2)
+    return json.dumps({"status": "ok", "config": config_to_dict(config)}, indent=2)
 
 
 @mcp.tool(
@@ -555,6 +1134,8 @@ async def screenshot_update_config(params: UpdateConfigInput) -> str:
         value = params.value
         if value.lower() in ("true", "false"):
             value = value.lower() == "true"
+        elif value.lower() in ("null", "none"):
+            value = None
         elif value.isdigit():
             value = int(value)
         else:
@@ -564,10 +1145,12 @@ async def screenshot_update_config(params: UpdateConfigInput) -> str:
                 pass  # Keep as string
 
         config = update_config(params.key, value)
+        if params.key == "collect_timings":
+            stats.set_enabled(config.get("collect_timings", True))
         return json.dumps({
             "status": "ok",
             "message": f"Updated '{params.key}' to '{value}'.",
-            "config": config,
+            "config": config_to_dict(config),
         })
     except ValueError as e:
         return json.dumps({"status": "error", "message": str(e)})
@@ -577,41 +1160,224 @@ async def screenshot_update_config(params: UpdateConfigInput) -> str:
 # Helpers
 # ──────────────────────────────────────────────
 
-def _build_capture_command(save_dir: str, config: dict) -> str:
-    """Build a Python script string to run the capture in a subprocess.
+# Pre-warmed process that runs the interactive region selector. tkinter
+# needs the main thread of its process, which here belongs to the MCP
+# event loop, so selection happens out of process.
+_capture_worker = CaptureWorker()
 
-    This is needed because tkinter requires the main thread and the MCP
-    server runs async, so we launch capture in a separate process.
 
-    Output format (two lines):
-        Line 1: file path (or 'CANCELLED')
-        Line 2: JSON region dict (or empty)
+def _resolve_region(params) -> Optional[dict]:
+    """Region from explicit x/y/width/height params, else the last selected region."""
+    coordinates = (params.x, params.y, params.width, params.height)
+    if all(v is not None for v in coordinates):
+        return {"x": params.x, "y": params.y, "width": params.width, "height": params.height}
+    if any(v is not None for v in coordinates):
+        raise ValueError("Pass all of x, y, width and height, or none of them to use the last region.")
+    return load_last_region()
+
+
+async def _prepare_wait(params):
+    """Resolve the region, config and a RegionWatcher for the wait tools."""
+    config = load_config()
+    region = _resolve_region(params)
+    if region is None:
+        raise ValueError("No region given and no previous region saved. Pass x, y, width and height.")
+    threshold = params.threshold
+    if threshold is None:
+        threshold = (config.get("watch") or {}).get("threshold", 0.01)
+    # Construction loads mss and Pillow on first use
+    watcher = await _run_blocking(
+        RegionWatcher, region["x"], region["y"], region["width"], region["height"], threshold=threshold,
+    )
+    return region, watcher, config
+
+
+async def _finish_wait(params, config: dict, region: dict, sample, start: float, reached: bool, what: str):
+    """Save the final sample of a wait tool and build its response."""
+    waited_ms = round((asyncio.get_running_loop().time() - start) * 1000)
+    image = sample.image
+    downscale = _downscale_options(params, config)
+    save_dir = params.save_directory or config["save_directory"]
+    path, content = await _save_sample(image, config, save_dir, downscale, params.return_image)
+    _schedule_retention(config)
+    if reached:
+        message = f"{what} after {waited_ms} ms. Path: {path}"
+    else:
+        message = f"Timed out after {waited_ms} ms; captured the current state. Path: {path}"
+    result = json.dumps({
+        "status": "ok" if reached else "timeout",
+        "path": path,
+        "region": region,
+        "waited_ms": waited_ms,
+        "change_ratio": round(sample.change_ratio, 4),
+        "scale": budget_scale(image.width, image.height, downscale),
+        "original_size": {"width": image.width, "height": image.height},
+        "message": message,
+    })
+    return [result, content] if content is not None else result
+
+
+def _mcp_image(data: bytes, fmt: str) -> MCPImage:
+    """Wrap encoded image bytes as MCP image content."""
+    fmt = fmt.lower()
+    return MCPImage(data=data, format="jpeg" if fmt in ("jpg", "jpeg") else fmt)
+
+
+async def _file_image(path: str) -> MCPImage:
+    """Image content from a saved screenshot, e.g. one written by the daemon or the worker."""
+    data = await _run_blocking(Path(path).read_bytes)
+    return _mcp_image(data, os.path.splitext(path)[1].lstrip("."))
+
+
+async def _save_sample(image, config: dict, save_dir: str, downscale: dict, return_image: bool):
+    """Save a watch or wait sample; returns (path, image content or None).
+
+    With return_image the sample is encoded once with encode_screenshot()
+    and the same bytes are both written and returned.
     """
     fmt = config.get("image_format", "png")
-    color = config.get("overlay_color", "#00aaff")
-    opacity = config.get("overlay_opacity", 0.3)
-    capture_hk = config.get("hotkey", "ctrl+shift+q")
-    recapture_hk = config.get("recapture_hotkey", "ctrl+alt+q")
+    if not return_image:
+        path = await _run_blocking(
+            save_screenshot, image, save_dir=save_dir, fmt=fmt,
+            encoder=config.get("encoder"), downscale=downscale,
+        )
+        return path, None
+    encoded = await _run_blocking(encode_screenshot, image, fmt, config.get("encoder"), downscale)
+    path, saved = save_encoded_async(encoded, save_dir=save_dir)
+    await asyncio.wrap_future(saved)
+    return path, _mcp_image(encoded.data, fmt)
 
-    return f"""
-import sys
-import json
-sys.path.insert(0, r'{os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}')
-from screenshot_mcp.capture import select_region_and_capture
-result = select_region_and_capture(
-    save_dir=r'{save_dir}',
-    fmt='{fmt}',
-    overlay_color='{color}',
-    overlay_opacity={opacity},
-    capture_hotkey='{capture_hk}',
-    recapture_hotkey='{recapture_hk}',
-)
-if result.path:
-    print(result.path)
-    print(json.dumps(result.region) if result.region else '')
-else:
-    print('CANCELLED')
-"""
+
+def _report_save_error(path: str, saved: Future) -> None:
+    """Done-callback for background writes nobody waits on."""
+    error = saved.exception()
+    if error is not None:
+        print(f"Warning: Could not save screenshot {path}: {error}", file=sys.stderr)
+
+
+async def _inline_capture(image, params, config: dict, save_dir: str, downscale: dict, message: str) -> list:
+    """Encode a capture in memory and return it as image content.
+
+    With params.save_file the same encoded bytes are written to disk in the
+    background, after the response has been sent; otherwise nothing touches
+    the disk.
+    """
+    fmt = config.get("image_format", "png")
+    encoded = await _run_blocking(encode_screenshot, image, fmt, config.get("encoder"), downscale)
+    payload = {
+        "status": "ok",
+        "path": None,
+        "scale": encoded.scale,
+        "original_size": {"width": image.width, "height": image.height},
+    }
+    if params.save_file:
+        path, saved = save_encoded_async(encoded, save_dir=save_dir, filename=params.filename)
+        saved.add_done_callback(functools.partial(_report_save_error, path))
+        _schedule_retention(config)
+        if config.get("copy_path_to_clipboard", True):
+            _executor.submit(copy_to_clipboard, path)
+        payload["path"] = path
+        payload["message"] = f"{message} Image returned inline, also saving to: {path}"
+    else:
+        payload["message"] = f"{message} Image returned inline (not saved to disk)."
+    return [json.dumps(payload), _mcp_image(encoded.data, fmt)]
+
+
+def _schedule_retention(config) -> None:
+    """Enforce the retention policy in the background after a save.
+
+    maybe_enforce_retention() is throttled, so this is cheap per call.
+    """
+    _executor.submit(maybe_enforce_retention, config.get("retention"))
+
+
+def _downscale_options(params, config: dict) -> dict:
+    """Merge a tool call's max_dimension/max_megapixels into the configured 'downscale' section."""
+    downscale = dict(config.get("downscale") or {})
+    if params.max_dimension is not None:
+        downscale["max_dimension"] = params.max_dimension
+    if params.max_megapixels is not None:
+        downscale["max_megapixels"] = params.max_megapixels
+    return downscale
+
+
+# How long a daemon liveness check is trusted (seconds); the check reads the
+# PID file and looks up the process, which is too slow to do per tool call.
+_DAEMON_CHECK_TTL = 5.0
+_daemon_state = {"checked": float("-inf"), "running": False}
+
+
+def _daemon_request(cmd: str, args: dict, timeout: float) -> Optional[dict]:
+    """Delegate a command to the running hotkey daemon over local IPC.
+
+    Returns the daemon's response, or None if no daemon is running or
+    reachable, in which case the caller captures locally.
+    """
+    now = time.monotonic()
+    if now - _daemon_state["checked"] > _DAEMON_CHECK_TTL:
+        _daemon_state["running"] = is_daemon_running()
+        _daemon_state["checked"] = now
+    if not _daemon_state["running"]:
+        return None
+    # Config sections arrive as read-only snapshots; send plain dicts
+    args = {k: dict(v) if isinstance(v, Mapping) else v for k, v in args.items()}
+    try:
+        return ipc.request(cmd, args, timeout=timeout)
+    except ipc.DaemonUnavailable:
+        # e.g. a daemon started without an IPC endpoint; re-check after the TTL
+        _daemon_state["running"] = False
+        return None
+
+
+def _recapture_region(**kwargs) -> RecaptureResult:
+    """recapture_region() in the running daemon if there is one, else locally."""
+    response = _daemon_request("recapture", kwargs, timeout=30)
+    if response is None:
+        return recapture_region(**kwargs)
+    if response.get("status") != "ok":
+        raise RuntimeError(response.get("message", "Recapture failed in the daemon"))
+    return RecaptureResult(**{k: response.get(k) for k in RecaptureResult._fields if k != "saved"})
+
+
+def _capture_batch(regions: list, **kwargs) -> list:
+    """capture_batch() in the running daemon if there is one, else locally."""
+    response = _daemon_request("batch", dict(kwargs, regions=regions), timeout=30)
+    if response is None:
+        return capture_batch(regions, **kwargs)
+    if response.get("status") != "ok":
+        raise RuntimeError(response.get("message", "Batch capture failed in the daemon"))
+    return response["captures"]
+
+
+def _run_interactive_capture(save_dir: str, config: dict, downscale: Optional[dict] = None) -> dict:
+    """Run the interactive region selector in the daemon or the capture worker.
+
+    A running hotkey daemon already has its overlay built, so it is
+    preferred; otherwise the server's own pre-warmed worker is used.
+
+    Returns the response: {"status": "ok", "path": ..., "region": ...,
+    "scale": ..., "original_size": ...},
+    {"status": "cancelled"} or {"status": "error", "message": ...}.
+
+    Raises subprocess.TimeoutExpired if the user does not finish in 120 seconds.
+    """
+    args = {
+        "save_dir": save_dir,
+        "fmt": config.get("image_format", "png"),
+        "overlay_color": config.get("overlay_color", "#00aaff"),
+        "overlay_opacity": config.get("overlay_opacity", 0.3),
+        "capture_hotkey": config.get("hotkey", "ctrl+shift+q"),
+        "recapture_hotkey": config.get("recapture_hotkey", "ctrl+alt+q"),
+        "encoder": dict(config.get("encoder") or {}),
+        "downscale": dict(downscale if downscale is not None else config.get("downscale") or {}),
+    }
+    response = _daemon_request("capture", args, timeout=120)
+    if response is not None:
+        return response
+    try:
+        return _capture_worker.request("select", args, timeout=120)
+    except CaptureWorkerError as e:
+        return {"status": "error", "message": str(e)}
 
 
 # ──────────────────────────────────────────────
@@ -620,7 +1386,17 @@ else:
 
 def main():
     """Run the MCP server."""
-    mcp.run()
+    # Warm up the capture worker in the background so the first
+    # interactive capture does not pay interpreter startup.
+    _capture_worker.start()
+    config = load_config()
+    stats.set_enabled(config.get("collect_timings", True))
+    if config.get("copy_path_to_clipboard", True):
+        clipboard.warm_up()
+    try:
+        mcp.run()
+    finally:
+        _capture_worker.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+"""
+Per-stage timing statistics for captures.
+
+Capture code wraps each stage in a span:
+
+    with span("encode"):
+        image.save(...)
+
+and every stage keeps a rolling window of its most recent durations, from
+which p50/p95/p99 are computed on demand. When collection is disabled
+(config key 'collect_timings'), span() returns a shared no-op context
+manager, so an instrumented stage costs one function call.
+
+Stages: grab, convert (full frame BGRA -> RGB), crop (BGRA -> RGB of a
+sub-rectangle), downscale, encode, write, clipboard, notification.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+
+# Durations kept per stage for the rolling percentiles
+WINDOW = 1024
+
+_enabled = True
+_samples: Dict[str, deque] = {}
+_counts: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn timing collection on or off."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record(stage: str, seconds: float) -> None:
+    """Record one duration for a stage."""
+    samples = _samples.get(stage)
+    if samples is None:
+        with _lock:
+            samples = _samples.setdefault(stage, deque(maxlen=WINDOW))
+    # deque.append is atomic; the total count is best-effort under contention
+    samples.append(seconds)
+    _counts[stage] = _counts.get(stage, 0) + 1
+
+
+class _Span:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(stage: str):
+    """Context manager timing one stage (a no-op while collection is disabled)."""
+    return _Span(stage) if _enabled else _NULL_SPAN
+
+
+def _percentile(ordered: list, q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def snapshot() -> dict:
+    """Summarize every stage's rolling window in milliseconds.
+
+    Returns:
+        {stage: {"count", "window", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}
+        where count is the total number of spans recorded and window the
+        number of recent ones the percentiles are computed from.
+    """
+    with _lock:
+        stages = list(_samples.items())
+    summary = {}
+    for stage, samples in sorted(stages):
+        ordered = sorted(samples)
+        if not ordered:
+            continue
+        summary[stage] = {
+            "count": _counts.get(stage, len(ordered)),
+            "window": len(ordered),
+            "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+            "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
+    return summary
+
+
+def reset() -> None:
+    """Drop all recorded timings."""
+    with _lock:
+        _samples.clear()
+        _counts.clear()
+
+
+def format_table(summary: dict) -> str:
+    """Render a snapshot() as a text table."""
+    lines = [f"  {'stage':<14}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+    for stage, s in summary.items():
+        lines.append(
+            f"  {stage:<14}{s['count']:>8}{s['p50_ms']:>10.2f}{s['p95_ms']:>10.2f}"
+            f"{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
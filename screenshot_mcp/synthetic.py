@@ -0,0 +1,157 @@
+"""
+Synthetic capture backend.
+
+Generates deterministic screen content for any monitor layout, so capture,
+encode and save can be exercised (and benchmarked) without a display:
+
+    from screenshot_mcp.capture import set_backend
+    from screenshot_mcp.synthetic import SyntheticBackend
+
+    set_backend(SyntheticBackend(
+        [{"left": 0, "top": 0, "width": 2560, "height": 1440},
+         {"left": 2560, "top": 360, "width": 1920, "height": 1080}],
+        content="text",
+    ))
+
+Content kinds:
+    text   Dense dark-on-light text lines (editors, terminals, documents)
+    photo  Smooth gradients with per-pixel noise (photos, video frames)
+    ui     Flat panels, buttons and sparse labels (typical application UI)
+
+The same layout, content and seed always produce the same pixels.
+"""
+
+import random
+import string
+from typing import Optional
+
+from PIL import Image, ImageDraw
+
+from .capture import CaptureBackend, RawFrame
+
+
+CONTENT_KINDS = ("text", "photo", "ui")
+
+_TEXT_CHARS = string.ascii_letters + string.digits + "(){}[]<>=+-_.,:;'\"/"
+_TEXT_COLORS = [(30, 30, 30), (0, 92, 197), (163, 21, 21), (0, 128, 0), (121, 94, 38)]
+_UI_COLORS = [(255, 255, 255), (232, 240, 254), (254, 239, 227), (230, 244, 234), (242, 242, 242)]
+
+
+def _random_line(rng: random.Random, length: int) -> str:
+    """Words of random characters separated by single spaces."""
+    words = []
+    total = 0
+    while total < length:
+        word = "".join(rng.choice(_TEXT_CHARS) for _ in range(rng.randint(1, 10)))
+        words.append(word)
+        total += len(word) + 1
+    return " ".join(words)[:length]
+
+
+def _render_text(width: int, height: int, rng: random.Random) -> "Image.Image":
+    """Editor-like screen: lines of small text with varying indent and color."""
+    image = Image.new("RGB", (width, height), (250, 250, 250))
+    draw = ImageDraw.Draw(image)
+    line_height = 16
+    for y in range(4, height - line_height, line_height):
+        if rng.random() < 0.15:
+            continue  # Blank line
+        indent = rng.randrange(0, 8) * 12
+        length = rng.randrange(8, max(9, (width - indent - 16) // 6))
+        draw.text((8 + indent, y), _random_line(rng, length), fill=rng.choice(_TEXT_COLORS))
+    return image
+
+
+def _render_photo(width: int, height: int, rng: random.Random) -> "Image.Image":
+    """Photo-like screen: smooth gradients per channel plus fine noise."""
+    vertical = Image.linear_gradient("L").resize((width, height))
+    horizontal = Image.linear_gradient("L").rotate(90).resize((width, height))
+    radial = Image.radial_gradient("L").resize((width, height))
+    noise = Image.frombytes("L", (width, height), rng.randbytes(width * height))
+    channels = (
+        Image.blend(vertical, noise, 0.15),
+        Image.blend(horizontal, noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT), 0.15),
+        Image.blend(radial, noise.transpose(Image.Transpose.FLIP_TOP_BOTTOM), 0.15),
+    )
+    return Image.merge("RGB", channels)
+
+
+def _render_ui(width: int, height: int, rng: random.Random) -> "Image.Image":
+    """Application-like screen: title bar, sidebar, cards, buttons and labels."""
+    image = Image.new("RGB", (width, height), (243, 243, 243))
+    draw = ImageDraw.Draw(image)
+
+    draw.rectangle((0, 0, width, 32), fill=(45, 45, 48))
+    draw.text((12, 10), _random_line(rng, 24), fill=(220, 220, 220))
+    sidebar = min(260, width // 5)
+    draw.rectangle((0, 32, sidebar, height), fill=(228, 228, 231))
+    for y in range(48, height - 24, 28):
+        draw.text((16, y), _random_line(rng, rng.randint(6, 20)), fill=(60, 60, 60))
+
+    x0, y0 = sidebar + 24, 56
+    card_w, card_h = 300, 180
+    for top in range(y0, height - card_h, card_h + 24):
+        for left in range(x0, width - card_w, card_w + 24):
+            draw.rectangle(
+                (left, top, left + card_w, top + card_h),
+                fill=rng.choice(_UI_COLORS), outline=(210, 210, 210),
+            )
+            draw.text((left + 16, top + 16), _random_line(rng, rng.randint(8, 30)), fill=(30, 30, 30))
+            for line in range(rng.randint(1, 4)):
+                draw.text((left + 16, top + 44 + line * 18), _random_line(rng, 40), fill=(110, 110, 110))
+            draw.rectangle((left + 16, top + card_h - 44, left + 112, top + card_h - 16), fill=(0, 120, 212))
+            draw.text((left + 30, top + card_h - 36), "Action", fill=(255, 255, 255))
+    return image
+
+
+_RENDERERS = {"text": _render_text, "photo": _render_photo, "ui": _render_ui}
+
+
+class SyntheticBackend(CaptureBackend):
+    """Capture backend that serves generated frames instead of the screen.
+
+    The whole virtual screen is rendered once up front (one monitor of the
+    requested content per layout entry, black dead space between
+    monitors); each grab copies the requested rectangle out of it, as a
+    real grab copies it out of the frame buffer.
+    """
+
+    def __init__(self, layout: Optional[list] = None, content: str = "ui", seed: int = 0):
+        """
+        Args:
+            layout: Monitor dicts ({left, top, width, height}); default one 1920x1080 monitor
+            content: One of CONTENT_KINDS
+            seed: Seed for the generated content
+        """
+        if content not in _RENDERERS:
+            raise ValueError(f"Unknown synthetic content: {content}. Valid kinds: {list(CONTENT_KINDS)}")
+        layout = layout or [{"left": 0, "top": 0, "width": 1920, "height": 1080}]
+        self.content = content
+
+        left = min(m["left"] for m in layout)
+        top = min(m["top"] for m in layout)
+        right = max(m["left"] + m["width"] for m in layout)
+        bottom = max(m["top"] + m["height"] for m in layout)
+        virtual = {"left": left, "top": top, "width": right - left, "height": bottom - top}
+        self._monitors = [virtual] + [dict(m) for m in layout]
+
+        frame = Image.new("RGB", (virtual["width"], virtual["height"]))
+        for index, mon in enumerate(layout):
+            screen = _RENDERERS[content](mon["width"], mon["height"], random.Random(seed + index))
+            frame.paste(screen, (mon["left"] - left, mon["top"] - top))
+        # Keep the BGRA bytes a real grab would return, in a 4-byte image
+        # so crop() can cut rectangles out of them
+        self._frame = Image.frombytes("RGBA", frame.size, frame.convert("RGBA").tobytes("raw", "BGRA"))
+
+    @property
+    def monitors(self) -> list:
+        return self._monitors
+
+    def _grab(self, monitor: dict) -> RawFrame:
+        virtual = self._monitors[0]
+        x = monitor["left"] - virtual["left"]
+        y = monitor["top"] - virtual["top"]
+        width, height = monitor["width"], monitor["height"]
+        # Areas outside the virtual screen come back black, as with mss
+        raw = bytearray(self._frame.crop((x, y, x + width, y + height)).tobytes())
+        return RawFrame(raw, width, height)
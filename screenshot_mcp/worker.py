@@ -0,0 +1,272 @@
+"""
+Persistent capture worker process.
+
+tkinter needs to own the main thread of its process, and the MCP server's
+main thread is busy running the asyncio event loop, so interactive region
+selection runs in a separate process. Instead of spawning a fresh
+interpreter per selection (paying Python startup plus mss/Pillow/tkinter
+imports every time), the server starts one pre-warmed worker and talks to
+it over its stdin/stdout pipes.
+
+Protocol (one JSON object per line):
+    Worker -> server on startup:  {"event": "ready"}
+                                  {"event": "ready", "error": "..."}  (pre-warm failed;
+                                  every request is answered with this error)
+    Server -> worker:             {"id": 1, "cmd": "select", "args": {...}}
+    Worker -> server:             {"id": 1, "status": "ok", "path": "...", "region": {...}}
+                                  {"id": 1, "status": "cancelled"}
+                                  {"id": 1, "status": "error", "message": "..."}
+
+Commands: "ping" (health check), "select" (kwargs for select_region_and_capture).
+
+The worker's stderr is piped back too: it is echoed to the server's stderr,
+and its last lines explain a worker that dies without responding.
+"""
+
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from collections import deque
+from typing import Optional
+
+
+# stderr lines of the worker kept to explain an unexpected exit
+_STDERR_TAIL = 20
+
+
+class CaptureWorkerError(RuntimeError):
+    """Raised when the capture worker dies while handling a request."""
+
+
+# ──────────────────────────────────────────────
+# Worker side (runs in the child process)
+# ──────────────────────────────────────────────
+
+def _handle_request(request: dict, selector=None) -> dict:
+    """Execute a single request and return the response dict (without id).
+
+    selector is the worker's long-lived RegionSelector (None to create one
+    per selection).
+    """
+    from .capture import select_region_and_capture
+
+    cmd = request.get("cmd")
+    args = request.get("args") or {}
+
+    if cmd == "ping":
+        return {"status": "ok"}
+
+    if cmd == "select":
+        result = select_region_and_capture(**args, selector=selector)
+        if not result.path:
+            return {"status": "cancelled"}
+        return {
+            "status": "ok",
+            "path": result.path,
+            "region": result.region,
+            "scale": result.scale,
+            "original_size": result.original_size,
+        }
+
+    return {"status": "error", "message": f"Unknown command: {cmd}"}
+
+
+def serve():
+    """Worker main loop: pre-warm, then answer requests from stdin until EOF."""
+    # The pipe to the server carries only protocol lines. Route anything
+    # else printed by capture code (or libraries) to stderr.
+    channel = sys.stdout
+    sys.stdout = sys.stderr
+
+    def send(message: dict):
+        channel.write(json.dumps(message) + "\n")
+        channel.flush()
+
+    # Pre-warm: pay the import and mss setup cost before the first request,
+    # and keep one hidden Tk root with its overlay windows for every selection
+    selector = None
+    startup_error = None
+    try:
+        from .capture import RegionSelector, get_grabber, _ensure_dependencies
+        _ensure_dependencies()
+        monitors = list(get_grabber().monitors[1:])
+        selector = RegionSelector()
+        selector.prepare(monitors)
+    except Exception as e:
+        # Stay up and report the cause with every request instead of
+        # exiting (and being restarted) on each one
+        startup_error = str(e) or type(e).__name__
+        print(f"Warning: Capture worker could not start: {startup_error}", file=sys.stderr)
+
+    send({"event": "ready", "error": startup_error} if startup_error else {"event": "ready"})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            send({"id": None, "status": "error", "message": f"Invalid request: {e}"})
+            continue
+
+        if startup_error is not None and request.get("cmd") != "ping":
+            response = {"status": "error", "message": startup_error}
+        else:
+            try:
+                response = _handle_request(request, selector)
+            except Exception as e:
+                response = {"status": "error", "message": str(e)}
+        response["id"] = request.get("id")
+        send(response)
+
+
+# ──────────────────────────────────────────────
+# Server side (client for the worker process)
+# ──────────────────────────────────────────────
+
+class CaptureWorker:
+    """Client that owns a pre-warmed capture worker process.
+
+    The process is started on start() (or lazily on the first request),
+    reused across requests and transparently restarted if it has died.
+    Requests are serialized: only one overlay can be open at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._responses: Optional[queue.Queue] = None
+        self._stderr_tail: deque = deque(maxlen=_STDERR_TAIL)
+        self._stderr_reader: Optional[threading.Thread] = None
+        self._next_id = 0
+
+    def start(self) -> None:
+        """Start the worker process now so it is warm by the first request."""
+        with self._lock:
+            self._ensure_started()
+
+    def stop(self) -> None:
+        """Terminate the worker process if it is running."""
+        with self._lock:
+            self._kill()
+
+    def request(self, cmd: str, args: Optional[dict] = None, timeout: float = 120) -> dict:
+        """Send a command to the worker and wait for its response.
+
+        Raises:
+            subprocess.TimeoutExpired: No response within `timeout` seconds
+                (the worker is killed and restarted on the next request).
+            CaptureWorkerError: The worker exited before responding.
+        """
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            line = json.dumps({"id": request_id, "cmd": cmd, "args": args or {}}) + "\n"
+
+            try:
+                self._ensure_started()
+                self._send(line)
+            except (BrokenPipeError, OSError):
+                # Worker died between requests -- restart once and retry
+                self._kill()
+                self._ensure_started()
+                self._send(line)
+
+            responses = self._responses
+            try:
+                while True:
+                    message = responses.get(timeout=timeout)
+                    if message is None:
+                        self._kill()
+                        raise CaptureWorkerError(self._exit_message())
+                    # Skip the startup "ready" event and stale responses
+                    if message.get("id") == request_id:
+                        return message
+            except queue.Empty:
+                self._kill()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+    def _send(self, line: str) -> None:
+        self._proc.stdin.write(line)
+        self._proc.stdin.flush()
+
+    def _ensure_started(self) -> None:
+        """Spawn the worker process if it is not running. Caller holds the lock."""
+        if self._proc is not None and self._proc.poll() is None:
+            return
+
+        # Make sure the child can import this package even when it is not installed
+        env = os.environ.copy()
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "screenshot_mcp.worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+        )
+        self._responses = queue.Queue()
+        self._stderr_tail = deque(maxlen=_STDERR_TAIL)
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._proc, self._responses),
+            name="capture-worker-reader",
+            daemon=True,
+        ).start()
+        self._stderr_reader = threading.Thread(
+            target=self._read_stderr,
+            args=(self._proc, self._stderr_tail),
+            name="capture-worker-stderr",
+            daemon=True,
+        )
+        self._stderr_reader.start()
+
+    @staticmethod
+    def _read_responses(proc: subprocess.Popen, responses: queue.Queue) -> None:
+        """Forward protocol lines from the worker's stdout; None marks EOF."""
+        for line in proc.stdout:
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        responses.put(None)
+
+    @staticmethod
+    def _read_stderr(proc: subprocess.Popen, tail: deque) -> None:
+        """Echo the worker's stderr to ours and keep its last lines."""
+        for line in proc.stderr:
+            sys.stderr.write(line)
+            if line.strip():
+                tail.append(line.rstrip())
+
+    def _exit_message(self) -> str:
+        """Describe a worker that exited without responding, from its stderr."""
+        # Let the reader drain the rest of the dead worker's stderr
+        if self._stderr_reader is not None:
+            self._stderr_reader.join(timeout=1)
+        if not self._stderr_tail:
+            return "Capture worker exited unexpectedly."
+        return f"Capture worker exited unexpectedly: {self._stderr_tail[-1]}"
+
+    def _kill(self) -> None:
+        """Kill the worker process. Caller holds the lock."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,16 @@
+import threading
+
+import pytest
+
+from screenshot_mcp import catalog, config
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    """Keep each test's config, catalog and screenshots out of the real config directory."""
+    monkeypatch.setattr(config, "_config_dir", tmp_path)
+    monkeypatch.setattr(catalog, "_local", threading.local())
+    monkeypatch.setattr(catalog, "_schema_ready", False)
+    config._invalidate_config_cache()
+    yield tmp_path
+    config._invalidate_config_cache()
@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from screenshot_mcp import capture  # noqa: E402
+from screenshot_mcp.synthetic import SyntheticBackend  # noqa: E402
+
+
+@pytest.fixture
+def backend():
+    backend = SyntheticBackend([{"left": 0, "top": 0, "width": 800, "height": 600}], content="ui")
+    previous = capture.set_backend(backend)
+    yield backend
+    capture.set_backend(previous)
+
+
+def _recapture(tmp_path, last=None, **kwargs):
+    last = last or {}
+    return capture.recapture_region(
+        0, 0, 800, 600,
+        save_dir=str(tmp_path),
+        previous_digest=last.get("digest"),
+        previous_path=last.get("path"),
+        previous_tiles=last.get("tiles"),
+        previous_settings=last.get("settings"),
+        **kwargs,
+    )
+
+
+def _record(result):
+    return {"digest": result.digest, "path": result.path, "tiles": result.tiles, "settings": result.settings}
+
+
+def test_recapture_reuses_unchanged_file(backend, tmp_path):
+    first = _recapture(tmp_path)
+    second = _recapture(tmp_path, _record(first))
+    assert second.unchanged
+    assert second.path == first.path
+
+
+def test_recapture_with_new_settings_writes_new_file(backend, tmp_path):
+    first = _recapture(tmp_path)
+    second = _recapture(tmp_path, _record(first), fmt="jpg", downscale={"max_dimension": 100})
+    assert not second.unchanged
+    assert second.path != first.path
+    assert second.path.endswith(".jpg")
+    assert os.path.isfile(second.path)
+
+
+def test_unchanged_recapture_reports_the_saved_file_scale(backend, tmp_path):
+    first = _recapture(tmp_path, downscale={"max_dimension": 400})
+    last = dict(_record(first), scale=first.scale, original_size=first.original_size)
+    second = _recapture(
+        tmp_path, last, downscale={"max_dimension": 400},
+        previous_scale=last["scale"], previous_original_size=last["original_size"],
+    )
+    assert second.unchanged
+    assert second.scale == first.scale == 0.5
+    assert second.original_size == {"width": 800, "height": 600}
+
+
+def test_fit_to_budget_rejects_unknown_resample_filter():
+    from PIL import Image
+    with pytest.raises(ValueError, match="resample filter"):
+        capture.fit_to_budget(Image.new("RGB", (100, 100)), {"max_dimension": 10, "resample": "garbage"})
+
+
+def test_tile_digests_change_only_where_pixels_change():
+    width, height = 130, 70
+    raw = bytearray(width * height * 4)
+    before = capture.tile_digests(capture.RawFrame(bytes(raw), width, height))
+    raw[(65 * width + 100) * 4] = 255
+    frame = capture.RawFrame(bytes(raw), width, height)
+    after = capture.tile_digests(frame)
+
+    assert len(after) == 3 * 2
+    assert [i for i, (a, b) in enumerate(zip(before, after)) if a != b] == [4]
+    assert capture.changed_tiles_bbox(before, after, width, height) == (64, 64, 128, 70)
+    assert capture.frame_digest(frame) != capture.frame_digest(capture.RawFrame(bytes(width * height * 4), width, height))
+
+
+class _PaintedBackend(capture.CaptureBackend):
+    """A black 200x100 screen whose pixels the test paints directly."""
+
+    def __init__(self):
+        self.raw = bytearray(200 * 100 * 4)
+
+    @property
+    def monitors(self) -> list:
+        return [{"left": 0, "top": 0, "width": 200, "height": 100}] * 2
+
+    def _grab(self, monitor: dict):
+        return capture.RawFrame(bytes(self.raw), 200, 100)
+
+    def paint_columns(self, left: int, right: int):
+        for y in range(100):
+            self.raw[(y * 200 + left) * 4:(y * 200 + right) * 4] = b"\xff" * ((right - left) * 4)
+
+
+def test_watcher_adds_up_gradual_changes():
+    backend = _PaintedBackend()
+    previous = capture.set_backend(backend)
+    try:
+        watcher = capture.RegionWatcher(0, 0, 200, 100, threshold=0.01)
+        assert watcher.sample().changed
+
+        # Each step changes exactly the threshold's share of the thumbnail,
+        # which on its own does not count as a change
+        steps = []
+        for column in range(0, 8, 2):
+            backend.paint_columns(column, column + 2)
+            steps.append(watcher.sample().changed)
+    finally:
+        capture.set_backend(previous)
+
+    assert steps == [False, True, False, True]
@@ -0,0 +1,30 @@
+import pytest
+
+from screenshot_mcp import config
+
+
+def test_update_config_rejects_unknown_resample_filter():
+    with pytest.raises(ValueError, match="resample"):
+        config.update_config("downscale.resample", "garbage")
+    assert config.load_config()["downscale"]["resample"] == "bilinear"
+
+
+def test_update_config_accepts_known_resample_filter():
+    assert config.update_config("downscale.resample", "lanczos")["downscale"]["resample"] == "lanczos"
+
+
+@pytest.mark.parametrize("key, value", [
+    ("downscale.max_dimension", -1),
+    ("downscale.max_megapixels", "many"),
+    ("encoder.quality", 0),
+    ("overlay_opacity", 2),
+    ("watch.threshold", True),
+])
+def test_update_config_rejects_out_of_range_numbers(key, value):
+    with pytest.raises(ValueError, match="Invalid value"):
+        config.update_config(key, value)
+
+
+def test_update_config_allows_clearing_encoder_overrides():
+    config.update_config("encoder.quality", 90)
+    assert config.update_config("encoder.quality", None)["encoder"]["quality"] is None
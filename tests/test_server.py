@@ -0,0 +1,109 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("pydantic")
+
+from screenshot_mcp import config, server  # noqa: E402
+
+
+def test_server_registers_all_tools():
+    tools = {tool.name for tool in asyncio.run(server.mcp.list_tools())}
+    assert {
+        "screenshot_capture_region",
+        "screenshot_capture_fullscreen",
+        "screenshot_capture_coordinates",
+        "screenshot_get_config",
+    } <= tools
+
+
+def test_get_config_answers_while_a_capture_is_pending(tmp_path, monkeypatch):
+    Image = pytest.importorskip("PIL.Image")
+
+    config.update_config("copy_path_to_clipboard", False)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_capture():
+        started.set()
+        release.wait(10)
+        return Image.new("RGB", (320, 200))
+
+    monkeypatch.setattr(server, "capture_full_screen", slow_capture)
+
+    async def scenario():
+        pending = asyncio.create_task(
+            server.screenshot_capture_fullscreen(server.CaptureFullScreenInput(save_directory=str(tmp_path)))
+        )
+        try:
+            await asyncio.wait_for(asyncio.to_thread(started.wait, 10), 10)
+            response = await asyncio.wait_for(server.screenshot_get_config(), 1)
+            assert not pending.done()
+        finally:
+            release.set()
+        return response, await pending
+
+    response, captured = asyncio.run(scenario())
+    assert json.loads(response)["status"] == "ok"
+    assert json.loads(captured)["status"] == "ok"
+
+
+@pytest.fixture
+def synthetic_screen():
+    pytest.importorskip("PIL")
+    from screenshot_mcp import capture
+    from screenshot_mcp.synthetic import SyntheticBackend
+
+    config.update_config("copy_path_to_clipboard", False)
+    previous = capture.set_backend(SyntheticBackend([{"left": 0, "top": 0, "width": 320, "height": 200}]))
+    yield
+    capture.set_backend(previous)
+
+
+def test_watch_region_applies_the_per_call_downscale(synthetic_screen, tmp_path):
+    params = server.WatchRegionInput(
+        x=0, y=0, width=320, height=200, duration_seconds=5, max_captures=1,
+        save_directory=str(tmp_path), max_dimension=160,
+    )
+    response = json.loads(asyncio.run(server.screenshot_watch_region(params)))
+    assert response["status"] == "ok"
+    [captured] = response["captures"]
+    assert captured["scale"] == 0.5
+    assert captured["original_size"] == {"width": 320, "height": 200}
+
+
+def test_wait_for_stable_applies_the_per_call_downscale(synthetic_screen, tmp_path):
+    params = server.WaitForStableInput(
+        x=0, y=0, width=320, height=200, stable_ms=50, interval_ms=20, timeout_seconds=5,
+        save_directory=str(tmp_path), max_megapixels=0.016,
+    )
+    response = json.loads(asyncio.run(server.screenshot_wait_for_stable(params)))
+    assert response["status"] == "ok"
+    assert response["scale"] == 0.5
+    assert response["original_size"] == {"width": 320, "height": 200}
+
+
+def test_capture_batch_returns_the_saved_images(synthetic_screen, tmp_path):
+    params = server.CaptureBatchInput(
+        regions=[{"x": 0, "y": 0, "width": 100, "height": 50}, {"x": 100, "y": 50, "width": 60, "height": 40}],
+        save_directory=str(tmp_path), return_image=True,
+    )
+    result, *images = asyncio.run(server.screenshot_capture_batch(params))
+    captures = json.loads(result)["captures"]
+    assert len(images) == len(captures) == 2
+    for capture, image in zip(captures, images):
+        with open(capture["path"], "rb") as f:
+            assert image.data == f.read()
+
+
+def test_wait_for_stable_returns_the_saved_image(synthetic_screen, tmp_path):
+    params = server.WaitForStableInput(
+        x=0, y=0, width=320, height=200, stable_ms=50, interval_ms=20, timeout_seconds=5,
+        save_directory=str(tmp_path), return_image=True,
+    )
+    result, image = asyncio.run(server.screenshot_wait_for_stable(params))
+    with open(json.loads(result)["path"], "rb") as f:
+        assert image.data == f.read()
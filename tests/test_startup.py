@@ -0,0 +1,14 @@
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("pydantic")
+
+from screenshot_mcp.bench import STARTUP_BUDGET_MS, bench_startup  # noqa: E402
+
+
+def test_server_import_defers_imaging_and_stays_within_budget():
+    # python -X importtime in a fresh interpreter, as `bench startup` runs it
+    result = bench_startup("screenshot_mcp.server", runs=1)
+    # None of mss, PIL, tkinter or pynput
+    assert result["deferred_loaded"] == []
+    assert result["import"]["p50_ms"] < STARTUP_BUDGET_MS